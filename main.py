@@ -3,1070 +3,6674 @@ import datetime
 import csv
 import pandas as pd
 import joblib
-import sklearn.ensemble
+import xgboost
 import numpy as np
-from nicegui import app, ui
-from functools import lru_cache
-from collections import defaultdict
+from nicegui import Client, app, background_tasks, context, run, ui
+from functools import wraps
+from collections import defaultdict, OrderedDict
 from itertools import product
 from colorsys import rgb_to_hsv
 import json
 from urllib.parse import quote, unquote
+from html import escape
 import traceback
-
-# Adding static files (teams' logos)
-app.add_static_files("./static", "static")
-
-# Global dictionary to hold team stats
-team_stats_data: defaultdict = defaultdict(list)
-headers: list[str] = list()
-
-
-# Load CSV once
-def load_team_stats(file_path: str = "./data/csv/averages.csv"):
+import os
+import io
+import sys
+import time
+import math
+import random
+import asyncio
+import pickle
+import sqlite3
+import threading
+import tracemalloc
+import warnings
+import argparse
+import httpx
+import hashlib
+import shutil
+import tempfile
+from typing import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, features
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import FileResponse
+
+# Locking files between processes (advisory locks)
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Adding static files (teams' logos, scripts and styles), served under /static
+app.add_static_files("/static", "static")
+
+# Optimized assets (resized, content-hashed logos) emitted by `build_assets`
+assets_directory: str = "./static/build"
+assets_manifest_path: str = f"{assets_directory}/manifest.json"
+
+# Rendered widths (in px) of the optimized logos, covering 1x and 2x displays
+asset_widths: tuple[int, ...] = (64, 128, 256)
+
+
+# Build the optimized static assets
+def build_assets(source: str = "./static", target: str = assets_directory) -> None:
     """
-    Load per-team statistics from a CSV file into memory for fast lookup.
+    Emit resized, content-hashed WebP / AVIF variants of the PNG assets.
 
-    This function reads a CSV file containing team statistics, stores the
-    header row in a global variable, and groups the remaining rows by team
-    in a global data structure. Each team's data is sorted by date in
-    descending order to allow efficient retrieval of the most recent
-    available statistics.
+    Every PNG in `source` is resized to each width in `asset_widths` and
+    encoded as WebP and, when the installed Pillow supports it, AVIF. Each
+    file name embeds a hash of its content, so the files can be served with
+    an immutable, long-lived cache policy. A manifest mapping every asset
+    name to its variants is written next to them.
 
     Parameters
     ----------
-    file_path : str, optional
-        Path to the CSV file containing team statistics.
-        Defaults to "./data/csv/averages.csv".
+    source : str, optional
+        Directory containing the original PNG files. Defaults to "./static".
+    target : str, optional
+        Output directory. Defaults to `assets_directory`.
 
     Returns
     -------
     None
-        This function does not return a value. It populates global
-        variables used elsewhere in the application.
+        This function does not return a value. It writes the variants and
+        `manifest.json` to `target`.
 
     Raises
     ------
-    FileNotFoundError
-        If the specified CSV file does not exist.
-    StopIteration
-        If the CSV file is empty and no header row is found.
     OSError
-        If the file cannot be opened or read.
+        If an image cannot be read or the output cannot be written.
 
     Notes
     -----
-    - This function relies on and mutates global variables (`headers`,
-      `team_stats_data`).
-    - Team statistics are stored as `(date_str, row)` tuples.
-    - Data is sorted in descending date order for fast access to recent games.
+    - Variants from previous builds that are no longer referenced are removed.
+    - Images are never upscaled.
     """
-    global headers
-    with open(file_path, mode="r", newline="") as file:
-        reader: csv.reader = csv.reader(file)
-        headers = next(reader)  # store headers
-
-        for row in reader:
-            date_str, team = row[0], row[1]
-            team_stats_data[team].append((date_str, row))
-
-    # Sort each team’s data by date descending for quick retrieval
-    for team in team_stats_data:
-        team_stats_data[team].sort(reverse=True)
-
+    os.makedirs(target, exist_ok=True)
+    formats: list[str] = ["webp"] + (["avif"] if features.check("avif") else [])
+    manifest: dict[str, dict[str, dict[str, str]]] = dict()
+
+    for file_name in sorted(os.listdir(source)):
+        if not file_name.endswith(".png"):
+            continue
+        name: str = file_name[: -len(".png")]
+        slug: str = name.lower().replace(" ", "-")
+        manifest[name] = {fmt: dict() for fmt in formats}
+
+        with Image.open(os.path.join(source, file_name)) as image:
+            image: Image.Image = image.convert("RGBA")
+            for width in asset_widths:
+                width: int = min(width, image.width)
+                height: int = round(image.height * width / image.width)
+                resized: Image.Image = image.resize((width, height), Image.LANCZOS)
+
+                for fmt in formats:
+                    buffer: io.BytesIO = io.BytesIO()
+                    resized.save(buffer, fmt.upper(), quality=80)
+                    data: bytes = buffer.getvalue()
+                    digest: str = hashlib.sha256(data).hexdigest()[:10]
+                    output: str = f"{slug}.{width}.{digest}.{fmt}"
+                    with open(os.path.join(target, output), "wb") as file:
+                        file.write(data)
+                    manifest[name][fmt][str(width)] = f"/assets/{output}"
+
+    # Drop the stale variants
+    referenced: set[str] = {
+        url.rsplit("/", 1)[1]
+        for variants in manifest.values()
+        for urls in variants.values()
+        for url in urls.values()
+    }
+    for file_name in os.listdir(target):
+        if file_name != "manifest.json" and file_name not in referenced:
+            os.remove(os.path.join(target, file_name))
+
+    with open(os.path.join(target, "manifest.json"), "w") as file:
+        json.dump(manifest, file, indent=2)
+    print(f"Built {len(referenced)} assets for {len(manifest)} images in {target}")
+
+
+# Load the assets manifest, if the assets have been built
+def load_assets_manifest() -> dict[str, dict[str, dict[str, str]]]:
+    """
+    Load the manifest written by `build_assets`.
 
-# Call once at startup
-load_team_stats()
+    Returns
+    -------
+    dict[str, dict[str, dict[str, str]]]
+        Mapping of asset name -> format -> width -> URL. Empty when the
+        assets have not been built.
+    """
+    if not os.path.exists(assets_manifest_path):
+        return dict()
+    with open(assets_manifest_path, "r") as file:
+        return json.load(file)
 
-# Loading the model
-model: sklearn.ensemble._forest.RandomForestClassifier = joblib.load(
-    "./model/deepshot.pkl"
-)
 
-# Get feature importance scores
-importance_scores: np.ndarray = model.feature_importances_
+assets_manifest: dict[str, dict[str, dict[str, str]]] = load_assets_manifest()
 
-# Sort feature indices by importance (descending order)
-sorted_indices: np.ndarray = np.argsort(importance_scores)[::-1]
+# Serving the optimized assets (content-hashed, so they never change)
+if os.path.isdir(assets_directory):
+    app.add_static_files("/assets", assets_directory, max_cache_age=31536000)
 
-# Extract feature names while ensuring uniqueness
-unique_stats: list[str] = list()
-for i in sorted_indices:
-    stat_name: str = (
-        model.feature_names_in_[i].replace("home_", "").replace("away_", "")
-    )
-    if stat_name not in unique_stats:
-        unique_stats.append(stat_name)
-    if len(unique_stats) == 15:  # Stop once we have 15 unique stats
-        break
 
-stats_tags: list[str] = unique_stats  # Top 15 most important unique stat names
+# Mark the content-hashed assets as immutable
+@app.middleware("http")
+async def immutable_assets(request: Request, call_next: Callable) -> Response:
+    """
+    Add an immutable, one year Cache-Control policy to the optimized assets.
+    """
+    response: Response = await call_next(request)
+    if request.url.path.startswith("/assets/") and response.status_code == 200:
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
 
-# Stats -> Full description dict
-stat_to_full_name_desc: dict[str, str] = {
-    "pts": "Points Per Game (PPG)",
-    "fg": "Field Goals (FG)",
-    "fga": "Field Goal Attempts (FGA)",
-    "fg_pct": "Field Goal % (FG%)",
-    "fg3": "3-Point Field Goals (3P)",
-    "fg3a": "3-Point Field Goal Attempts (3PA)",
-    "fg3_pct": "3-Point Field Goal % (3P%)",
-    "fg2": "2-Point Field Goals (2P)",
-    "fg2a": "2-Point Field Goal Attempts (2PA)",
-    "fg2_pct": "2-Point Field Goal % (2P%)",
-    "ft": "Free Throws (FT)",
-    "fta": "Free Throw Attempts (FTA)",
-    "ft_pct": "Free Throw % (FT%)",
-    "orb": "Offensive Rebounds (ORB)",
-    "drb": "Defensive Rebounds (DRB)",
-    "trb": "Total Rebounds (TRB)",
-    "ast": "Assists (AST)",
-    "stl": "Steals (STL)",
-    "blk": "Blocks (BLK)",
-    "tov": "Turnovers (TOV)",
-    "pf": "Personal Fouls (PF)",
-    "ortg": "Offensive Rating (ORtg)",
-    "drtg": "Defensive Rating (DRtg)",
-    "pace": "Pace (Possessions per 48 minutes)",
-    "ftr": "Free Throw Attempt Rate (FTr)",
-    "3ptar": "3-Point Attempt Rate (3PAr)",
-    "ts": "True Shooting % (TS%)",
-    "trb_pct": "Total Rebound % (TRB%)",
-    "ast_pct": "Assist % (AST%)",
-    "stl_pct": "Steal % (STL%)",
-    "blk_pct": "Block % (BLK%)",
-    "efg_pct": "Effective Field Goal % (eFG%)",
-    "tov_pct": "Turnover % (TOV%)",
-    "orb_pct": "Offensive Rebound % (ORB%)",
-    "ft_rate": "Free Throws Per Field Goal Attempt (FT/FGA)",
-    "ast_tov": "Assist-to-Turnover (AST/TOV)",
-    "ast_ratio": "Assist Ratio (ASTr)",
-    "elo": "ELO Rating",
-}
 
-# Teams color codes list
-team_color_codes: dict[str, list[str]] = {
-    "Atlanta Hawks": ["#e03a3e", "#c1d32f"],
-    "Boston Celtics": ["#007a33", "#ba9653", "#963821"],
-    "Brooklyn Nets": ["#000000"],
-    "Charlotte Hornets": ["#1d1160", "#00788c"],
-    "Chicago Bulls": ["#ce1141"],
-    "Cleveland Cavaliers": ["#860038", "#fdbb30"],
-    "Dallas Mavericks": ["#00538c", "#002b5e"],
-    "Denver Nuggets": ["#0e2240", "#fec524", "#8b2131", "#1d428a"],
-    "Detroit Pistons": ["#c8102e", "#1d42ba", "#002d62"],
-    "Golden State Warriors": ["#1d428a", "#ffc72c"],
-    "Houston Rockets": ["#ce1141"],
-    "Indiana Pacers": ["#002d62", "#fdbb30"],
-    "Los Angeles Clippers": ["#c8102e", "#1d428a"],
-    "Los Angeles Lakers": ["#552583", "#f9a01b"],
-    "Memphis Grizzlies": ["#5d76a9", "#12173f", "#f5b112"],
-    "Miami Heat": ["#98002e", "#f9a01b"],
-    "Milwaukee Bucks": ["#00471b", "#0077c0"],
-    "Minnesota Timberwolves": ["#0c2340", "#236192", "#78be20"],
-    "New Orleans Pelicans": ["#0c2340", "#c8102e", "#85714d"],
-    "New York Knicks": ["#006bb6", "#f58426"],
-    "Oklahoma City Thunder": ["#007ac1", "#ef3b24", "#002d62"],
-    "Orlando Magic": ["#0077c0"],
-    "Philadelphia 76ers": ["#006bb6", "#ed174c", "#002b5c"],
-    "Phoenix Suns": ["#1d1160", "#e56020", "#ffcd00", "#b95915"],
-    "Portland Trail Blazers": ["#e03a3e"],
-    "Sacramento Kings": ["#5a2d81", "#63727a"],
-    "San Antonio Spurs": ["#c4ced4", "#000000"],
-    "Toronto Raptors": ["#ce1141", "#b4975a"],
-    "Utah Jazz": ["#753bbd"],
-    "Washington Wizards": ["#002b5c", "#e31837"],
-}
+# Get the URL of the best variant of an asset
+def asset_url(name: str, width: int, fmt: str = "webp") -> str:
+    """
+    Return the URL of the smallest built variant at least `width` pixels wide.
 
+    Parameters
+    ----------
+    name : str
+        Asset name, i.e. the PNG file name without extension (e.g. a team name).
+    width : int
+        Rendered width in device pixels.
+    fmt : str, optional
+        Image format, "webp" or "avif". Defaults to "webp".
 
-# Function to get the best colors from a set of two list mapped by two team names
-def get_best_color_pair(team1: str, team2: str) -> tuple[str, str]:
+    Returns
+    -------
+    str
+        The URL of the optimized variant, or of the original PNG when the
+        assets have not been built.
     """
-    Select the most visually contrasting color pair for two teams.
+    variants: dict[str, str] = assets_manifest.get(name, dict()).get(fmt, dict())
+    if not variants:
+        return f"/static/{quote(name)}.png"
+    widths: list[int] = sorted(int(w) for w in variants)
+    return variants[str(next((w for w in widths if w >= width), widths[-1]))]
 
-    This function compares all possible color combinations between two teams
-    and returns the pair with the highest visual contrast. Contrast is
-    approximated using differences in saturation and value (brightness)
-    in HSV color space.
 
-    Team colors are retrieved from a predefined mapping of team names
-    to lists of hex color codes.
+# Show an optimized asset image
+def asset_image(name: str, css_width: int) -> ui.html:
+    """
+    Create an element showing an optimized asset.
 
     Parameters
     ----------
-    team1 : str
-        Name of the first team.
-    team2 : str
-        Name of the second team.
+    name : str
+        Asset name, i.e. the PNG file name without extension.
+    css_width : int
+        Displayed width in CSS pixels; a 2x variant is used for HiDPI screens.
 
     Returns
     -------
-    tuple[str, str]
-        A tuple containing the selected hex color codes
-        `(team1_color, team2_color)` with the highest contrast.
+    ui.html
+        The element, holding the `asset_picture` of the asset at the width of
+        the element.
+    """
+    return ui.html(asset_picture(name, css_width, "width: 100%"), sanitize=False)
 
-    Raises
-    ------
-    ValueError
-        If one or both team names are not found in the color mapping
-        or do not have associated colors.
 
-    Notes
-    -----
-    - Hex colors are converted to HSV for contrast evaluation.
-    - Contrast is defined as the sum of absolute differences in
-      saturation and value components.
-    - Hue is not considered, prioritizing brightness and intensity
-      differences for better readability.
-    - This function assumes `team_color_codes` is defined in the
-      enclosing scope.
+# Build the picture element of an optimized asset
+def asset_picture(name: str, css_width: int, style: str) -> str:
     """
+    Return the HTML `<picture>` of an asset, with AVIF then WebP sources.
 
-    # Convert the hex color code in to rgb
-    def hex_to_hsv(hex_color: str) -> tuple:
-        hex_color: str = hex_color.lstrip("#")
-        r, g, b = tuple(int(hex_color[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
-        return rgb_to_hsv(r, g, b)
-
-    # Get the mapped colors
-    colors_team1: str = team_color_codes.get(team1, [])
-    colors_team2: str = team_color_codes.get(team2, [])
+    Browsers pick the first source type they support, and fall back to the
+    WebP (or original PNG) image otherwise.
 
-    if not colors_team1 or not colors_team2:
-        raise ValueError("Invalid team names provided.")
+    Parameters
+    ----------
+    name : str
+        Asset name, i.e. the PNG file name without extension.
+    css_width : int
+        Displayed width in CSS pixels; a 2x variant is used for HiDPI screens.
+    style : str
+        Inline style of the image.
 
-    best_pair = None
-    max_contrast: int = -1
+    Returns
+    -------
+    str
+        The picture HTML. Only the built formats get a source.
+    """
+    sources: str = "".join(
+        f'<source type="image/{fmt}" srcset="{asset_srcset(name, css_width, fmt)}">'
+        for fmt in ("avif", "webp")
+        if assets_manifest.get(name, dict()).get(fmt)
+    )
+    return (
+        f'<picture>{sources}<img src="{asset_url(name, css_width)}" '
+        f'srcset="{asset_srcset(name, css_width)}" alt="{escape(name)}" '
+        f'style="{style}"></picture>'
+    )
 
-    # Extract the contrast for each combination
-    for color1, color2 in product(colors_team1, colors_team2):
-        _, s1, v1 = hex_to_hsv(color1)
-        _, s2, v2 = hex_to_hsv(color2)
-        contrast: float = abs(v1 - v2) + abs(s1 - s2)
 
-        # If the current contrast is > than the one before, those will be the new colors
-        # and the contrast will be the threshold
-        if contrast > max_contrast:
-            max_contrast: float = contrast
-            best_pair: tuple[str, str] = (color1, color2)
+# Get the srcset of an optimized asset
+def asset_srcset(name: str, css_width: int, fmt: str = "webp") -> str:
+    """
+    Return the `srcset` attribute value of an asset for 1x and 2x displays.
 
-    return best_pair
+    Parameters
+    ----------
+    name : str
+        Asset name, i.e. the PNG file name without extension.
+    css_width : int
+        Displayed width in CSS pixels.
+    fmt : str, optional
+        Image format, "webp" or "avif". Defaults to "webp".
 
+    Returns
+    -------
+    str
+        The `srcset` value.
+    """
+    return ", ".join(
+        f"{asset_url(name, scale * css_width, fmt)} {scale}x" for scale in (1, 2)
+    )
 
-# Storing stats that if lower are better:
-lower_better_stats: set = {"tov", "pf", "drtg", "tov_pct", "tov_to_poss"}
 
-# Get the next day NBA game
-year: datetime.datetime = datetime.datetime.now().strftime("%Y")
-today: datetime.datetime = f"{year}-04-12"
+# First month of the NBA seasons, as in the averaging pipeline
+season_start_month: int = 10
 
 
-# Function to retrieve and get the scheduled games for today
-def extract_games(date: str) -> list[dict[str, str | int | float]]:
+# Get the NBA season a date belongs to
+def season_key(date: str) -> int:
     """
-    Retrieve all scheduled games for a specific date.
-
-    This function reads the schedule CSV file and extracts the home and
-    away teams for all games scheduled on the given date.
+    Return the starting year of the NBA season a date belongs to.
 
     Parameters
     ----------
     date : str
-        Target date in `YYYY-MM-DD` format.
+        Date in `YYYY-MM-DD` format.
 
     Returns
     -------
-    list[dict[str, str]]
-        A list of dictionaries, each containing:
-        - "home_team": name of the home team
-        - "away_team": name of the away team
-
-        Returns an empty list if no games are scheduled for the given date.
-
-    Raises
-    ------
-    FileNotFoundError
-        If the schedule CSV file cannot be found.
-    KeyError
-        If expected columns are missing from the CSV file.
-    OSError
-        If the file cannot be opened or read.
+    int
+        The season identifier, e.g. `2025` for the 2025-26 season.
 
     Notes
     -----
-    - The schedule is read from `./data/csv/schedule.csv`.
-    - No date parsing is performed; the comparison is string-based.
+    - Seasons start in `season_start_month`.
     """
-    games: list[dict[str, str | int | float]] = list()
-    with open("./data/csv/schedule.csv", "r", newline="") as file:
-        reader: csv.DictReader = csv.DictReader(file)
-        for row in reader:
-            if row["date"] == date:
-                games.append(
-                    {"home_team": row["home_team"], "away_team": row["away_team"]}
-                )
-    return games
+    year, month = int(date[:4]), int(date[5:7])
+    return year if month >= season_start_month else year - 1
 
 
-@lru_cache(maxsize=128)
-def find_most_recent_stats(
-    team_name: str, target_date: str
-) -> tuple[list[str], list[str]]:
+# Check a date received in a URL
+def is_valid_date(date: str) -> bool:
     """
-    Retrieve the most recent available statistics for a team before a given date.
+    Return whether a string is a date in `YYYY-MM-DD` format.
+    """
+    try:
+        return datetime.date.fromisoformat(date).isoformat() == date
+    except ValueError:
+        return False
 
-    This function searches cached, in-memory team statistics and returns the
-    latest statistics entry that occurred strictly before the specified
-    target date. Results are memoized using an LRU cache to speed up repeated
-    lookups for the same team and date.
+
+# Get the NBA seasons of many dates at once
+def season_keys(dates: pd.Series | np.ndarray) -> np.ndarray:
+    """
+    Vectorized `season_key`.
 
     Parameters
     ----------
-    team_name : str
-        Name of the team whose statistics are requested.
-    target_date : str
-        Cutoff date in `YYYY-MM-DD` format. Only statistics recorded
-        before this date are considered.
+    dates : pandas.Series | numpy.ndarray
+        Dates in `YYYY-MM-DD` format.
 
     Returns
     -------
-    tuple[list[str], list[str]]
-        A tuple containing:
-        - A list of statistic column names
-        - A list of corresponding statistic values
+    numpy.ndarray
+        The season identifier of each date.
+    """
+    dates = pd.Series(dates, dtype=str)
+    years: np.ndarray = dates.str[:4].astype(int).to_numpy()
+    months: np.ndarray = dates.str[5:7].astype(int).to_numpy()
+    return years - (months < season_start_month)
 
-        Returns `(None, None)` if the team is not found or no prior
-        statistics exist for the given date.
 
-    Notes
-    -----
-    - Date comparison is performed lexicographically and assumes
-      `YYYY-MM-DD` formatting.
-    - The returned columns and values exclude the `date` and `team`
-      fields.
-    - This function relies on globally loaded data structures
-      (`team_stats_data`, `headers`).
-    - Caching improves performance when querying multiple games
-      on the same date.
-    """
-    if team_name not in team_stats_data:
-        return (None, None)
+# Season partitions: root directory, memory budget of the loaded partitions and
+# number of earlier seasons searched for a team's most recent stats
+partitions_directory: str = "./data/partitions"
+partition_budget: int = (
+    int(os.environ.get("DEEPSHOT_PARTITION_BUDGET_MB", "256")) * 1024 * 1024
+)
+season_lookback: int = 1
 
-    for date_str, row in team_stats_data[team_name]:
-        if date_str < target_date:
-            return (headers[2:], row[2:])  # Skip date and team name
 
-    return (None, None)
+# Get the size and modification time of a file
+def file_signature(path: str) -> dict[str, int] | None:
+    """
+    Return the size and modification time of a file, or None if it is missing.
+    """
+    try:
+        info: os.stat_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
 
 
-# Creating the Card UI
-class GameCard(ui.card):
-    def __init__(self, game: dict[str, str | int | float], date: str) -> None:
+# Lock shared by the processes writing the same files
+class FileLock:
+    def __init__(self, path: str) -> None:
         """
-        UI card component displaying a scheduled NBA game and its analytics.
-
-        This class renders an interactive card showing two teams facing each
-        other on a given date, including team logos, win probabilities,
-        color-coded probability bars, and an expandable section with detailed
-        statistical comparisons.
+        Exclusive advisory lock on a file, held across processes.
 
-        The card visually highlights statistical advantages using color cues
-        and allows navigation to a detailed game view.
+        The lock is reentrant within a process, so a holder may call functions
+        that take the same lock. Use `file_lock` to get the lock of a path, as
+        two locks of the same path in one process would block each other.
 
         Parameters
         ----------
-        game : dict[str, str | int | float]
-            Dictionary containing all game-related data, including:
-            - team names
-            - win probabilities
-            - per-team statistics prefixed with `home_` and `away_`
-        date : str
-            Game date in `YYYY-MM-DD` format, used for routing and display.
+        path : str
+            Path of the lock file, created if missing.
+        """
+        self.path: str = path
+        self.lock: threading.RLock = threading.RLock()
+        self.depth: int = 0
+        self.file: io.TextIOWrapper | None = None
 
-        Notes
-        -----
-        - Team colors are dynamically selected to maximize visual contrast.
-        - Win probability bars are scaled proportionally to predicted win chances.
-        - Detailed stats are shown in an expandable section with conditional
-          coloring based on relative performance.
-        - This component depends on several globally defined utilities and
-          mappings, including:
-            - `get_best_color_pair`
-            - `stats_tags`
-            - `lower_better_stats`
-            - `stat_to_full_name_desc`
-        - Designed for use with NiceGUI (`ui.card`, `ui.row`, `ui.column`, etc.).
+    def acquire(self, blocking: bool = True) -> bool:
         """
+        Take the lock, waiting for other processes unless `blocking` is False.
 
-        # Initializing the super class
-        super().__init__()
-        self.classes("m-4 p-10 rounded-2xl shadow-md border w-[650px]").style(
-            "background-color: #e3e4e6;"
-        )
+        Returns
+        -------
+        bool
+            Whether the lock was taken.
+        """
+        if not self.lock.acquire(blocking):
+            return False
+        if self.depth == 0:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            file: io.TextIOWrapper = open(self.path, "a+")
+            try:
+                if os.name == "nt":
+                    file.seek(0)
+                    msvcrt.locking(
+                        file.fileno(),
+                        msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK,
+                        1,
+                    )
+                else:
+                    fcntl.flock(
+                        file.fileno(),
+                        fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB),
+                    )
+            except OSError:
+                file.close()
+                self.lock.release()
+                if blocking:
+                    raise
+                return False
+            self.file = file
+        self.depth += 1
+        return True
+
+    def release(self) -> None:
+        """
+        Release the lock once every nested `acquire` was released.
+        """
+        self.depth -= 1
+        if self.depth == 0:
+            if os.name == "nt":
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+            self.file.close()
+            self.file = None
+        self.lock.release()
 
-        # Arranging the info
-        with self:
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
 
-            # Calculating the color for each team
-            home_color, away_color = get_best_color_pair(
-                game["home_team"], game["away_team"]
-            )
+    def __exit__(self, *exc_info) -> None:
+        self.release()
 
-            # Row for Team Logos and "VS"
-            with ui.row(align_items="center").classes(
-                "items-center justify-between w-full"
-            ):
-                ui.image(f"static/{game['home_team']}.png").classes("w-32")
-                ui.image(f"static/vs.png").classes("w-16")
-                ui.image(f"static/{game['away_team']}.png").classes("w-32")
 
-            # Row for the info / details button
-            with ui.row().classes("w-full flex justify-center items-center"):
-                with ui.column().classes("items-center"):
-                    ui.button(
-                        "Details",
-                        icon="info",
-                        on_click=lambda: ui.navigate.to(
-                            f"/{date}/{quote(json.dumps(game))}"
-                        ),
-                    ).props("unelevated rounded color=grey-2 text-color=grey-5")
+# Locks of this process, by path
+file_locks: dict[str, FileLock] = dict()
+file_locks_lock: threading.Lock = threading.Lock()
 
-            # Row for Team Names and Win Probabilities
-            with ui.row(align_items="stretch").classes("justify-between w-full"):
-                with ui.column(align_items="start"):
-                    ui.label(game["home_team"]).classes("text-left text-lg font-bold")
-                    ui.label(f"W {game['home_prob']} %").classes(
-                        f"text-left text-lg font-bold"
-                    )
 
-                with ui.column(align_items="end"):
-                    ui.label(game["away_team"]).classes("text-right text-lg font-bold")
-                    ui.label(f"W {game['away_prob']} %").classes(
-                        f"text-right text-lg font-bold"
-                    )
+# Get the lock of a path
+def file_lock(path: str) -> FileLock:
+    """
+    Return the `FileLock` of a path, shared by every caller of this process.
+    """
+    with file_locks_lock:
+        return file_locks.setdefault(os.path.abspath(path), FileLock(path))
 
-            # HTML element to create W % bars
-            with ui.element("div").classes("flex w-full h-6"):
-                ui.element("div").style(
-                    f"flex: {game['home_prob']}; background-color: {home_color}"
-                ).classes("rounded-md mr-1")
-                ui.element("div").style(
-                    f"flex: {game['away_prob']}; background-color: {away_color}"
-                ).classes("rounded-md ml-1")
 
-            # Wide & Rounded "See More" Expansion toggle
-            with ui.expansion().classes(
-                "w-full shadow-md bg-gray-100 rounded-2xl overflow-hidden mx-auto"
-            ).props("duration=550 hide-expand-icon") as expansion:
+# Split a CSV file into one file per season
+def partition_csv(source: str, target: str) -> dict:
+    """
+    Split a dated CSV file into one CSV file per season.
 
-                # Toggle the label on / off based on the expansion state
-                def toggle_label() -> None:
-                    label.set_text(
-                        "Click to hide" if expansion.value else "Click for more"
-                    )
-                    icon.set_name("expand_less" if expansion.value else "expand_more")
+    Rows are streamed, so the source file is never loaded in memory at once.
+    The partitions and a `manifest.json` describing them are written to a
+    temporary directory which then replaces `target`. Writers of the same
+    target, in any process, take turns on the `<target>.lock` file, and a
+    writer finding partitions already built from the same source reuses them.
 
-                expansion.on(
-                    "update:model-value", toggle_label
-                )  # Listen for expansion state changes
+    Parameters
+    ----------
+    source : str
+        Path to the CSV file, whose first column is a `YYYY-MM-DD` date.
+    target : str
+        Directory of the partitions.
 
-                with expansion.add_slot("header"):
-                    with ui.row().classes("w-full justify-center items-center"):
-                        label: ui.label = ui.label("Click for more").classes(
-                            "text-md font-bold text-center"
-                        )
-                        icon: ui.icon = ui.icon("expand_more").classes("text-xl")
+    Returns
+    -------
+    dict
+        The manifest: the source size and modification time, the build time,
+        the CSV header and, for each season, its number of rows and first and
+        last dates.
 
-                # Expanded Stats Section
-                with ui.row().classes("w-full"):
+    Raises
+    ------
+    FileNotFoundError
+        If the source file does not exist.
+    """
+    with file_lock(f"{target}.lock"):
+        signature: dict[str, int] | None = file_signature(source)
+        if signature is None:
+            raise FileNotFoundError(f"No such file: '{source}'")
+        try:
+            with open(os.path.join(target, "manifest.json")) as file:
+                manifest: dict = json.load(file)
+            if manifest.get("source") == signature:
+                return manifest
+        except (FileNotFoundError, ValueError):
+            pass
+
+        # Unique partial directory next to the target, so the swap is a rename
+        partial: str = tempfile.mkdtemp(
+            prefix=f".{os.path.basename(target)}.", dir=os.path.dirname(target) or "."
+        )
+        try:
+            manifest = split_csv(source, partial, signature)
+            stale: str = f"{partial}.stale"
+            if os.path.exists(target):
+                os.replace(target, stale)
+            os.replace(partial, target)
+            shutil.rmtree(stale, ignore_errors=True)
+        finally:
+            shutil.rmtree(partial, ignore_errors=True)
+        return manifest
+
+
+# Write the season files of a CSV file to a directory
+def split_csv(source: str, directory: str, signature: dict[str, int]) -> dict:
+    """
+    Stream the rows of a dated CSV file into one CSV file per season.
 
-                    # Home team stats
-                    with ui.column().classes("items-start flex-1"):
-                        for stat in stats_tags:
-                            home_val: float = float(game[f"home_{stat}"])
-                            away_val: float = float(game[f"away_{stat}"])
-                            diff: float = (
-                                abs(home_val - away_val) / max(home_val, away_val) * 100
-                            )
+    Parameters
+    ----------
+    source : str
+        Path to the CSV file, whose first column is a `YYYY-MM-DD` date.
+    directory : str
+        Existing directory where the season files and `manifest.json` are
+        written.
+    signature : dict[str, int]
+        The `file_signature` of the source, stored in the manifest.
 
-                            # Determine if the stat is "better" when lower
-                            is_lower_better: bool = stat in lower_better_stats
-
-                            if (
-                                diff >= 3
-                            ):  # Apply coloring only when the difference is at least 5%
-                                if (home_val > away_val and not is_lower_better) or (
-                                    home_val < away_val and is_lower_better
-                                ):
-                                    style: str = (
-                                        "text-green-600 font-bold"  # Home team has better stat
-                                    )
-                                else:
-                                    style: str = (
-                                        "text-red-600 font-bold"  # Home team has worse stat
-                                    )
-                            else:
-                                style: str = "text-black"
+    Returns
+    -------
+    dict
+        The manifest, as described in `partition_csv`.
+    """
+    files: dict[int, io.TextIOWrapper] = dict()
+    writers: dict[int, csv.writer] = dict()
+    seasons: dict[str, dict[str, str | int]] = dict()
+    try:
+        with open(source, mode="r", newline="") as file:
+            reader: csv.reader = csv.reader(file)
+            header: list[str] = next(reader)
+            for row in reader:
+                season: int = season_key(row[0])
+                if season not in writers:
+                    files[season] = open(
+                        os.path.join(directory, f"{season}.csv"), mode="w", newline=""
+                    )
+                    writers[season] = csv.writer(files[season])
+                    writers[season].writerow(header)
+                    seasons[str(season)] = {"rows": 0, "first": row[0], "last": row[0]}
+                writers[season].writerow(row)
+                entry: dict[str, str | int] = seasons[str(season)]
+                entry["rows"] += 1
+                entry["first"] = min(entry["first"], row[0])
+                entry["last"] = max(entry["last"], row[0])
+    finally:
+        for file in files.values():
+            file.close()
+
+    manifest: dict = {
+        "source": signature,
+        "built": time.time_ns(),
+        "header": header,
+        "seasons": dict(sorted(seasons.items())),
+    }
+    with open(os.path.join(directory, "manifest.json"), "w") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+
+# A loaded season partition
+class SeasonPartition:
+    def __init__(self, frame: pd.DataFrame) -> None:
+        """
+        One season of a table, with the indexes used by the team lookups.
 
-                            ui.label(game[f"home_{stat}"]).classes(
-                                f"text-left text-sm {style}"
-                            )
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+            The rows of the season, in file order.
 
-                    # Stat labels (Centered)
-                    with ui.column().classes("items-center flex-3.5"):
-                        for stat in stats_tags:
-                            ui.label(stat_to_full_name_desc[stat]).classes(
-                                "text-center text-sm font-bold"
-                            )
+        Notes
+        -----
+        - For per-team tables (with a `team` column), the numeric columns after
+          `date` and `team` are also kept as a float matrix, and the rows of
+          each team are indexed by ascending date.
+        - `nbytes` is the memory used by the partition, counted against the
+          `partition_budget`.
+        """
+        self.frame: pd.DataFrame = frame
+        self.dates: np.ndarray = frame["date"].to_numpy(dtype=str)
+        self.values: np.ndarray = np.empty((len(frame), 0))
+        self.teams: dict[str, np.ndarray] = dict()
+        if "team" in frame.columns:
+            self.values = (
+                frame.iloc[:, 2:].apply(pd.to_numeric, errors="coerce").to_numpy(float)
+            )
+            for team, rows in frame.groupby("team", sort=False).indices.items():
+                self.teams[team] = rows[np.argsort(self.dates[rows], kind="stable")]
+        self.nbytes: int = (
+            int(frame.memory_usage(deep=True).sum())
+            + self.dates.nbytes
+            + self.values.nbytes
+            + sum(rows.nbytes for rows in self.teams.values())
+        )
 
-                    # Away team stats
-                    with ui.column().classes("items-end flex-1"):
-                        for stat in stats_tags:
-                            home_val: float = float(game[f"home_{stat}"])
-                            away_val: float = float(game[f"away_{stat}"])
-                            diff: float = (
-                                abs(home_val - away_val) / max(home_val, away_val) * 100
-                            )
 
-                            # Determine if the stat is "better" when lower
-                            is_lower_better: bool = stat in lower_better_stats
-
-                            if diff >= 3:
-                                if (away_val > home_val and not is_lower_better) or (
-                                    away_val < home_val and is_lower_better
-                                ):
-                                    style: str = (
-                                        "text-green-600 font-bold"  # Away team has better stat
-                                    )
-                                else:
-                                    style: str = (
-                                        "text-red-600 font-bold"  # Away team has worse stat
-                                    )
-                            else:
-                                style: str = "text-black"
+# LRU of the loaded season partitions, bounded by memory
+class PartitionCache:
+    def __init__(self, budget: int = partition_budget) -> None:
+        """
+        Keep the most recently used season partitions within a memory budget.
 
-                            ui.label(game[f"away_{stat}"]).classes(
-                                f"text-right text-sm {style}"
-                            )
+        Parameters
+        ----------
+        budget : int, optional
+            Maximum memory, in bytes, of the loaded partitions. The partition
+            in use is always kept, even when it alone exceeds the budget.
+        """
+        self.budget: int = budget
+        self.entries: OrderedDict = OrderedDict()
+        self.size: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        self.stats: defaultdict = defaultdict(int)
+
+    def get(self, key: tuple, load: Callable[[], SeasonPartition]) -> SeasonPartition:
+        """
+        Return a loaded partition, loading it and evicting older ones if needed.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self.entries[key]
+
+        # Loading outside of the lock, so other seasons stay available meanwhile
+        partition: SeasonPartition = load()
+        with self.lock:
+            self.stats["loads"] += 1
+            if key not in self.entries:
+                self.entries[key] = partition
+                self.size += partition.nbytes
+            self.entries.move_to_end(key)
+            while self.size > self.budget and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted.nbytes
+                self.stats["evictions"] += 1
+            return self.entries[key]
+
+    def discard(self, key: tuple) -> None:
+        """
+        Drop a partition, e.g. after rows were appended to it.
+        """
+        with self.lock:
+            partition: SeasonPartition | None = self.entries.pop(key, None)
+            if partition is not None:
+                self.size -= partition.nbytes
 
 
-# Creating the game list UI
-class GameList:
-    def __init__(self, date: str) -> None:
+partition_cache: PartitionCache = PartitionCache()
+
+
+# A dated table partitioned by season
+class SeasonStore:
+    def __init__(self, source: str, name: str, dtype: type | None = None) -> None:
         """
-        Controller class responsible for rendering game cards for a given date.
+        Serve the rows of a dated CSV table one season at a time.
 
-        This class retrieves scheduled games for a specific date, enriches them
-        with the most recent available team statistics, runs model predictions
-        to estimate game outcomes, and renders a `GameCard` UI component for
-        each game.
+        The table is split by `partition_csv` the first time it is used, and
+        again whenever the source file changes. Seasons are then loaded on
+        demand through `partition_cache`.
 
         Parameters
         ----------
-        date : str
-            Target date in `YYYY-MM-DD` format for which games should be rendered.
+        source : str
+            Path to the CSV file, whose first column is a `YYYY-MM-DD` date.
+        name : str
+            Name of the partitions directory, inside `partitions_directory`.
+        dtype : type | None, optional
+            Type of the loaded columns, e.g. `str` to keep the values exactly
+            as written. Defaults to pandas' inference.
 
         Notes
         -----
-        - Team statistics are retrieved using cached historical data to avoid
-          data leakage.
-        - Predictions are generated using a pre-trained machine learning model.
-        - This class orchestrates data extraction, feature preparation,
-          prediction, and UI rendering.
+        - When the source file is missing, existing partitions are used as is,
+          so deployments can ship the partitions only.
+        - Rows added with `append` update the source and the partitions in
+          place, without splitting the whole table again.
+        - Partitioning and appends hold `file_lock`, so processes sharing the
+          files never write them at the same time.
         """
+        self.source: str = source
+        self.directory: str = os.path.join(partitions_directory, name)
+        self.manifest_path: str = os.path.join(self.directory, "manifest.json")
+        self.dtype: type | None = dtype
+        self.lock: threading.RLock = threading.RLock()
+        self.file_lock: FileLock = file_lock(f"{self.directory}.lock")
+        self.cached_manifest: tuple[tuple, dict] | None = None
+
+    def manifest(self) -> dict:
+        """
+        Return the partitions manifest, partitioning the source first if stale.
 
-        # Storing the date to render the cards
-        self.date: str = date
+        Raises
+        ------
+        FileNotFoundError
+            If neither the source file nor its partitions exist.
+        """
+        source: dict | None = file_signature(self.source)
+        with self.lock:
+            signature: tuple = (source, file_signature(self.manifest_path))
+            if self.cached_manifest and self.cached_manifest[0] == signature:
+                return self.cached_manifest[1]
+            try:
+                with open(self.manifest_path) as file:
+                    manifest: dict = json.load(file)
+            except FileNotFoundError:
+                if source is None:
+                    raise
+                manifest: dict = dict()
+            if source is not None and manifest.get("source") != source:
+                manifest = partition_csv(self.source, self.directory)
+            self.cached_manifest = (
+                (source, file_signature(self.manifest_path)),
+                manifest,
+            )
+            return manifest
 
-    # Render all the cards
-    def render(self) -> None:
+    def seasons(self) -> list[int]:
         """
-        Render game cards for all scheduled games on the specified date.
+        Return the available seasons, in ascending order.
+        """
+        return [int(season) for season in self.manifest()["seasons"]]
 
-        This method:
-        - Retrieves scheduled games for the given date
-        - Augments each game with the most recent team statistics
-        - Prepares features and runs model predictions
-        - Attaches win probabilities to each game
-        - Instantiates a `GameCard` UI component for each game
+    def columns(self) -> list[str]:
+        """
+        Return the columns of the table.
+        """
+        return self.manifest()["header"]
 
-        Returns
-        -------
-        None
-            This method does not return a value. It renders UI components
-            directly.
+    def partition_key(self, manifest: dict, season: int) -> tuple:
+        """
+        Return the `partition_cache` key of the current content of a season.
+        """
+        version: int = manifest["seasons"].get(str(season), dict()).get("version", 0)
+        return (self.directory, season, manifest["built"], version)
 
-        Notes
-        -----
-        - Non-numeric columns are removed before prediction.
-        - Feature values are cast to float prior to model inference.
-        - Any exceptions during rendering are silently ignored.
+    def partition(self, season: int) -> SeasonPartition | None:
         """
+        Return the partition of a season, or None if the season is not available.
+        """
+        manifest: dict = self.manifest()
+        if str(season) not in manifest["seasons"]:
+            return None
+        path: str = os.path.join(self.directory, f"{season}.csv")
+        return partition_cache.get(
+            self.partition_key(manifest, season),
+            lambda: SeasonPartition(
+                pd.read_csv(path, dtype=self.dtype, keep_default_na=self.dtype is None)
+            ),
+        )
 
-        # For each game shcedule for today date, extract the home team and away team
-        try:
-            games: list[dict[str, str | int | float]] = list()
-            for game in extract_games(self.date):
-                stat_label, stats = find_most_recent_stats(game["home_team"], self.date)
-                for i, _ in enumerate(stat_label):
-                    game[f"home_{stat_label[i]}"] = stats[i]
-                stat_label, stats = find_most_recent_stats(game["away_team"], self.date)
-                for i, _ in enumerate(stat_label):
-                    game[f"away_{stat_label[i]}"] = stats[i]
-                games.append(game)
+    def frame(self, season: int) -> pd.DataFrame:
+        """
+        Return the rows of a season, empty if the season is not available.
 
-            # Check if games is empty
-            if not games:
-                print("No games found for this date")
+        The frame is shared with the partition cache and must not be modified.
+        """
+        partition: SeasonPartition | None = self.partition(season)
+        if partition is None:
+            return pd.DataFrame(columns=self.columns())
+        return partition.frame
+
+    def team_row(self, team: str, date: str) -> tuple[SeasonPartition, int] | None:
+        """
+        Locate the row of a team on an exact date.
+
+        Returns
+        -------
+        tuple[SeasonPartition, int] | None
+            The partition and the position of the row in it, or None if the
+            team has no row on that date.
+        """
+        partition: SeasonPartition | None = self.partition(season_key(date))
+        if partition is None or team not in partition.teams:
+            return None
+        rows: np.ndarray = partition.teams[team]
+        i: int = int(np.searchsorted(partition.dates[rows], date))
+        if i == len(rows) or partition.dates[rows[i]] != date:
+            return None
+        return partition, int(rows[i])
+
+    def initialize(self, header: list[str]) -> None:
+        """
+        Create the table with the given columns if it doesn't exist yet, as a
+        source file holding only the header.
+        """
+        with self.lock, self.file_lock:
+            if os.path.exists(self.source) or os.path.exists(self.manifest_path):
                 return
+            os.makedirs(os.path.dirname(self.source) or ".", exist_ok=True)
+            with open(self.source, mode="w", newline="") as file:
+                csv.writer(file).writerow(header)
+            self.cached_manifest = None
 
-            # Convert data into DataFrame
-            df: pd.DataFrame = pd.DataFrame(games)
+    def append(self, rows: list[list[str]]) -> None:
+        """
+        Append rows to the table, updating only the seasons they belong to.
 
-            # Drop non-numeric columns (team names)
-            df: pd.DataFrame = df.drop(["home_team", "away_team"], axis=1)
+        The rows are appended to the source file, when present, and to their
+        season partitions. The manifest is updated so the source is not split
+        again, and the stale partitions are dropped from `partition_cache`.
 
-            # Drop irrelvant stats columns
-            stats_to_drop: list[str] = list()
-            for stat in stats_to_drop:
-                df: pd.DataFrame = df.drop([f"home_{stat}", f"away_{stat}"], axis=1)
+        Parameters
+        ----------
+        rows : list[list[str]]
+            Rows to append, in the column order of the table.
 
-            # Convert all values to float (they are strings in the provided data)
-            df: pd.DataFrame = df.astype(float)
+        Raises
+        ------
+        FileNotFoundError
+            If neither the source file nor its partitions exist.
+        """
+        if rows:
+            self.append_frame(pd.DataFrame(rows, columns=self.columns()))
 
-            # Make predictions
-            predictions: list[int] = model.predict(df)
+    def append_frame(self, frame: pd.DataFrame) -> None:
+        """
+        Append the rows of a data frame with the table columns, like `append`.
 
-            # Get probabilities
-            prob: list[list[float]] = model.predict_proba(df)
+        Whole frames are written at once, with the values formatted by
+        `DataFrame.to_csv` (missing values are left empty).
 
-            # Appending the new data to the games dict
-            for i, game in enumerate(games):
-                game["winner"] = (
-                    game["home_team"] if predictions[i] == 0 else game["away_team"]
+        Raises
+        ------
+        FileNotFoundError
+            If neither the source file nor its partitions exist.
+        """
+        if frame.empty:
+            return
+        with self.lock, self.file_lock:
+            manifest: dict = json.loads(json.dumps(self.manifest()))
+            frame = frame[manifest["header"]]
+            seasons: np.ndarray = season_keys(frame["date"])
+
+            for season, season_rows in frame.groupby(seasons, sort=True):
+                season = int(season)
+                stale: tuple = self.partition_key(manifest, season)
+                path: str = os.path.join(self.directory, f"{season}.csv")
+
+                # Formatted once for both files, with the line endings of `csv.writer`
+                text: str = season_rows.to_csv(
+                    header=False, index=False, lineterminator="\r\n"
                 )
-                game["home_prob"] = round(float(prob[i][0]) * 100)
-                game["away_prob"] = round(float(prob[i][1]) * 100)
+                if manifest.get("source") is not None:
+                    with open(self.source, "a", newline="") as file:
+                        file.write(text)
+                with open(path, "a", newline="") as file:
+                    if file.tell() == 0:
+                        csv.writer(file).writerow(manifest["header"])
+                    file.write(text)
+
+                season_dates: pd.Series = season_rows["date"].astype(str)
+                entry: dict = manifest["seasons"].setdefault(
+                    str(season),
+                    {
+                        "rows": 0,
+                        "first": season_dates.min(),
+                        "last": season_dates.max(),
+                    },
+                )
+                entry["rows"] += len(season_rows)
+                entry["first"] = min(entry["first"], season_dates.min())
+                entry["last"] = max(entry["last"], season_dates.max())
+                entry["version"] = entry.get("version", 0) + 1
+                partition_cache.discard(stale)
+
+            # Writing the new manifest atomically
+            manifest["seasons"] = dict(sorted(manifest["seasons"].items()))
+            if manifest.get("source") is not None:
+                manifest["source"] = file_signature(self.source)
+            with open(f"{self.manifest_path}.partial", "w") as file:
+                json.dump(manifest, file, indent=2)
+            os.replace(f"{self.manifest_path}.partial", self.manifest_path)
+            self.cached_manifest = None
+
+    def recent_rows(
+        self, team: str, date: str, count: int
+    ) -> list[tuple[SeasonPartition, np.ndarray]]:
+        """
+        Locate the most recent rows of a team strictly before a date.
 
-            # After clearing the container, rendering the game cards
-            for game in games:
-                GameCard(game, self.date)
+        Parameters
+        ----------
+        team : str
+            Name of the team.
+        date : str
+            Cutoff date in `YYYY-MM-DD` format.
+        count : int
+            Maximum number of rows.
 
-        except FileNotFoundError as e:
-            print(f"Error: Could not find required files - {e}")
-        except KeyError as e:
-            print(f"Error: Missing expected data field - {e}")
-        except ValueError as e:
-            print(f"Error: Invalid data format - {e}")
-        except Exception as e:
-            print(f"Unexpected error during prediction: {e}")
-            traceback.print_exc()
+        Returns
+        -------
+        list[tuple[SeasonPartition, np.ndarray]]
+            Partitions and the positions of the team rows in each, most
+            recent first. The season of `date` and up to `season_lookback`
+            earlier seasons are searched.
+        """
+        found: list[tuple[SeasonPartition, np.ndarray]] = list()
+        latest: int = season_key(date)
+        for season in range(latest, latest - season_lookback - 1, -1):
+            partition: SeasonPartition | None = self.partition(season)
+            if partition is None or team not in partition.teams:
+                continue
+            rows: np.ndarray = partition.teams[team]
+            rows = rows[: np.searchsorted(partition.dates[rows], date)][::-1][:count]
+            if len(rows):
+                found.append((partition, rows))
+                count -= len(rows)
+            if count <= 0:
+                break
+        return found
+
+
+# Stats, schedule, results and raw game logs stores (stats are kept as written)
+stats_store: SeasonStore = SeasonStore("./data/csv/averages.csv", "averages", str)
+schedule_store: SeasonStore = SeasonStore("./data/csv/schedule.csv", "schedule")
+results_store: SeasonStore = SeasonStore("./data/csv/results.csv", "results")
+gamelogs_store: SeasonStore = SeasonStore("./data/csv/gamelogs.csv", "gamelogs", str)
+season_stores: list[SeasonStore] = [
+    stats_store,
+    schedule_store,
+    results_store,
+    gamelogs_store,
+]
+
+
+# Archive imports: rows parsed at once, readable files and text columns (the
+# other columns are parsed as numbers)
+archive_chunk_rows: int = 50_000
+archive_suffixes: tuple[str, ...] = (
+    ".csv",
+    ".csv.gz",
+    ".csv.bz2",
+    ".csv.xz",
+    ".csv.zst",
+    ".csv.zstd",
+    ".parquet",
+)
+text_columns: tuple[str, ...] = ("date", "team", "home_team", "away_team")
 
 
-# Redirect to page
-@ui.page("/")
-def redirect() -> None:
+# List the readable files of some archive paths
+def archive_files(paths: list[str]) -> list[str]:
     """
-    Redirect the root page to the current day's games view.
+    Expand directories into the archive files they contain, in name order.
+    """
+    files: list[str] = list()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in sorted(os.walk(path)):
+                files += [
+                    os.path.join(root, name)
+                    for name in sorted(names)
+                    if name.endswith(archive_suffixes)
+                ]
+        else:
+            files.append(path)
+    return files
+
+
+# Stream the rows of an archive file
+def read_archive(
+    path: str, columns: list[str] | None, chunk_rows: int = archive_chunk_rows
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV (optionally gzip, bzip2, xz or zstd compressed) or Parquet file
+    in chunks.
 
-    This page handler automatically navigates users from the application
-    root URL to the page corresponding to today's date.
+    Each chunk is parsed by the vectorized pandas or pyarrow readers into
+    typed columns: text for `text_columns`, numbers for the others. Only one
+    chunk is held in memory at a time.
 
-    Returns
-    -------
-    None
-        This function does not return a value. It performs a client-side
-        navigation using NiceGUI.
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    columns : list[str] | None
+        Columns to read, or None for all of them.
+    chunk_rows : int, optional
+        Number of rows of each chunk.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The chunks, with dates formatted as `YYYY-MM-DD`.
+
+    Raises
+    ------
+    ImportError
+        If the optional reader of the format is missing (`zstandard` for
+        zstd, `pyarrow` for Parquet).
+    ValueError
+        If some of the columns are missing from the file.
     """
-    ui.navigate.to(today)
+    if path.endswith(".parquet"):
+        import pyarrow.parquet
+
+        chunks: Iterator = (
+            batch.to_pandas()
+            for batch in pyarrow.parquet.ParquetFile(path).iter_batches(
+                batch_size=chunk_rows, columns=columns
+            )
+        )
+    else:
+        chunks = pd.read_csv(
+            path,
+            chunksize=chunk_rows,
+            usecols=columns,
+            dtype={column: str for column in text_columns},
+            compression="zstd" if path.endswith((".zst", ".zstd")) else "infer",
+        )
+    for chunk in chunks:
+        if not pd.api.types.is_string_dtype(chunk["date"]):
+            chunk["date"] = pd.to_datetime(chunk["date"]).dt.strftime("%Y-%m-%d")
+        yield chunk
 
 
-# Home day prediction and stats page template
-@ui.page("/{date}")
-def home(date: str) -> None:
+# Keep the rows of a chunk that are not stored yet
+def unseen_rows(store: SeasonStore, chunk: pd.DataFrame) -> pd.DataFrame:
     """
-    Render the main home page for a specific date with game predictions and statistics.
+    Drop the rows of a chunk whose date and teams are already in a store.
+    """
+    keys: list[str] = [column for column in text_columns if column in chunk.columns]
+    chunk = chunk.drop_duplicates(keys)
+    seasons: np.ndarray = season_keys(chunk["date"])
+    unseen: np.ndarray = np.ones(len(chunk), dtype=bool)
+    for season in np.unique(seasons):
+        partition: SeasonPartition | None = store.partition(int(season))
+        if partition is None:
+            continue
+        rows: np.ndarray = seasons == season
+        stored: pd.MultiIndex = pd.MultiIndex.from_frame(
+            partition.frame[keys].astype(str)
+        )
+        unseen[rows] = ~pd.MultiIndex.from_frame(chunk.loc[rows, keys]).isin(stored)
+    return chunk[unseen]
 
-    This page displays a split layout with:
-    - A left sidebar containing the app logo, a date picker, and a donation link.
-    - A right main container showing all scheduled games for the selected date,
-      with interactive `GameCard` components and predicted outcomes.
 
-    Users can select a different date using the date picker and update predictions
-    by clicking the "Predict" button.
+# Import archive files into a store
+def import_archive(
+    paths: list[str],
+    store: SeasonStore = stats_store,
+    chunk_rows: int = archive_chunk_rows,
+) -> dict[str, int]:
+    """
+    Stream archive files into a store, chunk by chunk, and report the speed.
+
+    Rows already stored (same date and teams) are skipped, so an interrupted
+    import can simply be run again. Files that can't be read are reported
+    and skipped.
 
     Parameters
     ----------
-    date : str
+    paths : list[str]
+        Archive files, or directories of archive files.
+    store : SeasonStore, optional
+        Table to import into. Defaults to the stats. When it doesn't exist
+        yet, it is created with the columns of the first file.
+    chunk_rows : int, optional
+        Number of rows parsed and appended at once, which bounds the memory
+        used besides the loaded partitions.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of rows read and of new rows stored.
+    """
+    counts: dict[str, int] = {"rows": 0, "stored": 0}
+    started: float = time.perf_counter()
+    for path in archive_files(paths):
+        file_started: float = time.perf_counter()
+        rows: int = 0
+        stored: int = 0
+        try:
+            columns: list[str] | None = store.columns()
+        except FileNotFoundError:
+            columns = None
+        try:
+            for chunk in read_archive(path, columns, chunk_rows):
+                if columns is None:
+                    store.initialize(list(chunk.columns))
+                    columns = store.columns()
+                fresh: pd.DataFrame = unseen_rows(store, chunk[columns])
+                store.append_frame(fresh)
+                rows += len(chunk)
+                stored += len(fresh)
+        except ImportError as e:
+            print(f"Error: Missing optional dependency to read {path} - {e}")
+        except (ValueError, KeyError, OSError) as e:
+            print(f"Error: Could not import {path} - {e}")
+        elapsed: float = time.perf_counter() - file_started
+        print(
+            f"{path}: {stored:,} new rows out of {rows:,} "
+            f"({rows / max(elapsed, 1e-9):,.0f} rows/s)"
+        )
+        counts["rows"] += rows
+        counts["stored"] += stored
+
+    # Running servers see the new data version and refresh their caches
+    elapsed = time.perf_counter() - started
+    print(
+        f"Imported {counts['stored']:,} new rows out of {counts['rows']:,} in "
+        f"{elapsed:.1f}s ({counts['rows'] / max(elapsed, 1e-9):,.0f} rows/s)"
+    )
+    return counts
+
+
+# Get the range of dates that can be browsed
+def picker_bounds() -> tuple[str, str]:
+    """
+    Return the first and last scheduled dates of the seasons with stats.
+
+    Returns
+    -------
+    tuple[str, str]
+        The first and last selectable dates, in `YYYY-MM-DD` format.
+
+    Notes
+    -----
+    - Only the partition manifests are read, no season is loaded.
+    - When the stats are not available, every scheduled season is used.
+    """
+    schedule: dict[str, dict] = schedule_store.manifest()["seasons"]
+    try:
+        with_stats: set[str] = set(stats_store.manifest()["seasons"])
+    except FileNotFoundError:
+        with_stats: set[str] = set(schedule)
+    seasons: list[str] = [s for s in schedule if s in with_stats] or list(schedule)
+    return schedule[seasons[0]]["first"], schedule[seasons[-1]]["last"]
+
+
+# Get the date shown by default
+def default_date() -> str:
+    """
+    Return today's date, clamped to the range of dates that can be browsed.
+    """
+    start, end = picker_bounds()
+    return min(max(datetime.date.today().isoformat(), start), end)
+
+
+# Loading the model
+model: xgboost.XGBClassifier = joblib.load("./model/deepshot.pkl")
+
+# Fingerprint of the loaded model, recorded with the predictions it serves
+with open("./model/deepshot.pkl", "rb") as model_file:
+    model_version: str = hashlib.sha1(model_file.read()).hexdigest()[:12]
+
+# Get feature importance scores
+importance_scores: np.ndarray = model.feature_importances_
+
+# Sort feature indices by importance (descending order)
+sorted_indices: np.ndarray = np.argsort(importance_scores)[::-1]
+
+# Extract feature names while ensuring uniqueness
+unique_stats: list[str] = list()
+for i in sorted_indices:
+    stat_name: str = (
+        model.feature_names_in_[i].replace("home_", "").replace("away_", "")
+    )
+    if stat_name not in unique_stats:
+        unique_stats.append(stat_name)
+    if len(unique_stats) == 15:  # Stop once we have 15 unique stats
+        break
+
+stats_tags: list[str] = unique_stats  # Top 15 most important unique stat names
+
+# Stats -> Full description dict
+stat_to_full_name_desc: dict[str, str] = {
+    "pts": "Points Per Game (PPG)",
+    "fg": "Field Goals (FG)",
+    "fga": "Field Goal Attempts (FGA)",
+    "fg_pct": "Field Goal % (FG%)",
+    "fg3": "3-Point Field Goals (3P)",
+    "fg3a": "3-Point Field Goal Attempts (3PA)",
+    "fg3_pct": "3-Point Field Goal % (3P%)",
+    "fg2": "2-Point Field Goals (2P)",
+    "fg2a": "2-Point Field Goal Attempts (2PA)",
+    "fg2_pct": "2-Point Field Goal % (2P%)",
+    "ft": "Free Throws (FT)",
+    "fta": "Free Throw Attempts (FTA)",
+    "ft_pct": "Free Throw % (FT%)",
+    "orb": "Offensive Rebounds (ORB)",
+    "drb": "Defensive Rebounds (DRB)",
+    "trb": "Total Rebounds (TRB)",
+    "ast": "Assists (AST)",
+    "stl": "Steals (STL)",
+    "blk": "Blocks (BLK)",
+    "tov": "Turnovers (TOV)",
+    "pf": "Personal Fouls (PF)",
+    "ortg": "Offensive Rating (ORtg)",
+    "drtg": "Defensive Rating (DRtg)",
+    "pace": "Pace (Possessions per 48 minutes)",
+    "ftr": "Free Throw Attempt Rate (FTr)",
+    "3ptar": "3-Point Attempt Rate (3PAr)",
+    "ts": "True Shooting % (TS%)",
+    "trb_pct": "Total Rebound % (TRB%)",
+    "ast_pct": "Assist % (AST%)",
+    "stl_pct": "Steal % (STL%)",
+    "blk_pct": "Block % (BLK%)",
+    "efg_pct": "Effective Field Goal % (eFG%)",
+    "tov_pct": "Turnover % (TOV%)",
+    "orb_pct": "Offensive Rebound % (ORB%)",
+    "ft_rate": "Free Throws Per Field Goal Attempt (FT/FGA)",
+    "ast_tov": "Assist-to-Turnover (AST/TOV)",
+    "ast_ratio": "Assist Ratio (ASTr)",
+    "elo": "ELO Rating",
+}
+
+# Teams color codes list
+team_color_codes: dict[str, list[str]] = {
+    "Atlanta Hawks": ["#e03a3e", "#c1d32f"],
+    "Boston Celtics": ["#007a33", "#ba9653", "#963821"],
+    "Brooklyn Nets": ["#000000"],
+    "Charlotte Hornets": ["#1d1160", "#00788c"],
+    "Chicago Bulls": ["#ce1141"],
+    "Cleveland Cavaliers": ["#860038", "#fdbb30"],
+    "Dallas Mavericks": ["#00538c", "#002b5e"],
+    "Denver Nuggets": ["#0e2240", "#fec524", "#8b2131", "#1d428a"],
+    "Detroit Pistons": ["#c8102e", "#1d42ba", "#002d62"],
+    "Golden State Warriors": ["#1d428a", "#ffc72c"],
+    "Houston Rockets": ["#ce1141"],
+    "Indiana Pacers": ["#002d62", "#fdbb30"],
+    "Los Angeles Clippers": ["#c8102e", "#1d428a"],
+    "Los Angeles Lakers": ["#552583", "#f9a01b"],
+    "Memphis Grizzlies": ["#5d76a9", "#12173f", "#f5b112"],
+    "Miami Heat": ["#98002e", "#f9a01b"],
+    "Milwaukee Bucks": ["#00471b", "#0077c0"],
+    "Minnesota Timberwolves": ["#0c2340", "#236192", "#78be20"],
+    "New Orleans Pelicans": ["#0c2340", "#c8102e", "#85714d"],
+    "New York Knicks": ["#006bb6", "#f58426"],
+    "Oklahoma City Thunder": ["#007ac1", "#ef3b24", "#002d62"],
+    "Orlando Magic": ["#0077c0"],
+    "Philadelphia 76ers": ["#006bb6", "#ed174c", "#002b5c"],
+    "Phoenix Suns": ["#1d1160", "#e56020", "#ffcd00", "#b95915"],
+    "Portland Trail Blazers": ["#e03a3e"],
+    "Sacramento Kings": ["#5a2d81", "#63727a"],
+    "San Antonio Spurs": ["#c4ced4", "#000000"],
+    "Toronto Raptors": ["#ce1141", "#b4975a"],
+    "Utah Jazz": ["#753bbd"],
+    "Washington Wizards": ["#002b5c", "#e31837"],
+}
+
+# Teams conference membership (used for standings, seeding and playoff odds)
+team_conferences: dict[str, str] = {
+    "Atlanta Hawks": "East",
+    "Boston Celtics": "East",
+    "Brooklyn Nets": "East",
+    "Charlotte Hornets": "East",
+    "Chicago Bulls": "East",
+    "Cleveland Cavaliers": "East",
+    "Dallas Mavericks": "West",
+    "Denver Nuggets": "West",
+    "Detroit Pistons": "East",
+    "Golden State Warriors": "West",
+    "Houston Rockets": "West",
+    "Indiana Pacers": "East",
+    "Los Angeles Clippers": "West",
+    "Los Angeles Lakers": "West",
+    "Memphis Grizzlies": "West",
+    "Miami Heat": "East",
+    "Milwaukee Bucks": "East",
+    "Minnesota Timberwolves": "West",
+    "New Orleans Pelicans": "West",
+    "New York Knicks": "East",
+    "Oklahoma City Thunder": "West",
+    "Orlando Magic": "East",
+    "Philadelphia 76ers": "East",
+    "Phoenix Suns": "West",
+    "Portland Trail Blazers": "West",
+    "Sacramento Kings": "West",
+    "San Antonio Spurs": "West",
+    "Toronto Raptors": "East",
+    "Utah Jazz": "West",
+    "Washington Wizards": "East",
+}
+
+# Sorted list of the current franchises, used as the row / column order of every matrix
+teams: list[str] = sorted(team_color_codes)
+
+
+# Function to get the best colors from a set of two list mapped by two team names
+def get_best_color_pair(team1: str, team2: str) -> tuple[str, str]:
+    """
+    Select the most visually contrasting color pair for two teams.
+
+    This function compares all possible color combinations between two teams
+    and returns the pair with the highest visual contrast. Contrast is
+    approximated using differences in saturation and value (brightness)
+    in HSV color space.
+
+    Team colors are retrieved from a predefined mapping of team names
+    to lists of hex color codes.
+
+    Parameters
+    ----------
+    team1 : str
+        Name of the first team.
+    team2 : str
+        Name of the second team.
+
+    Returns
+    -------
+    tuple[str, str]
+        A tuple containing the selected hex color codes
+        `(team1_color, team2_color)` with the highest contrast.
+
+    Raises
+    ------
+    ValueError
+        If one or both team names are not found in the color mapping
+        or do not have associated colors.
+
+    Notes
+    -----
+    - Hex colors are converted to HSV for contrast evaluation.
+    - Contrast is defined as the sum of absolute differences in
+      saturation and value components.
+    - Hue is not considered, prioritizing brightness and intensity
+      differences for better readability.
+    - This function assumes `team_color_codes` is defined in the
+      enclosing scope.
+    """
+
+    # Convert the hex color code in to rgb
+    def hex_to_hsv(hex_color: str) -> tuple:
+        hex_color: str = hex_color.lstrip("#")
+        r, g, b = tuple(int(hex_color[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
+        return rgb_to_hsv(r, g, b)
+
+    # Get the mapped colors
+    colors_team1: str = team_color_codes.get(team1, [])
+    colors_team2: str = team_color_codes.get(team2, [])
+
+    if not colors_team1 or not colors_team2:
+        raise ValueError("Invalid team names provided.")
+
+    best_pair = None
+    max_contrast: int = -1
+
+    # Extract the contrast for each combination
+    for color1, color2 in product(colors_team1, colors_team2):
+        _, s1, v1 = hex_to_hsv(color1)
+        _, s2, v2 = hex_to_hsv(color2)
+        contrast: float = abs(v1 - v2) + abs(s1 - s2)
+
+        # If the current contrast is > than the one before, those will be the new colors
+        # and the contrast will be the threshold
+        if contrast > max_contrast:
+            max_contrast: float = contrast
+            best_pair: tuple[str, str] = (color1, color2)
+
+    return best_pair
+
+
+# Storing stats that if lower are better:
+lower_better_stats: set = {"tov", "pf", "drtg", "tov_pct", "tov_to_poss"}
+
+
+# Choose the highlight of a team stat compared to the opponent
+def stat_highlight(value: float, other: float, stat: str) -> str:
+    """
+    Return the Tailwind classes highlighting a stat against the opponent's.
+
+    Parameters
+    ----------
+    value : float
+        The team's value of the stat.
+    other : float
+        The opponent's value of the stat.
+    stat : str
+        The stat name, used to know whether lower values are better.
+
+    Returns
+    -------
+    str
+        Green when the team is better, red when it is worse, and black when
+        the relative difference is below 3%.
+    """
+    diff: float = abs(value - other) / max(value, other) * 100
+
+    # Determine if the stat is "better" when lower
+    is_lower_better: bool = stat in lower_better_stats
+
+    if diff < 3:  # Apply coloring only when the difference is at least 3%
+        return "text-black"
+    if (value > other and not is_lower_better) or (value < other and is_lower_better):
+        return "text-green-600 font-bold"  # Team has better stat
+    return "text-red-600 font-bold"  # Team has worse stat
+
+
+# Function to retrieve and get the scheduled games for today
+def extract_games(date: str) -> list[dict[str, str | int | float]]:
+    """
+    Retrieve all scheduled games for a specific date.
+
+    This function reads the schedule partition of the date's season and
+    extracts the home and away teams for all games scheduled on the given date.
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    list[dict[str, str]]
+        A list of dictionaries, each containing:
+        - "home_team": name of the home team
+        - "away_team": name of the away team
+
+        Returns an empty list if no games are scheduled for the given date.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the schedule CSV file cannot be found.
+    KeyError
+        If expected columns are missing from the CSV file.
+    OSError
+        If the file cannot be opened or read.
+
+    Notes
+    -----
+    - The schedule is read from `schedule_store`, loading only one season.
+    - No date parsing is performed; the comparison is string-based.
+    """
+    schedule: pd.DataFrame = schedule_store.frame(season_key(date))
+    schedule = schedule[schedule["date"] == date]
+    return [
+        {"home_team": home_team, "away_team": away_team}
+        for home_team, away_team in zip(schedule["home_team"], schedule["away_team"])
+    ]
+
+
+def find_most_recent_stats(
+    team_name: str, target_date: str
+) -> tuple[list[str], list[str]]:
+    """
+    Retrieve the most recent available statistics for a team before a given date.
+
+    This function searches the season partitioned team statistics and returns the
+    latest statistics entry that occurred strictly before the specified
+    target date.
+
+    Parameters
+    ----------
+    team_name : str
+        Name of the team whose statistics are requested.
+    target_date : str
+        Cutoff date in `YYYY-MM-DD` format. Only statistics recorded
+        before this date are considered.
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        A tuple containing:
+        - A list of statistic column names
+        - A list of corresponding statistic values
+
+        Returns `(None, None)` if the team is not found or no prior
+        statistics exist for the given date.
+
+    Notes
+    -----
+    - Date comparison is performed lexicographically and assumes
+      `YYYY-MM-DD` formatting.
+    - The returned columns and values exclude the `date` and `team`
+      fields.
+    - This function relies on the globally defined `stats_store`, which loads
+      the season of the target date and the previous one on demand.
+    - Nothing is memoized here: the loaded partitions are cached by
+      `partition_cache` under their manifest version, so a lookup always
+      sees the rows stored up to now, and the results derived from it are
+      cached under the data version by `cached`.
+    """
+    found: list[tuple[SeasonPartition, np.ndarray]] = stats_store.recent_rows(
+        team_name, target_date, 1
+    )
+    if not found:
+        return (None, None)
+
+    partition, rows = found[0]
+    return (stats_store.columns()[2:], partition.frame.iloc[rows[0], 2:].tolist())
+
+
+# Files whose content defines the served predictions: the model and the stats,
+# schedule and results (their source CSV, or the partitions manifest when the
+# store has no source file)
+versioned_files: list[str] = ["./model/deepshot.pkl"]
+versioned_stores: list[SeasonStore] = [stats_store, schedule_store, results_store]
+
+
+# Function to fingerprint the current data and model files
+def data_version() -> str:
+    """
+    Compute a short fingerprint of the data and model files in use.
+
+    The fingerprint is derived from the size and modification time of every
+    file in `versioned_files` and of the data of every store in
+    `versioned_stores`, so it changes whenever the stats, schedule, results or
+    model are refreshed on disk. It is used as part of every cache key so
+    stale results are never served after a data or model update.
+
+    Returns
+    -------
+    str
+        A 12 characters hexadecimal fingerprint.
+
+    Notes
+    -----
+    - Missing files are part of the fingerprint too, so creating one later
+      also produces a new version.
+    - Manifests derived from an existing source file are left out, so
+      partitioning a source lazily keeps the version unchanged.
+    - Only file metadata is read, making this cheap enough to call per request.
+    """
+    digest = hashlib.sha1()
+    stores: list[str] = [
+        store.source if os.path.exists(store.source) else store.manifest_path
+        for store in versioned_stores
+    ]
+    for path in versioned_files + stores:
+        try:
+            info: os.stat_result = os.stat(path)
+            digest.update(f"{path}:{info.st_size}:{info.st_mtime_ns};".encode())
+        except FileNotFoundError:
+            digest.update(f"{path}:missing;".encode())
+    return digest.hexdigest()[:12]
+
+
+# Cache configuration: in-process tier size (enough for the attributions of a
+# whole season), default TTL and shared tier URL
+cache_max_entries: int = 4096
+cache_ttl: float = 6 * 60 * 60
+cache_url: str = os.environ.get("DEEPSHOT_CACHE_URL", "")
+
+# Seconds between two purges of the expired entries of the SQLite tier
+cache_purge_interval: float = 60
+
+
+# In-process LRU cache tier
+class LocalCache:
+    def __init__(self, max_entries: int = cache_max_entries) -> None:
+        """
+        Thread-safe in-process LRU cache with per-entry expiry.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of entries kept before evicting the least recently
+            used one. Defaults to `cache_max_entries`.
+        """
+        self.max_entries: int = max_entries
+        self.entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> object | None:
+        """
+        Return the value stored under `key`, or `None` if missing or expired.
+        """
+        with self.lock:
+            entry: tuple[float, object] | None = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: object, ttl: float) -> None:
+        """
+        Store `value` under `key` for `ttl` seconds.
+        """
+        with self.lock:
+            self.entries[key] = (time.time() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+# Shared cache tier for the workers of a single host
+class SQLiteCache:
+    def __init__(self, path: str) -> None:
+        """
+        Cache tier stored in a SQLite database shared by every local worker.
+
+        Values are pickled; the database runs in WAL mode so concurrent
+        readers never block the writer. Expired entries are purged at most
+        every `cache_purge_interval` seconds, through an index on `expires`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the SQLite database file.
+        """
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=10
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.purged: float = 0.0
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expires ON cache(expires)"
+            )
+
+    def get(self, key: str) -> object | None:
+        """
+        Return the value stored under `key`, or `None` if missing or expired.
+        """
+        with self.lock:
+            row: tuple | None = self.connection.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires >= ?",
+                (key, time.time()),
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def set(self, key: str, value: object, ttl: float) -> None:
+        """
+        Store `value` under `key` for `ttl` seconds, purging the expired
+        entries if the last purge of this worker is old enough.
+        """
+        now: float = time.time()
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), now + ttl),
+            )
+            if now - self.purged >= cache_purge_interval:
+                self.connection.execute("DELETE FROM cache WHERE expires < ?", (now,))
+                self.purged = now
+
+
+# Shared cache tier for workers spread over several hosts
+class RedisCache:
+    def __init__(self, url: str) -> None:
+        """
+        Cache tier stored in a Redis-compatible server.
+
+        Any server speaking the Redis protocol works (Redis, Valkey, KeyDB or
+        a local stand-in), using the optional `redis` client package.
+
+        Parameters
+        ----------
+        url : str
+            Server URL, e.g. "redis://localhost:6379/0".
+
+        Raises
+        ------
+        ImportError
+            If the `redis` package is not installed.
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis package is required to use a redis:// cache URL"
+            ) from e
+        self.client: redis.Redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> object | None:
+        """
+        Return the value stored under `key`, or `None` if missing or expired.
+        """
+        data: bytes | None = self.client.get(key)
+        return pickle.loads(data) if data is not None else None
+
+    def set(self, key: str, value: object, ttl: float) -> None:
+        """
+        Store `value` under `key` for `ttl` seconds.
+        """
+        self.client.set(
+            key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), px=int(ttl * 1000)
+        )
+
+
+# Two-tier cache (in-process LRU in front of an optional shared tier)
+class TieredCache:
+    def __init__(self, url: str = cache_url) -> None:
+        """
+        Cache combining an in-process LRU tier with an optional shared tier.
+
+        Lookups hit the in-process tier first, then the shared tier (whose
+        hits are copied back in-process), and only compute the value on a
+        miss in both.
+
+        Parameters
+        ----------
+        url : str, optional
+            Shared tier location: "" for in-process only, "sqlite:///<path>"
+            for a SQLite file shared by the workers of one host, or
+            "redis://..." for a Redis-compatible server. Defaults to the
+            `DEEPSHOT_CACHE_URL` environment variable.
+
+        Raises
+        ------
+        ValueError
+            If the URL scheme is not supported.
+        """
+        self.local: LocalCache = LocalCache()
+        self.shared: SQLiteCache | RedisCache | None = None
+        if url.startswith("sqlite:///"):
+            self.shared = SQLiteCache(url[len("sqlite:///") :])
+        elif url.startswith(("redis://", "rediss://", "unix://")):
+            self.shared = RedisCache(url)
+        elif url:
+            raise ValueError(f"Unsupported cache URL: {url}")
+        self.stats: defaultdict[str, int] = defaultdict(int)
+
+    def get(self, key: str, ttl: float = cache_ttl) -> object | None:
+        """
+        Return the value stored under `key` in either tier, or `None` on a miss.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, already including the data / model version.
+        ttl : float, optional
+            Time to live in seconds of a shared tier hit copied in-process.
+            Defaults to `cache_ttl`.
+
+        Returns
+        -------
+        object | None
+            The cached value, or `None` if neither tier holds it.
+
+        Notes
+        -----
+        - Errors of the shared tier are logged and treated as misses, so an
+          unavailable shared cache never breaks a page.
+        """
+        value: object | None = self.local.get(key)
+        if value is not None:
+            self.stats["local_hits"] += 1
+            return value
+
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except Exception as e:
+                print(f"Error: Shared cache unavailable - {e}")
+            if value is not None:
+                self.stats["shared_hits"] += 1
+                self.local.set(key, value, ttl)
+                return value
+        return None
+
+    def set(self, key: str, value: object, ttl: float = cache_ttl) -> None:
+        """
+        Store `value` under `key` in both tiers for `ttl` seconds.
+
+        Errors of the shared tier are logged, the value is then only kept
+        in-process.
+        """
+        self.local.set(key, value, ttl)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, value, ttl)
+            except Exception as e:
+                print(f"Error: Shared cache unavailable - {e}")
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], object], ttl: float = cache_ttl
+    ) -> object:
+        """
+        Return the cached value of `key`, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, already including the data / model version.
+        compute : Callable[[], object]
+            Function producing the value on a miss.
+        ttl : float, optional
+            Time to live in seconds. Defaults to `cache_ttl`.
+
+        Returns
+        -------
+        object
+            The cached or freshly computed value.
+        """
+        value: object | None = self.get(key, ttl)
+        if value is not None:
+            return value
+
+        self.stats["misses"] += 1
+        value = compute()
+        self.set(key, value, ttl)
+        return value
+
+
+# Cache shared by every cached function
+cache: TieredCache = TieredCache()
+
+
+# Key of a cached call, by namespace, data version and arguments
+def cache_key(namespace: str, args: tuple) -> str:
+    """
+    Return the key the result of a call is cached under by `cached`.
+    """
+    return f"deepshot:{namespace}:{data_version()}:{json.dumps(args)}"
+
+
+# Decorator caching a function by namespace, arguments and data version
+def cached(namespace: str, ttl: float = cache_ttl) -> Callable:
+    """
+    Cache the results of a function in the tiered `cache`.
+
+    The cache key is made of the namespace, the current `data_version()` and
+    the positional arguments, so a data or model refresh is never served
+    stale results.
+
+    Parameters
+    ----------
+    namespace : str
+        Prefix of the cache keys (e.g. "predictions").
+    ttl : float, optional
+        Time to live in seconds. Defaults to `cache_ttl`.
+
+    Returns
+    -------
+    Callable
+        The decorator. Decorated functions only accept JSON-serializable
+        positional arguments.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args) -> object:
+            return cache.get_or_compute(
+                cache_key(namespace, args), lambda: func(*args), ttl
+            )
+
+        return wrapper
+
+    return decorator
+
+
+# Build the matrix of the most recent stats of many teams at once
+def team_stats_matrix(team_names: list[str], date: str) -> tuple[list[str], np.ndarray]:
+    """
+    Collect the as-of statistics of several teams into a single float matrix.
+
+    Parameters
+    ----------
+    team_names : list[str]
+        Teams to collect, in the desired row order.
+    date : str
+        Cutoff date in `YYYY-MM-DD` format. Only statistics recorded before
+        this date are used, exactly as in `find_most_recent_stats`.
+
+    Returns
+    -------
+    tuple[list[str], np.ndarray]
+        A tuple containing:
+        - The list of statistic column names
+        - A `(len(team_names), n_stats)` float matrix. Teams without prior
+          statistics are filled with `NaN`, which the booster treats as missing.
+    """
+    stat_labels: list[str] = stats_store.columns()[2:]
+    matrix: np.ndarray = np.full((len(team_names), len(stat_labels)), np.nan)
+    for i, team in enumerate(team_names):
+        found: list[tuple[SeasonPartition, np.ndarray]] = stats_store.recent_rows(
+            team, date, 1
+        )
+        if found:
+            partition, rows = found[0]
+            matrix[i] = partition.values[rows[0]]
+    return stat_labels, matrix
+
+
+# Assemble the model features of many home / away pairings
+def matchup_features(
+    stat_labels: list[str],
+    matrix: np.ndarray,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Build the model feature frame of many games from a per-team stats matrix.
+
+    The feature matrix is assembled by stacking the home and away team rows
+    of `matrix` side by side, which avoids building one DataFrame per game.
+
+    Parameters
+    ----------
+    stat_labels : list[str]
+        Statistic names matching the columns of `matrix`.
+    matrix : np.ndarray
+        Per-team statistics, as returned by `team_stats_matrix`.
+    home_idx : np.ndarray
+        Row indices of the home teams in `matrix`.
+    away_idx : np.ndarray
+        Row indices of the away teams in `matrix`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per pairing, with the columns in the order used during training.
+    """
+    columns: list[str] = [f"home_{s}" for s in stat_labels] + [
+        f"away_{s}" for s in stat_labels
+    ]
+    df: pd.DataFrame = pd.DataFrame(
+        np.hstack([matrix[home_idx], matrix[away_idx]]), columns=columns
+    )
+
+    # Keep the column order used during training
+    return df[list(model.feature_names_in_)]
+
+
+# Score many home / away pairings in a single model call
+def score_matchups(
+    stat_labels: list[str],
+    matrix: np.ndarray,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray,
+) -> np.ndarray:
+    """
+    Predict the home win probability of many games with one batched call.
+
+    Parameters
+    ----------
+    stat_labels : list[str]
+        Statistic names matching the columns of `matrix`.
+    matrix : np.ndarray
+        Per-team statistics, as returned by `team_stats_matrix`.
+    home_idx : np.ndarray
+        Row indices of the home teams in `matrix`.
+    away_idx : np.ndarray
+        Row indices of the away teams in `matrix`.
+
+    Returns
+    -------
+    np.ndarray
+        Home team win probabilities, one per pairing.
+    """
+    df: pd.DataFrame = matchup_features(stat_labels, matrix, home_idx, away_idx)
+
+    # The model class 0 stands for a home team win
+    return model.predict_proba(df)[:, 0]
+
+
+# Score every possible home / away pairing for a date
+@cached("matchups")
+def matchup_matrix(date: str) -> np.ndarray:
+    """
+    Compute the home win probability of every possible pairing on a date.
+
+    The `(30, 30)` home / away feature matrix is built in one shot from the
+    as-of team statistics and all 870 pairings are scored with a single
+    model call.
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    np.ndarray
+        A `(30, 30)` matrix where entry `[i, j]` is the probability that
+        `teams[i]` beats `teams[j]` when playing at home. The diagonal is `NaN`.
+
+    Notes
+    -----
+    - Results are cached per date and data / model version.
+    - The returned array is shared by every caller and must not be modified.
+    """
+    stat_labels, matrix = team_stats_matrix(teams, date)
+    home_idx, away_idx = np.nonzero(~np.eye(len(teams), dtype=bool))
+    probs: np.ndarray = np.full((len(teams), len(teams)), np.nan)
+    probs[home_idx, away_idx] = score_matchups(stat_labels, matrix, home_idx, away_idx)
+    probs.setflags(write=False)
+    return probs
+
+
+# Build the game dict of a possibly unscheduled matchup
+def hypothetical_game(home_team: str, away_team: str, date: str) -> dict:
+    """
+    Build a game dictionary for any pairing, scheduled or not.
+
+    The returned dictionary has the same shape as the games produced by
+    `GameList.render`, so it can be passed to the details page.
+
+    Parameters
+    ----------
+    home_team : str
+        Name of the home team.
+    away_team : str
+        Name of the away team.
+    date : str
+        Game date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    dict
+        Team names, per-team statistics prefixed with `home_` and `away_`,
+        the predicted winner and both win probabilities.
+
+    Raises
+    ------
+    ValueError
+        If a team is unknown or the two teams are the same.
+    """
+    if home_team not in teams or away_team not in teams or home_team == away_team:
+        raise ValueError(f"Invalid matchup: {home_team} vs {away_team}")
+
+    game: dict[str, str | int | float] = {
+        "home_team": home_team,
+        "away_team": away_team,
+    }
+    for side, team in (("home", home_team), ("away", away_team)):
+        stat_label, stats = find_most_recent_stats(team, date)
+        for label, value in zip(stat_label or [], stats or []):
+            game[f"{side}_{label}"] = value
+
+    home_prob: float = float(
+        matchup_matrix(date)[teams.index(home_team), teams.index(away_team)]
+    )
+    game["winner"] = home_team if home_prob >= 0.5 else away_team
+    game["home_prob"] = round(home_prob * 100)
+    game["away_prob"] = round((1 - home_prob) * 100)
+    return game
+
+
+# Look up the cached attributions of a game
+def cached_attributions(game: tuple[str, str, str]) -> np.ndarray | None:
+    """
+    Return the attributions of a `(date, home_team, away_team)` game under the
+    current data / model version, or `None` if they were not computed yet.
+    """
+    return cache.get(cache_key("attributions", game))
+
+
+# Compute the feature attributions of many games in one booster call
+def explain_games(games: list[tuple[str, str, str]]) -> None:
+    """
+    Compute and cache the TreeSHAP attributions of many games at once.
+
+    The feature rows of every game are assembled from the as-of team
+    statistics of its date, and the exact tree-path SHAP values are obtained
+    from the booster with a single `pred_contribs` call.
+
+    Parameters
+    ----------
+    games : list[tuple[str, str, str]]
+        Games to explain, as `(date, home_team, away_team)` tuples.
+
+    Returns
+    -------
+    None
+        This function does not return a value. Attributions are stored per
+        game in the tiered `cache`, under the `cached` key of the
+        "attributions" namespace and the current data / model version.
+
+    Notes
+    -----
+    - Attributions are in log-odds of the model class 1 (away team win), one
+      value per feature plus the bias term in the last position.
+    - With a shared cache tier, the games explained by one worker (e.g. the
+      startup precompute) are served to every other worker.
+    - Games involving unknown teams are skipped.
+    """
+    # Skip the unknown teams and the games already explained
+    pending: list[tuple[str, str, str]] = sorted(
+        {
+            g
+            for g in games
+            if g[1] in teams and g[2] in teams and cached_attributions(g) is None
+        }
+    )
+    if not pending:
+        return
+
+    # Assemble the feature rows date by date
+    frames: list[pd.DataFrame] = list()
+    for date in sorted({g[0] for g in pending}):
+        date_games: list[tuple[str, str, str]] = [g for g in pending if g[0] == date]
+        stat_labels, matrix = team_stats_matrix(teams, date)
+        frames.append(
+            matchup_features(
+                stat_labels,
+                matrix,
+                np.array([teams.index(g[1]) for g in date_games]),
+                np.array([teams.index(g[2]) for g in date_games]),
+            )
+        )
+    df: pd.DataFrame = pd.concat(frames, ignore_index=True)
+
+    # Exact tree-path SHAP values for every game in one call
+    contribs: np.ndarray = model.get_booster().predict(
+        xgboost.DMatrix(df), pred_contribs=True
+    )
+    for game, contrib in zip(pending, contribs):
+        cache.set(cache_key("attributions", game), contrib)
+
+
+# Explain every scheduled game of a date
+def explain_date(date: str) -> None:
+    """
+    Precompute the attributions of every game scheduled on a date.
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+    """
+    explain_games([(date, g["home_team"], g["away_team"]) for g in extract_games(date)])
+
+
+# Explain every scheduled game of the season a date belongs to
+def explain_season(date: str) -> None:
+    """
+    Precompute the attributions of every game of a season in one batch.
+
+    Parameters
+    ----------
+    date : str
+        Any date of the target season, in `YYYY-MM-DD` format.
+    """
+    schedule: pd.DataFrame = schedule_store.frame(season_key(date))
+    explain_games(
+        list(zip(schedule["date"], schedule["home_team"], schedule["away_team"]))
+    )
+
+
+# Relative shifts (in %) applied to a stat by the what-if analysis
+whatif_shifts: np.ndarray = np.linspace(-15, 15, 13)
+
+
+# Compute the win probability response curves of a game
+@cached("sensitivity")
+def sensitivity_curves(
+    date: str, home_team: str, away_team: str
+) -> dict[str, list | dict]:
+    """
+    Compute how a game prediction responds to shifts of its top statistics.
+
+    For every stat in `stats_tags` and for both teams, the stat is scaled by
+    each relative shift in `whatif_shifts` while every other feature is kept
+    fixed. The whole perturbation grid is built as a single matrix and scored
+    with one batched model call.
+
+    Parameters
+    ----------
+    date : str
+        Game date in `YYYY-MM-DD` format.
+    home_team : str
+        Name of the home team.
+    away_team : str
+        Name of the away team.
+
+    Returns
+    -------
+    dict[str, list | dict]
+        A dictionary containing:
+        - "shifts": the relative shifts, in %
+        - "curves": for each stat, the home team win probability (in %) at
+          each shift, under the "home" and "away" keys depending on which
+          team the stat is shifted for
+
+    Notes
+    -----
+    - Results are cached per game and data / model version; the curves are
+      interpolated client-side, so moving a slider never calls the model.
+    """
+    stat_labels, matrix = team_stats_matrix([home_team, away_team], date)
+    base: pd.DataFrame = matchup_features(
+        stat_labels, matrix, np.array([0]), np.array([1])
+    )
+
+    # One row per (stat, side, shift), each scaling a single feature
+    n_shifts: int = len(whatif_shifts)
+    columns: np.ndarray = np.array(
+        [
+            base.columns.get_loc(f"{side}_{stat}")
+            for stat in stats_tags
+            for side in ("home", "away")
+        ]
+    )
+    grid: np.ndarray = np.repeat(base.to_numpy(), len(columns) * n_shifts, axis=0)
+    rows: np.ndarray = np.arange(len(grid))
+    grid[rows, np.repeat(columns, n_shifts)] *= np.tile(
+        1 + whatif_shifts / 100, len(columns)
+    )
+
+    # Score the whole grid at once
+    probs: np.ndarray = (
+        model.predict_proba(pd.DataFrame(grid, columns=base.columns))[:, 0].astype(
+            float
+        )
+        * 100
+    ).reshape(len(stats_tags), 2, n_shifts)
+
+    return {
+        "shifts": whatif_shifts.round(2).tolist(),
+        "curves": {
+            stat: {
+                "home": probs[i, 0].round(2).tolist(),
+                "away": probs[i, 1].round(2).tolist(),
+            }
+            for i, stat in enumerate(stats_tags)
+        },
+    }
+
+
+# Get the main drivers of a game prediction
+def game_drivers(
+    date: str, home_team: str, away_team: str, count: int = 8
+) -> list[dict[str, str | float]]:
+    """
+    Return the features that moved a game prediction the most.
+
+    Cached attributions are used when available. Otherwise the whole slate
+    of the date is explained in one batch, together with the requested game,
+    so the following details pages of that date are served from the cache.
+
+    Parameters
+    ----------
+    date : str
+        Game date in `YYYY-MM-DD` format.
+    home_team : str
+        Name of the home team.
+    away_team : str
+        Name of the away team.
+    count : int, optional
+        Number of drivers to return. Defaults to 8.
+
+    Returns
+    -------
+    list[dict[str, str | float]]
+        Drivers sorted by decreasing absolute impact, each containing:
+        - "stat": the statistic name
+        - "team": the team the statistic belongs to
+        - "favours": the team the feature pushes the prediction toward
+        - "impact": the absolute attribution, in log-odds
+    """
+    key: tuple[str, str, str] = (date, home_team, away_team)
+    contrib: np.ndarray | None = cached_attributions(key)
+    if contrib is None:
+        explain_games(
+            [(date, g["home_team"], g["away_team"]) for g in extract_games(date)]
+            + [key]
+        )
+        contrib = cached_attributions(key)
+    if contrib is None:
+        return list()
+
+    # Drop the bias term and keep the largest contributions
+    contrib = contrib[:-1]
+    drivers: list[dict[str, str | float]] = list()
+    for i in np.argsort(-np.abs(contrib))[:count]:
+        feature: str = str(model.feature_names_in_[i])
+        side, stat = feature.split("_", 1)
+        drivers.append(
+            {
+                "stat": stat,
+                "team": home_team if side == "home" else away_team,
+                "favours": away_team if contrib[i] > 0 else home_team,
+                "impact": round(float(abs(contrib[i])), 3),
+            }
+        )
+    return drivers
+
+
+# Creating the Card UI
+class GameCard(ui.card):
+    def __init__(self, game: dict[str, str | int | float], date: str) -> None:
+        """
+        UI card component displaying a scheduled NBA game and its analytics.
+
+        This class renders an interactive card showing two teams facing each
+        other on a given date, including team logos, win probabilities,
+        color-coded probability bars, and an expandable section with detailed
+        statistical comparisons.
+
+        The card visually highlights statistical advantages using color cues
+        and allows navigation to a detailed game view.
+
+        Parameters
+        ----------
+        game : dict[str, str | int | float]
+            Dictionary containing all game-related data, including:
+            - team names
+            - win probabilities
+            - per-team statistics prefixed with `home_` and `away_`
+        date : str
+            Game date in `YYYY-MM-DD` format, used for routing and display.
+
+        Notes
+        -----
+        - Team colors are dynamically selected to maximize visual contrast.
+        - Win probability bars are scaled proportionally to predicted win chances.
+        - Detailed stats are shown in an expandable section with conditional
+          coloring based on relative performance.
+        - This component depends on several globally defined utilities and
+          mappings, including:
+            - `get_best_color_pair`
+            - `stats_tags`
+            - `lower_better_stats`
+            - `stat_to_full_name_desc`
+        - Designed for use with NiceGUI (`ui.card`, `ui.row`, `ui.column`, etc.).
+        - The win probabilities can be refreshed in place with
+          `update_probabilities`.
+        """
+
+        # Initializing the super class
+        super().__init__()
+        self.game: dict[str, str | int | float] = game
+        self.classes("m-4 p-10 rounded-2xl shadow-md border w-[650px]").style(
+            "background-color: #e3e4e6;"
+        )
+
+        # Arranging the info
+        with self:
+
+            # Calculating the color for each team
+            home_color, away_color = get_best_color_pair(
+                game["home_team"], game["away_team"]
+            )
+
+            # Row for Team Logos and "VS"
+            with ui.row(align_items="center").classes(
+                "items-center justify-between w-full"
+            ):
+                asset_image(game["home_team"], 128).classes("w-32")
+                asset_image("vs", 64).classes("w-16")
+                asset_image(game["away_team"], 128).classes("w-32")
+
+            # Row for the info / details button
+            with ui.row().classes("w-full flex justify-center items-center"):
+                with ui.column().classes("items-center"):
+                    ui.button(
+                        "Details",
+                        icon="info",
+                        on_click=lambda: ui.navigate.to(
+                            f"/{date}/{quote(json.dumps(self.game))}"
+                        ),
+                    ).props("unelevated rounded color=grey-2 text-color=grey-5")
+
+            # Row for Team Names and Win Probabilities
+            with ui.row(align_items="stretch").classes("justify-between w-full"):
+                with ui.column(align_items="start"):
+                    ui.label(game["home_team"]).classes("text-left text-lg font-bold")
+                    self.home_prob: ui.label = ui.label(
+                        f"W {game['home_prob']} %"
+                    ).classes(f"text-left text-lg font-bold")
+
+                with ui.column(align_items="end"):
+                    ui.label(game["away_team"]).classes("text-right text-lg font-bold")
+                    self.away_prob: ui.label = ui.label(
+                        f"W {game['away_prob']} %"
+                    ).classes(f"text-right text-lg font-bold")
+
+            # HTML element to create W % bars
+            with ui.element("div").classes("flex w-full h-6"):
+                self.home_bar: ui.element = (
+                    ui.element("div")
+                    .style(f"flex: {game['home_prob']}; background-color: {home_color}")
+                    .classes("rounded-md mr-1")
+                )
+                self.away_bar: ui.element = (
+                    ui.element("div")
+                    .style(f"flex: {game['away_prob']}; background-color: {away_color}")
+                    .classes("rounded-md ml-1")
+                )
+
+            # Wide & Rounded "See More" Expansion toggle
+            with ui.expansion().classes(
+                "w-full shadow-md bg-gray-100 rounded-2xl overflow-hidden mx-auto"
+            ).props("duration=550 hide-expand-icon") as expansion:
+
+                # Toggle the label on / off based on the expansion state
+                def toggle_label() -> None:
+                    label.set_text(
+                        "Click to hide" if expansion.value else "Click for more"
+                    )
+                    icon.set_name("expand_less" if expansion.value else "expand_more")
+
+                expansion.on(
+                    "update:model-value", toggle_label
+                )  # Listen for expansion state changes
+
+                with expansion.add_slot("header"):
+                    with ui.row().classes("w-full justify-center items-center"):
+                        label: ui.label = ui.label("Click for more").classes(
+                            "text-md font-bold text-center"
+                        )
+                        icon: ui.icon = ui.icon("expand_more").classes("text-xl")
+
+                # Expanded Stats Section
+                with ui.row().classes("w-full"):
+
+                    # Home team stats
+                    with ui.column().classes("items-start flex-1"):
+                        for stat in stats_tags:
+                            style: str = stat_highlight(
+                                float(game[f"home_{stat}"]),
+                                float(game[f"away_{stat}"]),
+                                stat,
+                            )
+                            ui.label(game[f"home_{stat}"]).classes(
+                                f"text-left text-sm {style}"
+                            )
+
+                    # Stat labels (Centered)
+                    with ui.column().classes("items-center flex-3.5"):
+                        for stat in stats_tags:
+                            ui.label(stat_to_full_name_desc[stat]).classes(
+                                "text-center text-sm font-bold"
+                            )
+
+                    # Away team stats
+                    with ui.column().classes("items-end flex-1"):
+                        for stat in stats_tags:
+                            style: str = stat_highlight(
+                                float(game[f"away_{stat}"]),
+                                float(game[f"home_{stat}"]),
+                                stat,
+                            )
+                            ui.label(game[f"away_{stat}"]).classes(
+                                f"text-right text-sm {style}"
+                            )
+
+    # Refresh the win probabilities
+    def update_probabilities(self, game: dict[str, str | int | float]) -> None:
+        """
+        Show new win probabilities, updating only the labels and bar widths.
+
+        Parameters
+        ----------
+        game : dict[str, str | int | float]
+            The game with its new predictions, as returned by `predict_games`.
+        """
+        self.game = game
+        self.home_prob.set_text(f"W {game['home_prob']} %")
+        self.away_prob.set_text(f"W {game['away_prob']} %")
+        self.home_bar.style(f"flex: {game['home_prob']}")
+        self.away_bar.style(f"flex: {game['away_prob']}")
+
+
+# Predict every scheduled game of a date
+@cached("predictions")
+def predict_games(date: str) -> list[dict[str, str | int | float]]:
+    """
+    Predict the outcome of every game scheduled on a date.
+
+    This function:
+    - Retrieves scheduled games for the given date
+    - Augments each game with the most recent team statistics
+    - Prepares features and runs model predictions
+    - Attaches the predicted winner and win probabilities to each game
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    list[dict[str, str | int | float]]
+        One dictionary per game, with team names, per-team statistics
+        prefixed with `home_` and `away_`, the predicted winner and both win
+        probabilities. Empty if no games are scheduled.
+
+    Notes
+    -----
+    - Non-numeric columns are removed before prediction.
+    - Feature values are cast to float prior to model inference.
+    - Results are cached per date and data / model version, and shared
+      across workers when a shared cache tier is configured.
+    """
+
+    # For each game shcedule for today date, extract the home team and away team
+    games: list[dict[str, str | int | float]] = list()
+    for game in extract_games(date):
+        stat_label, stats = find_most_recent_stats(game["home_team"], date)
+        for i, _ in enumerate(stat_label):
+            game[f"home_{stat_label[i]}"] = stats[i]
+        stat_label, stats = find_most_recent_stats(game["away_team"], date)
+        for i, _ in enumerate(stat_label):
+            game[f"away_{stat_label[i]}"] = stats[i]
+        games.append(game)
+
+    # Check if games is empty
+    if not games:
+        return games
+
+    # Convert data into DataFrame
+    df: pd.DataFrame = pd.DataFrame(games)
+
+    # Drop non-numeric columns (team names)
+    df: pd.DataFrame = df.drop(["home_team", "away_team"], axis=1)
+
+    # Drop irrelvant stats columns
+    stats_to_drop: list[str] = list()
+    for stat in stats_to_drop:
+        df: pd.DataFrame = df.drop([f"home_{stat}", f"away_{stat}"], axis=1)
+
+    # Convert all values to float (they are strings in the provided data)
+    df: pd.DataFrame = df.astype(float)
+
+    # Make predictions
+    predictions: list[int] = model.predict(df)
+
+    # Get probabilities
+    prob: list[list[float]] = model.predict_proba(df)
+
+    # Appending the new data to the games dict
+    for i, game in enumerate(games):
+        game["winner"] = game["home_team"] if predictions[i] == 0 else game["away_team"]
+        game["home_prob"] = round(float(prob[i][0]) * 100)
+        game["away_prob"] = round(float(prob[i][1]) * 100)
+
+    return games
+
+
+# Card rendering mode: "full" (interactive NiceGUI cards) or "lite" (one HTML
+# fragment per card, with native link and toggle, far fewer elements per client)
+render_modes: tuple[str, ...] = ("full", "lite")
+render_mode: str = os.environ.get("DEEPSHOT_RENDER_MODE", "full")
+
+# Trace the Python allocations, to measure the memory of the rendered cards
+if os.environ.get("DEEPSHOT_TRACE_MEMORY"):
+    tracemalloc.start()
+
+# Renders, cards, elements and traced memory (bytes) per rendering mode
+render_stats: defaultdict[str, defaultdict[str, int]] = defaultdict(
+    lambda: defaultdict(int)
+)
+
+
+# Creating the game list UI
+class GameList:
+    def __init__(self, date: str, mode: str = render_mode) -> None:
+        """
+        Controller class responsible for rendering game cards for a given date.
+
+        This class retrieves scheduled games for a specific date, enriches them
+        with the most recent available team statistics, runs model predictions
+        to estimate game outcomes, and renders a `GameCard` UI component for
+        each game.
+
+        Parameters
+        ----------
+        date : str
+            Target date in `YYYY-MM-DD` format for which games should be rendered.
+        mode : str, optional
+            Rendering mode of the cards, "full" for `GameCard` components or
+            "lite" for `game_card_html` fragments. Defaults to `render_mode`.
+
+        Notes
+        -----
+        - Team statistics are retrieved using cached historical data to avoid
+          data leakage.
+        - Predictions are generated using a pre-trained machine learning model.
+        - This class orchestrates data extraction, feature preparation,
+          prediction, and UI rendering.
+        """
+
+        # Storing the date and mode to render the cards
+        self.date: str = date
+        self.mode: str = mode if mode in render_modes else render_mode
+
+        # Rendered games and cards, by home / away teams
+        self.games: dict[tuple[str, str], dict[str, str | int | float]] = dict()
+        self.cards: dict[tuple[str, str], GameCard | ui.html] = dict()
+
+    # Render all the cards
+    def render(self) -> None:
+        """
+        Render game cards for all scheduled games on the specified date.
+
+        This method retrieves the predictions of the date with
+        `predict_games` and instantiates a `GameCard` UI component for each
+        game, or a single HTML element per game in "lite" mode. The elements
+        and memory created are added to `render_stats`.
+
+        Returns
+        -------
+        None
+            This method does not return a value. It renders UI components
+            directly.
+
+        Notes
+        -----
+        - Predictions are served from the shared cache when available.
+        - Any exceptions during rendering are silently ignored.
+        """
+
+        # Getting the cached predictions of the date
+        try:
+            games: list[dict[str, str | int | float]] = predict_games(self.date)
+
+            # Check if games is empty
+            if not games:
+                print("No games found for this date")
+                return
+
+            # After clearing the container, rendering the game cards
+            elements: int = len(context.client.elements)
+            memory: int = tracemalloc.get_traced_memory()[0]
+            for game in games:
+                key: tuple[str, str] = (game["home_team"], game["away_team"])
+                self.games[key] = game
+                if self.mode == "lite":
+                    self.cards[key] = ui.html(
+                        game_card_html(game, self.date), sanitize=False
+                    )
+                else:
+                    self.cards[key] = GameCard(game, self.date)
+
+            # Measuring the cost of the cards for this client
+            stats: defaultdict[str, int] = render_stats[self.mode]
+            stats["renders"] += 1
+            stats["cards"] += len(games)
+            stats["elements"] += len(context.client.elements) - elements
+            stats["bytes"] += tracemalloc.get_traced_memory()[0] - memory
+
+            # Keeping the served predictions, to score them against the results
+            history.submit(self.date, games)
+
+        except FileNotFoundError as e:
+            print(f"Error: Could not find required files - {e}")
+        except KeyError as e:
+            print(f"Error: Missing expected data field - {e}")
+        except ValueError as e:
+            print(f"Error: Invalid data format - {e}")
+        except Exception as e:
+            print(f"Unexpected error during prediction: {e}")
+            traceback.print_exc()
+
+    # Push new predictions into the rendered cards
+    def update(self, games: list[dict[str, str | int | float]], date: str) -> int:
+        """
+        Update the cards whose win probabilities changed.
+
+        Parameters
+        ----------
+        games : list[dict[str, str | int | float]]
+            The new predictions of the date, as returned by `predict_games`.
+        date : str
+            The date the cards were rendered for, in `YYYY-MM-DD` format.
+
+        Returns
+        -------
+        int
+            The number of updated cards. Games added to or removed from the
+            schedule are only shown after a reload.
+        """
+        updated: int = 0
+        for game in games:
+            key: tuple[str, str] = (game["home_team"], game["away_team"])
+            if (
+                key not in self.cards
+                or self.games[key]["home_prob"] == game["home_prob"]
+            ):
+                continue
+            self.games[key] = game
+            if self.mode == "lite":
+                self.cards[key].set_content(game_card_html(game, date))
+            else:
+                self.cards[key].update_probabilities(game)
+            updated += 1
+        return updated
+
+
+# Seconds between two checks of the data version by the live updates
+live_interval: float = 30
+
+# Game lists shown by the connected clients, by date and client id
+live_lists: defaultdict[str, dict[str, GameList]] = defaultdict(dict)
+
+
+# Keep the cards of a client up to date
+def subscribe(games_list: GameList) -> None:
+    """
+    Register the game list of the current client for live updates, until the
+    client is deleted.
+
+    The list is registered under the date its cards were rendered for, which
+    the date picker doesn't change (it rebinds `games_list.date` until the
+    next page is opened).
+    """
+    client_id: str = context.client.id
+    date: str = games_list.date
+    live_lists[date][client_id] = games_list
+    context.client.on_delete(lambda: live_lists[date].pop(client_id, None))
+
+
+# Push the new predictions of every watched date
+async def push_predictions() -> None:
+    """
+    Predict every date shown by a client once, and update the changed cards
+    of all the clients showing it.
+    """
+    for date in list(live_lists):
+        if not live_lists[date]:
+            del live_lists[date]
+            continue
+        try:
+            games: list[dict[str, str | int | float]] = await run.io_bound(
+                predict_games, date
+            )
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            print(f"Error: Could not update the predictions of {date} - {e}")
+            continue
+        for games_list in list(live_lists[date].values()):
+            games_list.update(games, date)
+
+
+# Watch the data version and push the new predictions when it changes
+async def live_updates() -> None:
+    """
+    Check the data version every `live_interval` seconds.
+    """
+    version: str = data_version()
+    while True:
+        await asyncio.sleep(live_interval)
+        if data_version() == version:
+            continue
+        version = data_version()
+        await push_predictions()
+
+        # New results score the pending predictions
+        try:
+            await run.io_bound(history.sync_outcomes)
+        except sqlite3.Error as e:
+            print(f"Error: Could not update the prediction outcomes - {e}")
+
+
+app.on_startup(live_updates)
+
+# Prediction history database and number of games of the rolling accuracy
+history_path: str = os.environ.get("DEEPSHOT_HISTORY", "./data/history.sqlite")
+history_window: int = 100
+
+
+# Append-only store of the served predictions and of the game outcomes
+class PredictionHistory:
+    def __init__(self, path: str = history_path) -> None:
+        """
+        Record every served prediction and score it once its result is known.
+
+        Predictions are keyed by date, teams and model version, and only the
+        first served prediction of a key is kept. Outcomes are copied from the
+        results into their own table. `pending` tracks the predictions still
+        waiting for one, and scored predictions are added to daily aggregates
+        (overall, per probability bucket and per team), so neither syncing nor
+        the dashboard queries scan the whole history.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of the SQLite database file. Defaults to `DEEPSHOT_HISTORY`.
+        """
+        self.path: str = path
+        self.connection: sqlite3.Connection | None = None
+        self.lock: threading.Lock = threading.Lock()
+        self.recorded: set[tuple[str, str]] = set()
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open the database on first use, creating its tables.
+        """
+        if self.connection is None:
+            self.connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None, timeout=10
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS predictions (
+                    date TEXT NOT NULL,
+                    home_team TEXT NOT NULL,
+                    away_team TEXT NOT NULL,
+                    model_version TEXT NOT NULL,
+                    home_prob REAL NOT NULL,
+                    served REAL NOT NULL,
+                    PRIMARY KEY (date, home_team, away_team, model_version)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS outcomes (
+                    date TEXT NOT NULL,
+                    home_team TEXT NOT NULL,
+                    away_team TEXT NOT NULL,
+                    home_win INTEGER NOT NULL,
+                    PRIMARY KEY (date, home_team, away_team)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS pending (
+                    date TEXT NOT NULL,
+                    home_team TEXT NOT NULL,
+                    away_team TEXT NOT NULL,
+                    model_version TEXT NOT NULL,
+                    PRIMARY KEY (date, home_team, away_team, model_version)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS daily_scores (
+                    model_version TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    games INTEGER NOT NULL,
+                    hits INTEGER NOT NULL,
+                    brier REAL NOT NULL,
+                    PRIMARY KEY (model_version, date)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS bucket_scores (
+                    model_version TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    games INTEGER NOT NULL,
+                    predicted REAL NOT NULL,
+                    observed INTEGER NOT NULL,
+                    PRIMARY KEY (model_version, date, bucket)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS team_scores (
+                    model_version TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    team TEXT NOT NULL,
+                    games INTEGER NOT NULL,
+                    hits INTEGER NOT NULL,
+                    PRIMARY KEY (model_version, date, team)
+                ) WITHOUT ROWID;
+                """)
+        return self.connection
+
+    def record(self, date: str, games: list[dict[str, str | int | float]]) -> None:
+        """
+        Store the predictions of a date made by the loaded model.
+        """
+        now: float = time.time()
+        with self.lock:
+            try:
+                connection: sqlite3.Connection = self.connect()
+                with connection:
+                    connection.execute("BEGIN")
+
+                    # Only new predictions wait for an outcome, as the others
+                    # may be scored already
+                    recorded: list[dict[str, str | int | float]] = [
+                        g
+                        for g in games
+                        if connection.execute(
+                            "INSERT OR IGNORE INTO predictions "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            (
+                                date,
+                                g["home_team"],
+                                g["away_team"],
+                                model_version,
+                                g["home_prob"] / 100,
+                                now,
+                            ),
+                        ).rowcount
+                    ]
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO pending VALUES (?, ?, ?, ?)",
+                        [
+                            (date, g["home_team"], g["away_team"], model_version)
+                            for g in recorded
+                        ],
+                    )
+            except sqlite3.Error as e:
+                print(f"Error: Could not record the predictions of {date} - {e}")
+
+    def submit(self, date: str, games: list[dict[str, str | int | float]]) -> None:
+        """
+        Record the predictions of a date in the background, once per data
+        version.
+        """
+        key: tuple[str, str] = (date, data_version())
+        if key in self.recorded:
+            return
+        self.recorded.add(key)
+        background_tasks.create(
+            run.io_bound(self.record, date, games), name=f"history {date}"
+        )
+
+    def sync_outcomes(self) -> int:
+        """
+        Copy the results of the pending games into the outcomes, and add the
+        predictions they score to the daily aggregates.
+
+        Returns
+        -------
+        int
+            The number of newly scored predictions.
+        """
+        with self.lock:
+            connection: sqlite3.Connection = self.connect()
+            dates: list[str] = [
+                row[0]
+                for row in connection.execute("SELECT DISTINCT date FROM pending")
+            ]
+            rows: list[tuple[str, str, str, int]] = list()
+            for season in sorted({season_key(date) for date in dates}):
+                results: pd.DataFrame = results_store.frame(season)
+                results = results[results["date"].isin(dates)]
+                rows += [
+                    (d, h, a, 1 - int(w))
+                    for d, h, a, w in results[
+                        ["date", "home_team", "away_team", "winning_team"]
+                    ].itertuples(index=False)
+                ]
+
+            # Aggregates and pending predictions are updated in one transaction
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany(
+                    "INSERT OR IGNORE INTO outcomes VALUES (?, ?, ?, ?)", rows
+                )
+                connection.execute(
+                    "CREATE TEMP TABLE scored AS SELECT p.model_version, p.date, "
+                    "p.home_team, p.away_team, p.home_prob, o.home_win, "
+                    "((p.home_prob >= 0.5) = o.home_win) AS hit "
+                    "FROM pending q "
+                    "JOIN predictions p "
+                    "USING (date, home_team, away_team, model_version) "
+                    "JOIN outcomes o USING (date, home_team, away_team)"
+                )
+                connection.executescript("""
+                    INSERT INTO daily_scores
+                    SELECT model_version, date, COUNT(*), SUM(hit),
+                           SUM((home_prob - home_win) * (home_prob - home_win))
+                    FROM scored GROUP BY model_version, date
+                    ON CONFLICT DO UPDATE SET games = games + excluded.games,
+                        hits = hits + excluded.hits, brier = brier + excluded.brier;
+                    INSERT INTO bucket_scores
+                    SELECT model_version, date,
+                           MIN(CAST(home_prob * 10 AS INTEGER), 9) AS bucket,
+                           COUNT(*), SUM(home_prob), SUM(home_win)
+                    FROM scored GROUP BY model_version, date, bucket
+                    ON CONFLICT DO UPDATE SET games = games + excluded.games,
+                        predicted = predicted + excluded.predicted,
+                        observed = observed + excluded.observed;
+                    INSERT INTO team_scores
+                    SELECT model_version, date, team, COUNT(*), SUM(hit) FROM (
+                        SELECT model_version, date, home_team AS team, hit FROM scored
+                        UNION ALL
+                        SELECT model_version, date, away_team AS team, hit FROM scored
+                    ) GROUP BY model_version, date, team
+                    ON CONFLICT DO UPDATE SET games = games + excluded.games,
+                        hits = hits + excluded.hits;
+                    DELETE FROM pending
+                    WHERE (date, home_team, away_team, model_version) IN (
+                        SELECT date, home_team, away_team, model_version FROM scored
+                    );
+                    """)
+                scored: int = connection.execute(
+                    "SELECT COUNT(*) FROM scored"
+                ).fetchone()[0]
+                connection.execute("DROP TABLE scored")
+        return scored
+
+    def models(self) -> list[str]:
+        """
+        Return the model versions with scored predictions.
+        """
+        with self.lock:
+            return [
+                row[0]
+                for row in self.connect().execute(
+                    "SELECT DISTINCT model_version FROM daily_scores "
+                    "ORDER BY model_version"
+                )
+            ]
+
+    def summary(self, model: str, start: str, end: str) -> dict[str, pd.DataFrame]:
+        """
+        Aggregate the scored predictions of a model between two dates.
+
+        Parameters
+        ----------
+        model : str
+            Model version.
+        start : str
+            First date, in `YYYY-MM-DD` format.
+        end : str
+            Last date, in `YYYY-MM-DD` format.
+
+        Returns
+        -------
+        dict[str, pandas.DataFrame]
+            - `daily`: games, correct picks and Brier score sum per date, with
+              the accuracy over the last `history_window` games.
+            - `calibration`: games, mean predicted and observed home win rate
+              per 10 % probability bucket.
+            - `teams`: games and hit rate of the games of each team.
+        """
+        scope: str = "WHERE model_version = ? AND date BETWEEN ? AND ?"
+        params: tuple[str, str, str] = (model, start, end)
+        with self.lock:
+            connection: sqlite3.Connection = self.connect()
+            daily: pd.DataFrame = pd.read_sql_query(
+                f"SELECT date, games, hits, brier FROM daily_scores {scope} "
+                f"ORDER BY date",
+                connection,
+                params=params,
+            )
+            calibration: pd.DataFrame = pd.read_sql_query(
+                f"SELECT bucket, SUM(games) AS games, "
+                f"SUM(predicted) / SUM(games) AS predicted, "
+                f"CAST(SUM(observed) AS REAL) / SUM(games) AS observed "
+                f"FROM bucket_scores {scope} GROUP BY bucket ORDER BY bucket",
+                connection,
+                params=params,
+            )
+            team_games: pd.DataFrame = pd.read_sql_query(
+                f"SELECT team, SUM(games) AS games, "
+                f"CAST(SUM(hits) AS REAL) / SUM(games) AS hit_rate "
+                f"FROM team_scores {scope} GROUP BY team ORDER BY hit_rate DESC, team",
+                connection,
+                params=params,
+            )
+
+        # Accuracy over the last `history_window` games, from cumulative counts
+        games: np.ndarray = daily["games"].cumsum().to_numpy()
+        hits: np.ndarray = daily["hits"].cumsum().to_numpy()
+        first: np.ndarray = np.searchsorted(games, games - history_window, side="right")
+        previous_games: np.ndarray = np.where(first > 0, games[first - 1], 0)
+        previous_hits: np.ndarray = np.where(first > 0, hits[first - 1], 0)
+        daily["rolling_accuracy"] = (hits - previous_hits) / np.maximum(
+            games - previous_games, 1
+        )
+        return {"daily": daily, "calibration": calibration, "teams": team_games}
+
+
+# History of the served predictions
+history: PredictionHistory = PredictionHistory()
+
+
+# Number of simulations run by each worker chunk (bounds the outcome matrix memory)
+simulation_chunk_size: int = 10_000
+
+# Number of simulated seasons and worker processes used by the simulation page
+simulation_runs: int = 100_000
+simulation_workers: int = int(os.environ.get("DEEPSHOT_SIMULATION_WORKERS", "1"))
+
+# Worker process pools of the simulations, by size, started on first use
+simulation_pools: dict[int, ProcessPoolExecutor] = dict()
+simulation_pools_lock: threading.Lock = threading.Lock()
+
+
+# Get the worker process pool of the simulations
+def simulation_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the pool of `workers` processes, started once and then reused, so
+    simulations don't pay the start-up (and `main.py` import) of the workers.
+    """
+    with simulation_pools_lock:
+        if workers not in simulation_pools:
+            simulation_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return simulation_pools[workers]
+
+
+# Stop the simulation workers with the app
+def shutdown_simulation_pools() -> None:
+    """
+    Shut the simulation worker pools down.
+    """
+    with simulation_pools_lock:
+        for pool in simulation_pools.values():
+            pool.shutdown(cancel_futures=True)
+        simulation_pools.clear()
+
+
+app.on_shutdown(shutdown_simulation_pools)
+
+
+# Simulate a chunk of seasons with vectorized NumPy operations
+def simulate_chunk(
+    home_prob: np.ndarray,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray,
+    base_wins: np.ndarray,
+    pair_prob: np.ndarray,
+    conference_idx: dict[str, np.ndarray],
+    n_sims: int,
+    seed: int,
+) -> dict[str, np.ndarray]:
+    """
+    Simulate the rest of the regular season and the play-in many times at once.
+
+    Every remaining game of every simulation is drawn in a single
+    `(n_sims, n_games)` random matrix. Win totals are obtained with one matrix
+    product against the game / team incidence matrix, conference seeds with a
+    row-wise argsort, and the play-in tournament with vectorized lookups in
+    the pairwise probability matrix.
+
+    Parameters
+    ----------
+    home_prob : np.ndarray
+        Home team win probability of each remaining game.
+    home_idx : np.ndarray
+        Index in `teams` of the home team of each remaining game.
+    away_idx : np.ndarray
+        Index in `teams` of the away team of each remaining game.
+    base_wins : np.ndarray
+        Wins already recorded by each team.
+    pair_prob : np.ndarray
+        `(30, 30)` matrix holding the probability that the row team beats the
+        column team at home, used for the play-in games.
+    conference_idx : dict[str, np.ndarray]
+        Indices in `teams` of the members of each conference.
+    n_sims : int
+        Number of seasons to simulate.
+    seed : int
+        Seed of the random generator, making chunks reproducible.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Aggregated counts that can be summed across chunks:
+        - "wins_hist": `(30, 83)` histogram of final win totals
+        - "seed_hist": `(30, 16)` histogram of conference seeds
+        - "playoffs": `(30,)` number of playoff qualifications
+
+    Notes
+    -----
+    - Ties in the standings are broken at random.
+    - This function is a module-level function so it can be shipped to a
+      process pool.
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    n_teams: int = len(base_wins)
+    n_games: int = len(home_prob)
+    rows: np.ndarray = np.arange(n_sims)
+
+    # Game / team incidence matrices
+    home_incidence: np.ndarray = np.zeros((n_games, n_teams), dtype=np.float32)
+    home_incidence[np.arange(n_games), home_idx] = 1.0
+    away_incidence: np.ndarray = np.zeros((n_games, n_teams), dtype=np.float32)
+    away_incidence[np.arange(n_games), away_idx] = 1.0
+
+    # Draw every remaining game at once and count the wins with a matrix product
+    home_won: np.ndarray = (
+        rng.random((n_sims, n_games), dtype=np.float32) < home_prob
+    ).astype(np.float32)
+    wins: np.ndarray = (
+        (
+            base_wins
+            + away_incidence.sum(axis=0)
+            + home_won @ (home_incidence - away_incidence)
+        )
+        .round()
+        .astype(np.int64)
+    )
+
+    # Histogram of the win totals for each team
+    wins_hist: np.ndarray = np.zeros((n_teams, 83), dtype=np.int64)
+    for t in range(n_teams):
+        wins_hist[t] = np.bincount(np.clip(wins[:, t], 0, 82), minlength=83)
+
+    seeds: np.ndarray = np.zeros((n_sims, n_teams), dtype=np.int64)
+    playoffs: np.ndarray = np.zeros(n_teams, dtype=np.int64)
+    for members in conference_idx.values():
+
+        # Rank the conference, using a random fraction of a win as tiebreaker
+        noisy: np.ndarray = wins[:, members] + rng.random((n_sims, len(members)))
+        order: np.ndarray = members[np.argsort(-noisy, axis=1)]
+        seeds[rows[:, None], order] = np.arange(1, len(members) + 1)
+
+        # Seeds 1 to 6 qualify directly
+        playoffs += np.bincount(order[:, :6].ravel(), minlength=n_teams)
+
+        # Play-in: 7 vs 8 winner is the 7th seed, loser faces the 9 vs 10 winner
+        s7, s8, s9, s10 = order[:, 6], order[:, 7], order[:, 8], order[:, 9]
+        won_78: np.ndarray = rng.random(n_sims) < pair_prob[s7, s8]
+        winner_78: np.ndarray = np.where(won_78, s7, s8)
+        loser_78: np.ndarray = np.where(won_78, s8, s7)
+        winner_910: np.ndarray = np.where(
+            rng.random(n_sims) < pair_prob[s9, s10], s9, s10
+        )
+        winner_last: np.ndarray = np.where(
+            rng.random(n_sims) < pair_prob[loser_78, winner_910],
+            loser_78,
+            winner_910,
+        )
+        playoffs += np.bincount(winner_78, minlength=n_teams)
+        playoffs += np.bincount(winner_last, minlength=n_teams)
+
+    # Histogram of the seeds for each team
+    seed_hist: np.ndarray = np.zeros((n_teams, 16), dtype=np.int64)
+    for t in range(n_teams):
+        seed_hist[t] = np.bincount(seeds[:, t], minlength=16)[:16]
+
+    return {"wins_hist": wins_hist, "seed_hist": seed_hist, "playoffs": playoffs}
+
+
+# Simulate the remaining season from a given date
+@cached("simulations")
+def simulate_season(date: str, n_sims: int, workers: int) -> pd.DataFrame:
+    """
+    Run a Monte Carlo simulation of the remaining regular season.
+
+    Every game of the season scheduled on or after `date` is looked up in the
+    batched `matchup_matrix` of the as-of team statistics, then the season is
+    simulated `n_sims` times with `simulate_chunk`, optionally spreading the
+    chunks across a process pool.
+
+    Parameters
+    ----------
+    date : str
+        Simulation date in `YYYY-MM-DD` format. Games before this date are
+        taken from the recorded results.
+    n_sims : int
+        Number of simulated seasons.
+    workers : int
+        Number of worker processes. `1` runs every chunk in-process.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per team with its conference, current record, projected wins
+        and losses, the 10th-90th percentile of the win total and the odds of
+        earning the first seed, a top-6 seed, a play-in spot and a playoff spot.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the schedule or results CSV files cannot be found.
+
+    Notes
+    -----
+    - Results are cached per `(date, n_sims, workers)` and data / model
+      version, so a refresh automatically invalidates them.
+    - The simulation is seeded by date, making repeated runs reproducible.
+    """
+    season: int = season_key(date)
+    team_pos: dict[str, int] = {team: i for i, team in enumerate(teams)}
+
+    # Load the games of the selected season
+    schedule: pd.DataFrame = schedule_store.frame(season)
+    results: pd.DataFrame = results_store.frame(season)
+    results = results[results["date"] < date]
+    schedule = schedule[
+        schedule["home_team"].isin(team_pos) & schedule["away_team"].isin(team_pos)
+    ]
+    results = results[
+        results["home_team"].isin(team_pos) & results["away_team"].isin(team_pos)
+    ]
+    remaining: pd.DataFrame = schedule[schedule["date"] >= date]
+
+    # Wins already recorded (winning_team is 0 for a home win, 1 for an away win)
+    base_wins: np.ndarray = np.zeros(len(teams), dtype=np.float32)
+    np.add.at(
+        base_wins,
+        np.where(
+            results["winning_team"] == 0,
+            results["home_team"].map(team_pos),
+            results["away_team"].map(team_pos),
+        ).astype(np.int64),
+        1,
+    )
+    played: np.ndarray = np.bincount(
+        results["home_team"].map(team_pos).to_numpy(np.int64), minlength=len(teams)
+    ) + np.bincount(
+        results["away_team"].map(team_pos).to_numpy(np.int64), minlength=len(teams)
+    )
+
+    # Every remaining game and play-in pairing is a lookup in the matchup matrix
+    pair_prob: np.ndarray = matchup_matrix(date)
+    home_idx: np.ndarray = remaining["home_team"].map(team_pos).to_numpy(np.int64)
+    away_idx: np.ndarray = remaining["away_team"].map(team_pos).to_numpy(np.int64)
+    home_prob: np.ndarray = pair_prob[home_idx, away_idx].astype(np.float32)
+
+    conference_idx: dict[str, np.ndarray] = {
+        conference: np.array(
+            [team_pos[t] for t in teams if team_conferences[t] == conference]
+        )
+        for conference in ("East", "West")
+    }
+
+    # Split the simulations in chunks, optionally running them in parallel
+    base_seed: int = int(date.replace("-", ""))
+    sizes: list[int] = [
+        min(simulation_chunk_size, n_sims - offset)
+        for offset in range(0, n_sims, simulation_chunk_size)
+    ]
+    args: list[tuple] = [
+        (home_prob, home_idx, away_idx, base_wins, pair_prob, conference_idx, size)
+        for size in sizes
+    ]
+    if workers > 1:
+        chunks: list[dict[str, np.ndarray]] = list(
+            simulation_pool(workers).map(
+                simulate_chunk,
+                *zip(*args),
+                [base_seed + i for i in range(len(sizes))],
+            )
+        )
+    else:
+        chunks: list[dict[str, np.ndarray]] = [
+            simulate_chunk(*a, base_seed + i) for i, a in enumerate(args)
+        ]
+
+    # Reduce the chunks
+    wins_hist: np.ndarray = sum(c["wins_hist"] for c in chunks)
+    seed_hist: np.ndarray = sum(c["seed_hist"] for c in chunks)
+    playoffs: np.ndarray = sum(c["playoffs"] for c in chunks)
+
+    # Summarize the distributions
+    win_values: np.ndarray = np.arange(83)
+    mean_wins: np.ndarray = (wins_hist * win_values).sum(axis=1) / n_sims
+    cdf: np.ndarray = np.cumsum(wins_hist, axis=1) / n_sims
+    total_games: np.ndarray = (
+        played
+        + np.bincount(home_idx, minlength=len(teams))
+        + np.bincount(away_idx, minlength=len(teams))
+    )
+
+    projection: pd.DataFrame = pd.DataFrame(
+        {
+            "team": teams,
+            "conference": [team_conferences[t] for t in teams],
+            "record": [f"{int(w)}-{int(p - w)}" for w, p in zip(base_wins, played)],
+            "wins": mean_wins.round(1),
+            "losses": (total_games - mean_wins).round(1),
+            "wins_p10": (cdf >= 0.1).argmax(axis=1),
+            "wins_p90": (cdf >= 0.9).argmax(axis=1),
+            "first_seed": (seed_hist[:, 1] / n_sims * 100).round(1),
+            "top_six": (seed_hist[:, 1:7].sum(axis=1) / n_sims * 100).round(1),
+            "play_in": (seed_hist[:, 7:11].sum(axis=1) / n_sims * 100).round(1),
+            "playoffs": (playoffs / n_sims * 100).round(1),
+        }
+    )
+    return projection.sort_values(
+        ["conference", "wins"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+# Season projection for the current data and model version
+def project_season(date: str) -> pd.DataFrame:
+    """
+    Return the cached season projection for a date.
+
+    Parameters
+    ----------
+    date : str
+        Simulation date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The per-team projection computed by `simulate_season`.
+    """
+    return simulate_season(date, simulation_runs, simulation_workers)
+
+
+# Redirect to page
+@ui.page("/")
+def redirect() -> None:
+    """
+    Redirect the root page to the current day's games view.
+
+    This page handler automatically navigates users from the application
+    root URL to the page corresponding to today's date.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It performs a client-side
+        navigation using NiceGUI.
+    """
+    ui.navigate.to(default_date())
+
+
+# Home day prediction and stats page template
+@ui.page("/{date}")
+def home(date: str, mode: str = render_mode) -> None:
+    """
+    Render the main home page for a specific date with game predictions and statistics.
+
+    This page displays a split layout with:
+    - A left sidebar containing the app logo, a date picker, and a donation link.
+    - A right main container showing all scheduled games for the selected date,
+      with interactive `GameCard` components and predicted outcomes.
+
+    Users can select a different date using the date picker and update predictions
+    by clicking the "Predict" button.
+
+    Parameters
+    ----------
+    date : str
         The target date in `YYYY-MM-DD` format for which games, predictions,
         and statistics should be displayed.
+    mode : str, optional
+        Rendering mode of the game cards (`?mode=lite` or `?mode=full`).
+        Defaults to `render_mode`.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It renders a full-page UI
+        using NiceGUI.
+
+    Notes
+    -----
+    - Custom CSS is applied to remove default padding and borders and to style
+      containers.
+    - Game predictions and statistics are handled by the `GameList` class.
+    - The date picker is bound to the `games_list.date` attribute to trigger
+      updates when a new date is selected.
+    - External data sources:
+        - Game schedules and stats are sourced from preprocessed CSV files.
+        - Data attribution: Basketball Reference.
+    """
+
+    # Add custom CSS to remove unwanted borders and padding
+    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
+    ui.add_css(".w-1/3, .w-2/3 { border: none; box-shadow: none; }")
+
+    # Styles of the HTML cards, for the mode `GameList` falls back to as well
+    mode = mode if mode in render_modes else render_mode
+    if mode == "lite":
+        ui.add_head_html('<link rel="stylesheet" href="/static/deepshot.css">')
+
+    # Main app logic
+    with ui.element("div").classes("w-full h-full flex"):
+
+        # Creating the 2 containers
+        with ui.element("div").classes(
+            "w-1/3 flex justify-center items-center fixed h-full"
+        ).style("background-color: #333436;"):
+            date_container: ui.element = ui.element("div")
+
+        with ui.element("div").classes("w-2/3 ml-auto h-full overflow-auto p-16").style(
+            "background-color: #5a5f70;"
+        ):
+            cards_container: ui.element = ui.element("div")
+
+        # Rendering the games list
+        with cards_container:
+            games_list: GameList = GameList(date, mode)
+            with ui.column(align_items="center"):
+                games_list.render()
+            subscribe(games_list)
+
+        # Precompute the explanations shown on the details pages of this slate
+        background_tasks.create(run.io_bound(explain_date, date))
+
+        # Warm the cache for the neighbouring dates and the details of this slate
+        prefetcher.visit(date)
+
+        # Creating the date picker, limited to the available seasons
+        start, end = picker_bounds()
+        with date_container:
+            with ui.column(align_items="center"):
+                ui.image("static/logo.svg").classes("mb-2")
+                with ui.link(target="https://www.buymeacoffee.com/saccofrancesco"):
+                    ui.button("Buy me a coffee", icon="coffee").props(
+                        "rounded unelevated no-caps color=yellow-6 text-color=black"
+                    ).classes("w-[250px] text-lg")
+                date_picker: ui.date = (
+                    ui.date(date)
+                    .bind_value_to(games_list, "date")
+                    .style("border-radius: 16px; background-color: #e3e4e6;")
+                    .props(
+                        f"minimal color=orange-14 "
+                        f':options="date => {{const d = new Date(date); '
+                        f"const start = new Date('{start}'); "
+                        f"const end = new Date('{end}'); "
+                        f'return d >= start && d <= end;}}"'
+                    )
+                    .classes("mt-2")
+                )
+
+                ui.button(
+                    "Predict", on_click=lambda: ui.navigate.to(f"/{date_picker.value}")
+                ).props("rounded push size=lg color=orange-14").classes(
+                    "rounded-2xl mt-4"
+                )
+
+                ui.button(
+                    "All matchups",
+                    icon="grid_on",
+                    on_click=lambda: ui.navigate.to(f"/matchups/{date_picker.value}"),
+                ).props("rounded flat color=grey-4").classes("mt-2")
+                ui.button(
+                    "Season simulation",
+                    icon="insights",
+                    on_click=lambda: ui.navigate.to(f"/simulation/{date_picker.value}"),
+                ).props("rounded flat color=grey-4").classes("mt-2")
+                ui.button(
+                    "Power rankings",
+                    icon="leaderboard",
+                    on_click=lambda: ui.navigate.to(f"/rankings/{date_picker.value}"),
+                ).props("rounded flat color=grey-4").classes("mt-2")
+                ui.button(
+                    "Prediction history",
+                    icon="fact_check",
+                    on_click=lambda: ui.navigate.to(f"/history/{date_picker.value}"),
+                ).props("rounded flat color=grey-4").classes("mt-2")
+
+                with ui.row().classes("mt-4 justify-center items-center gap-2"):
+                    ui.label("Data provided by: ").style("color: #e3e4e6;")
+                    ui.link(
+                        "Basketaball Reference", "https://www.basketball-reference.com"
+                    ).style("color: #e3e4e6;")
+
+
+# Rendering cost endpoint
+@app.get("/api/render/stats")
+def render_stats_api() -> dict:
+    """
+    Compare the cost of the card rendering modes on this worker.
+
+    Returns
+    -------
+    dict
+        For each mode, the number of renders (one per client) and cards, and
+        the elements and memory (KiB) created per client and per card, then
+        the elements of the connected clients. Memory is only measured when
+        `DEEPSHOT_TRACE_MEMORY` is set, and is otherwise `None`.
+    """
+    tracing: bool = tracemalloc.is_tracing()
+    modes: dict[str, dict[str, float | None]] = dict()
+    for mode, stats in render_stats.items():
+        renders: int = max(stats["renders"], 1)
+        cards: int = max(stats["cards"], 1)
+        modes[mode] = {
+            "renders": stats["renders"],
+            "cards": stats["cards"],
+            "elements_per_client": round(stats["elements"] / renders, 1),
+            "elements_per_card": round(stats["elements"] / cards, 1),
+            "kib_per_client": (
+                round(stats["bytes"] / renders / 1024, 1) if tracing else None
+            ),
+            "kib_per_card": (
+                round(stats["bytes"] / cards / 1024, 1) if tracing else None
+            ),
+        }
+    return {
+        "modes": modes,
+        "clients": len(Client.instances),
+        "elements": sum(len(client.elements) for client in Client.instances.values()),
+    }
+
+
+# Season simulation page
+@ui.page("/simulation/{date}")
+async def simulation(date: str) -> None:
+    """
+    Render the Monte Carlo projection of the remaining season from a date.
+
+    The page shows, for each conference, the current record of every team,
+    its projected win total with a 10th-90th percentile range, and its odds
+    of finishing first, in the top six, in the play-in and in the playoffs.
+
+    Parameters
+    ----------
+    date : str
+        Simulation date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It renders the UI directly
+        using NiceGUI.
+
+    Notes
+    -----
+    - The simulation runs in a worker thread after the client connects, so
+      the page is served immediately with a spinner.
+    - Results are cached per date and data / model version by `simulate_season`.
+    """
+
+    # Add custom CSS to remove unwanted borders and padding
+    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
+    ui.add_css(".nicegui-content { background-color: #5a5f70; }")
+    ui.add_css(".nicegui-content { align-items: center; }")
+
+    # Back button
+    with ui.page_sticky("top-left", x_offset=32, y_offset=32).classes("mt-8 ml-8"):
+        ui.icon("arrow_back").classes("cursor-pointer text-3xl").style(
+            "color: #e3e4e6"
+        ).on("click", lambda: ui.navigate.to(f"/{date}"))
+
+    # Creating the card for the projection tables
+    with ui.card().classes("m-16 p-10 rounded-2xl shadow-md border w-[1000px]").style(
+        "background-color: #e3e4e6;"
+    ) as card:
+        ui.label(f"Season projection from {date}").classes("text-2xl font-bold")
+        ui.label(f"{simulation_runs:,} simulated seasons").classes("text-md")
+        spinner: ui.spinner = ui.spinner(size="xl", color="orange-14")
+
+    # Run the simulation once the client is connected
+    await ui.context.client.connected()
+    try:
+        projection: pd.DataFrame = await run.io_bound(project_season, date)
+    except FileNotFoundError as e:
+        spinner.delete()
+        with card:
+            ui.label(f"Error: Could not find required files - {e}")
+        return
+    spinner.delete()
+
+    # Table columns
+    columns: list[dict[str, str]] = [
+        {"name": "team", "label": "Team", "field": "team", "align": "left"},
+        {"name": "record", "label": "Record", "field": "record"},
+        {"name": "wins", "label": "Proj. W", "field": "wins"},
+        {"name": "losses", "label": "Proj. L", "field": "losses"},
+        {"name": "range", "label": "W range (10-90%)", "field": "range"},
+        {"name": "first_seed", "label": "#1 seed %", "field": "first_seed"},
+        {"name": "top_six", "label": "Top 6 %", "field": "top_six"},
+        {"name": "play_in", "label": "Play-in %", "field": "play_in"},
+        {"name": "playoffs", "label": "Playoffs %", "field": "playoffs"},
+    ]
+
+    # One table per conference
+    with card:
+        for conference, rows in projection.groupby("conference"):
+            rows: pd.DataFrame = rows.assign(
+                range=rows["wins_p10"].astype(str)
+                + " - "
+                + rows["wins_p90"].astype(str)
+            )
+            ui.label(f"{conference}ern Conference").classes("text-xl font-bold mt-4")
+            ui.table(
+                columns=columns, rows=rows.to_dict("records"), row_key="team"
+            ).props("flat dense hide-bottom").classes("w-full")
+
+
+# All-pairs matchup heatmap page
+@ui.page("/matchups/{date}")
+async def matchups(date: str) -> None:
+    """
+    Render the heatmap of every possible home / away matchup on a date.
+
+    Rows are home teams and columns are away teams; each cell shows the
+    predicted home win probability. Clicking a cell opens the details page
+    of that (possibly unscheduled) matchup.
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It renders the UI directly
+        using NiceGUI.
+
+    Notes
+    -----
+    - The whole grid comes from the cached `matchup_matrix`, so no model call
+      is made per cell. It is computed in a worker thread after the client
+      connects, so the page is served immediately with a spinner.
+
+    Raises
+    ------
+    fastapi.HTTPException
+        With status 404 for an invalid date.
+    """
+    if not is_valid_date(date):
+        raise HTTPException(404, f"Invalid date {date}")
+
+    # Add custom CSS to remove unwanted borders and padding
+    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
+    ui.add_css(".nicegui-content { background-color: #5a5f70; }")
+    ui.add_css(".nicegui-content { align-items: center; }")
+
+    # Back button
+    with ui.page_sticky("top-left", x_offset=32, y_offset=32).classes("mt-8 ml-8"):
+        ui.icon("arrow_back").classes("cursor-pointer text-3xl").style(
+            "color: #e3e4e6"
+        ).on("click", lambda: ui.navigate.to(f"/{date}"))
+
+    with ui.card().classes("m-16 p-6 rounded-2xl shadow-md border w-[1200px]").style(
+        "background-color: #e3e4e6;"
+    ) as card:
+        spinner: ui.spinner = ui.spinner(size="xl", color="orange-14")
+
+    # Heatmap points as [away index, home index, home win %]
+    await ui.context.client.connected()
+    try:
+        probs: np.ndarray = await run.io_bound(matchup_matrix, date)
+    except FileNotFoundError as e:
+        spinner.delete()
+        with card:
+            ui.label(f"Error: Could not find required files - {e}")
+        return
+    spinner.delete()
+    home_idx, away_idx = np.nonzero(~np.isnan(probs))
+    data: list[list[int]] = [
+        [int(a), int(h), round(float(probs[h, a]) * 100)]
+        for h, a in zip(home_idx, away_idx)
+    ]
+
+    # Open the details page of the clicked matchup
+    def open_matchup(e) -> None:
+        home_team, away_team = teams[e.point_y], teams[e.point_x]
+        if home_team != away_team:
+            game: dict = hypothetical_game(home_team, away_team, date)
+            ui.navigate.to(f"/{date}/{quote(json.dumps(game))}")
+
+    # Highcharts heatmap config
+    config: dict = {
+        "chart": {"type": "heatmap", "height": 900, "spacingTop": 25},
+        "title": {"text": f"Home win probability on {date}"},
+        "xAxis": {"categories": teams, "title": {"text": "Away team"}},
+        "yAxis": {
+            "categories": teams,
+            "title": {"text": "Home team"},
+            "reversed": True,
+        },
+        "colorAxis": {
+            "min": 0,
+            "max": 100,
+            "stops": [[0, "#c8102e"], [0.5, "#f7f7f7"], [1, "#007a33"]],
+        },
+        "legend": {"align": "right", "layout": "vertical", "verticalAlign": "middle"},
+        "tooltip": {
+            ":formatter": "function () { return "
+            "`<b>${this.series.yAxis.categories[this.point.y]}</b> vs "
+            "${this.series.xAxis.categories[this.point.x]}: "
+            "<b>${this.point.value} %</b>`; }"
+        },
+        "series": [
+            {
+                "name": "Home win %",
+                "data": data,
+                "borderWidth": 1,
+                "dataLabels": {"enabled": True, "style": {"fontSize": "9px"}},
+            }
+        ],
+    }
+
+    with card:
+        ui.highchart(config, extras=["heatmap"], on_point_click=open_matchup).classes(
+            "w-full rounded-lg"
+        )
+
+
+# All-pairs matchup API endpoint
+@app.get("/api/matchups/{date}")
+def matchups_api(date: str) -> dict:
+    """
+    Return the all-pairs matchup matrix of a date as JSON.
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    dict
+        The date, the data / model version, the team order and the
+        `home_win_prob` matrix, where entry `[i][j]` is the probability that
+        `teams[i]` beats `teams[j]` at home (`null` on the diagonal).
+
+    Raises
+    ------
+    fastapi.HTTPException
+        With status 404 for an invalid date, or a date without stats.
+    """
+    if not is_valid_date(date):
+        raise HTTPException(404, f"Invalid date {date}")
+    try:
+        probs: np.ndarray = matchup_matrix(date)
+    except FileNotFoundError as e:
+        raise HTTPException(404, str(e))
+    return {
+        "date": date,
+        "version": data_version(),
+        "teams": teams,
+        "home_win_prob": [
+            [None if np.isnan(p) else round(float(p), 4) for p in row] for row in probs
+        ],
+    }
+
+
+# Stats of the power rankings (net rating is derived from ortg and drtg)
+ranking_stats: list[str] = ["elo", "ortg", "drtg", "pace"]
+ranking_metrics: dict[str, str] = {"elo": "Elo", "net": "Net rating"}
+
+
+# Build the date x team matrix of some stats over a season
+def season_matrix(season: int, stats: list[str]) -> dict[str, np.ndarray]:
+    """
+    Collect the as-of stats of every team on every date of a season.
+
+    Parameters
+    ----------
+    season : int
+        The season, as returned by `season_key`.
+    stats : list[str]
+        Stat columns to collect.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        `dates` holds the sorted stats dates of the season, and `values` the
+        `(len(dates) + 1, len(teams), len(stats))` matrix of the stats of
+        `teams` in the order of `stats`. Slice `i` holds the most recent stats
+        recorded before `dates[i]` (the last slice holds the stats after the
+        last date), so the stats before any date `d` are
+        `values[searchsorted(dates, d)]`. Teams without stats are `NaN`.
+    """
+    frame: pd.DataFrame = stats_store.frame(season)
+    dates: np.ndarray = np.unique(frame["date"].to_numpy(dtype=str))
+    columns: list[str] = stats_store.columns()[2:]
+    positions: list[int] = [columns.index(stat) for stat in stats]
+    values: np.ndarray = np.full((len(dates) + 1, len(teams), len(stats)), np.nan)
+    if not len(dates):
+        return {"dates": dates, "values": values}
+
+    # Stats carried over from the earlier seasons, then the rows of each date
+    _, seed = team_stats_matrix(teams, dates[0])
+    values[0] = seed[:, positions]
+    partition: SeasonPartition = stats_store.partition(season)
+    team_index: dict[str, int] = {team: i for i, team in enumerate(teams)}
+    known: np.ndarray = frame["team"].isin(team_index).to_numpy()
+    rows: np.ndarray = np.searchsorted(dates, partition.dates[known]) + 1
+    team_rows: np.ndarray = frame["team"][known].map(team_index).to_numpy()
+    values[rows, team_rows] = partition.values[known][:, positions]
+
+    # Carrying every team's last stats forward over the dates it didn't play
+    filled: np.ndarray = np.where(
+        ~np.isnan(values), np.arange(len(values))[:, None, None], 0
+    )
+    np.maximum.accumulate(filled, axis=0, out=filled)
+    values = np.take_along_axis(values, filled, axis=0)
+    return {"dates": dates, "values": values}
+
+
+# Build the date x team matrix of the ranking stats of a season
+@cached("rankings")
+def season_rankings(season: int) -> dict[str, np.ndarray]:
+    """
+    Collect the as-of ranking stats of every team on every date of a season.
+
+    Parameters
+    ----------
+    season : int
+        The season, as returned by `season_key`.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        The `season_matrix` of `ranking_stats`.
+    """
+    return season_matrix(season, ranking_stats)
+
+
+# Rank every team on a date
+def power_rankings(date: str, metric: str = "elo") -> pd.DataFrame:
+    """
+    Rank the teams by Elo or net rating, from the stats before a date.
+
+    Parameters
+    ----------
+    date : str
+        Cutoff date in `YYYY-MM-DD` format.
+    metric : str, optional
+        Ranking metric, a key of `ranking_metrics`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per team with stats, best first: `rank`, `team`, the
+        `ranking_stats`, `net` and the rank change over the previous week.
+    """
+    matrix: dict[str, np.ndarray] = season_rankings(season_key(date))
+    week_ago: str = (
+        datetime.date.fromisoformat(date) - datetime.timedelta(days=7)
+    ).isoformat()
+
+    # Stats slices of the date and of a week before, within the season
+    tables: list[pd.DataFrame] = list()
+    for cutoff in (date, week_ago):
+        table: pd.DataFrame = pd.DataFrame(
+            matrix["values"][np.searchsorted(matrix["dates"], cutoff)],
+            columns=ranking_stats,
+        ).assign(team=teams)
+        table["net"] = table["ortg"] - table["drtg"]
+        table["rank"] = table[metric].rank(ascending=False, method="min")
+        tables.append(table)
+    current, previous = tables
+    current["change"] = previous["rank"] - current["rank"]
+    current = current.dropna(subset=[metric]).sort_values(["rank", "team"])
+    current[["rank", "change"]] = current[["rank", "change"]].astype("Int64")
+    return current[["rank", "team", *ranking_stats, "net", "change"]].round(2)
+
+
+# Power rankings page
+@ui.page("/rankings/{date}")
+def rankings(date: str, by: str = "elo") -> None:
+    """
+    Render the power rankings of every team on a date, and their trajectory
+    over the season.
+
+    Parameters
+    ----------
+    date : str
+        Target date in `YYYY-MM-DD` format.
+    by : str, optional
+        Ranking metric (`?by=elo` or `?by=net`).
+
+    Returns
+    -------
+    None
+        This function does not return a value. It renders the UI directly
+        using NiceGUI.
+
+    Notes
+    -----
+    - Rankings and trajectories are slices of the cached `season_rankings`
+      matrix, so no per-team lookup is made.
+    """
+    by = by if by in ranking_metrics else "elo"
+
+    # Add custom CSS to remove unwanted borders and padding
+    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
+    ui.add_css(".nicegui-content { background-color: #5a5f70; }")
+    ui.add_css(".nicegui-content { align-items: center; }")
+
+    # Back button
+    with ui.page_sticky("top-left", x_offset=32, y_offset=32).classes("mt-8 ml-8"):
+        ui.icon("arrow_back").classes("cursor-pointer text-3xl").style(
+            "color: #e3e4e6"
+        ).on("click", lambda: ui.navigate.to(f"/{date}"))
+
+    try:
+        ranking: pd.DataFrame = power_rankings(date, by)
+        matrix: dict[str, np.ndarray] = season_rankings(season_key(date))
+    except (FileNotFoundError, ValueError) as e:
+        ui.label(f"Error: Could not compute the rankings - {e}").style("color: #e3e4e6")
+        return
+    if ranking.empty:
+        ui.label(f"No stats recorded before {date}").classes("m-16 text-lg").style(
+            "color: #e3e4e6"
+        )
+        return
+
+    # Trajectory of every team up to the date (one point per stats date)
+    end: int = int(np.searchsorted(matrix["dates"], date))
+    values: np.ndarray = matrix["values"][1 : end + 1]
+    trajectory: np.ndarray = (
+        values[:, :, ranking_stats.index("elo")]
+        if by == "elo"
+        else values[:, :, ranking_stats.index("ortg")]
+        - values[:, :, ranking_stats.index("drtg")]
+    )
+    timestamps: list[int] = (
+        matrix["dates"][:end].astype("datetime64[ms]").astype(np.int64).tolist()
+    )
+    series: list[dict] = [
+        {
+            "name": team,
+            "color": team_color_codes[team][0],
+            "data": [
+                [t, None if np.isnan(v) else round(float(v), 2)]
+                for t, v in zip(timestamps, trajectory[:, teams.index(team)])
+            ],
+        }
+        for team in ranking["team"]
+    ]
+
+    with ui.card().classes("m-16 p-10 rounded-2xl shadow-md border w-[1000px]").style(
+        "background-color: #e3e4e6;"
+    ):
+        with ui.row().classes("w-full items-center justify-between"):
+            ui.label(f"Power rankings on {date}").classes("text-2xl font-bold")
+            ui.toggle(
+                ranking_metrics,
+                value=by,
+                on_change=lambda e: ui.navigate.to(f"/rankings/{date}?by={e.value}"),
+            ).props("rounded unelevated toggle-color=orange-14")
+
+        # Season trajectories, best teams first in the legend
+        ui.highchart(
+            {
+                "chart": {"type": "line", "height": 500},
+                "title": {"text": f"{ranking_metrics[by]} over the season"},
+                "xAxis": {"type": "datetime"},
+                "yAxis": {"title": {"text": ranking_metrics[by]}},
+                "plotOptions": {
+                    "series": {"marker": {"enabled": False}, "lineWidth": 1.5}
+                },
+                "legend": {"enabled": False},
+                "tooltip": {"xDateFormat": "%b %d, %Y", "valueDecimals": 2},
+                "series": series,
+            }
+        ).classes("w-full rounded-lg")
+
+        # Rankings table
+        ui.table(
+            columns=[
+                {"name": "rank", "label": "#", "field": "rank", "align": "left"},
+                {"name": "team", "label": "Team", "field": "team", "align": "left"},
+                {"name": "elo", "label": "Elo", "field": "elo"},
+                {"name": "net", "label": "Net rating", "field": "net"},
+                {"name": "ortg", "label": "Off. rating", "field": "ortg"},
+                {"name": "drtg", "label": "Def. rating", "field": "drtg"},
+                {"name": "pace", "label": "Pace", "field": "pace"},
+                {"name": "change", "label": "Rank (7d)", "field": "change"},
+            ],
+            rows=[
+                {
+                    **row,
+                    "change": (
+                        "" if pd.isna(row["change"]) else f"{int(row['change']):+d}"
+                    ),
+                }
+                for row in ranking.astype(object)
+                .where(ranking.notna(), None)
+                .to_dict("records")
+            ],
+            row_key="team",
+        ).props("flat dense hide-bottom").classes("w-full")
+
+
+# Prediction history dashboard
+@ui.page("/history/{date}")
+async def history_page(date: str, model: str = "", season: str = "") -> None:
+    """
+    Render the accuracy of the served predictions against the game results.
+
+    The page shows the accuracy and Brier score of a model over a season,
+    its accuracy over the last `history_window` games, its calibration and
+    the hit rate of the games of each team.
+
+    Parameters
+    ----------
+    date : str
+        Date of the page to go back to, in `YYYY-MM-DD` format. Its season is
+        shown by default.
+    model : str, optional
+        Model version (`?model=`). Defaults to the loaded model.
+    season : str, optional
+        Season (`?season=2025`), or `all`. Defaults to the season of `date`.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It renders the UI directly
+        using NiceGUI.
+
+    Notes
+    -----
+    - New results are joined to the pending predictions before querying.
+    - Every figure comes from aggregate queries on `history`, so the page
+      cost does not depend on the number of recorded predictions.
+    """
+    model = model or model_version
+    season = season or str(season_key(date))
+
+    # Add custom CSS to remove unwanted borders and padding
+    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
+    ui.add_css(".nicegui-content { background-color: #5a5f70; }")
+    ui.add_css(".nicegui-content { align-items: center; }")
+
+    # Back button
+    with ui.page_sticky("top-left", x_offset=32, y_offset=32).classes("mt-8 ml-8"):
+        ui.icon("arrow_back").classes("cursor-pointer text-3xl").style(
+            "color: #e3e4e6"
+        ).on("click", lambda: ui.navigate.to(f"/{date}"))
+
+    # Creating the card of the dashboard
+    with ui.card().classes("m-16 p-10 rounded-2xl shadow-md border w-[1000px]").style(
+        "background-color: #e3e4e6;"
+    ) as card:
+        ui.label("Prediction history").classes("text-2xl font-bold")
+        spinner: ui.spinner = ui.spinner(size="xl", color="orange-14")
+
+    # Query the history once the client is connected
+    await ui.context.client.connected()
+    try:
+        start, end = ("0000-01-01", "9999-12-31")
+        if season != "all":
+            start, end = f"{int(season)}-10-01", f"{int(season) + 1}-09-30"
+        await run.io_bound(history.sync_outcomes)
+        models: list[str] = await run.io_bound(history.models)
+        summary: dict[str, pd.DataFrame] = await run.io_bound(
+            history.summary, model, start, end
+        )
+    except (sqlite3.Error, FileNotFoundError, ValueError) as e:
+        spinner.delete()
+        with card:
+            ui.label(f"Error: Could not read the prediction history - {e}")
+        return
+    spinner.delete()
+
+    # Filters, reloading the page with the selected model and season
+    seasons: dict[str, str] = {"all": "All seasons"} | {
+        str(s): f"{s}-{(s + 1) % 100:02d}" for s in reversed(stats_store.seasons())
+    }
+    with card:
+        with ui.row().classes("w-full gap-4"):
+            ui.select(
+                {
+                    m: f"{m} (current)" if m == model_version else m
+                    for m in sorted({*models, model_version})
+                },
+                value=model,
+                label="Model version",
+                on_change=lambda e: ui.navigate.to(
+                    f"/history/{date}?model={e.value}&season={season}"
+                ),
+            ).classes("w-64")
+            ui.select(
+                seasons,
+                value=season,
+                label="Season",
+                on_change=lambda e: ui.navigate.to(
+                    f"/history/{date}?model={model}&season={e.value}"
+                ),
+            ).classes("w-48")
+
+    daily: pd.DataFrame = summary["daily"]
+    if daily.empty:
+        with card:
+            ui.label("No scored predictions yet for this model and season.").classes(
+                "text-md"
+            )
+        return
+
+    # Overall scores
+    games: int = int(daily["games"].sum())
+    with card:
+        with ui.row().classes("w-full gap-16 text-lg"):
+            ui.label(f"Games: {games:,}")
+            ui.label(f"Accuracy: {daily['hits'].sum() / games * 100:.1f} %").classes(
+                "font-bold"
+            )
+            ui.label(f"Brier score: {daily['brier'].sum() / games:.3f}")
+
+        # Rolling accuracy
+        timestamps: np.ndarray = (
+            daily["date"].to_numpy(dtype="datetime64[ms]").astype(np.int64)
+        )
+        ui.highchart(
+            {
+                "title": {"text": f"Accuracy over the last {history_window} games"},
+                "xAxis": {"type": "datetime"},
+                "yAxis": {"title": {"text": "Accuracy %"}, "min": 0, "max": 100},
+                "legend": {"enabled": False},
+                "series": [
+                    {
+                        "name": "Accuracy %",
+                        "color": "#ff6d00",
+                        "data": [
+                            [int(t), round(a * 100, 1)]
+                            for t, a in zip(timestamps, daily["rolling_accuracy"])
+                        ],
+                    }
+                ],
+            }
+        ).classes("w-full rounded-lg")
+
+        # Calibration (perfect predictions lie on the diagonal)
+        calibration: pd.DataFrame = summary["calibration"]
+        ui.highchart(
+            {
+                "title": {"text": "Calibration"},
+                "xAxis": {
+                    "title": {"text": "Predicted home win %"},
+                    "min": 0,
+                    "max": 100,
+                },
+                "yAxis": {
+                    "title": {"text": "Observed home win %"},
+                    "min": 0,
+                    "max": 100,
+                },
+                "tooltip": {
+                    "pointFormat": "{point.x:.1f} % → {point.y:.1f} % "
+                    "({point.games} games)"
+                },
+                "series": [
+                    {
+                        "name": "Perfect calibration",
+                        "type": "line",
+                        "dashStyle": "Dash",
+                        "color": "#9e9e9e",
+                        "enableMouseTracking": False,
+                        "data": [[0, 0], [100, 100]],
+                    },
+                    {
+                        "name": "Model",
+                        "type": "line",
+                        "color": "#ff6d00",
+                        "data": [
+                            {
+                                "x": round(row.predicted * 100, 1),
+                                "y": round(row.observed * 100, 1),
+                                "games": int(row.games),
+                            }
+                            for row in calibration.itertuples()
+                        ],
+                    },
+                ],
+            }
+        ).classes("w-full rounded-lg")
+
+        # Hit rate of the games of each team
+        ui.label("Hit rate by team").classes("text-xl font-bold mt-4")
+        team_rows: pd.DataFrame = summary["teams"].assign(
+            hit_rate=(summary["teams"]["hit_rate"] * 100).round(1)
+        )
+        ui.table(
+            columns=[
+                {"name": "team", "label": "Team", "field": "team", "align": "left"},
+                {"name": "games", "label": "Games", "field": "games"},
+                {"name": "hit_rate", "label": "Hit rate %", "field": "hit_rate"},
+            ],
+            rows=team_rows.to_dict("records"),
+            row_key="team",
+        ).props("flat dense hide-bottom").classes("w-full")
+
+
+# Number of games prefetched for the H2H plot (the largest selectable window)
+h2h_max_window: int = 25
+
+
+# Get the recent values of every stat for both teams of a matchup
+@cached("h2h")
+def h2h_series(team1: str, team2: str, date: str) -> dict[str, list | dict]:
+    """
+    Return the compact H2H series of every statistic for two teams.
+
+    The last `h2h_max_window` games of each team are extracted once, so any
+    stat and smaller game window can be applied client-side by slicing.
+
+    Parameters
+    ----------
+    team1 : str
+        Name of the first team (home team).
+    team2 : str
+        Name of the second team (away team).
+    date : str
+        Reference date in `YYYY-MM-DD` format. Only games before this date
+        are included.
+
+    Returns
+    -------
+    dict[str, list | dict]
+        `dates` holds the JS timestamps (ms) of each team's games, most recent
+        first, and `stats` maps every statistic to the matching values of
+        both teams. Missing values are `None`.
+    """
+    columns: list[str] = stats_store.columns()[2:]
+    stats: list[str] = [stat for stat in stat_to_full_name_desc if stat in columns]
+    positions: list[int] = [columns.index(stat) for stat in stats]
+
+    dates: list[list[int]] = []
+    values: dict[str, list[list[float | None]]] = {stat: [] for stat in stats}
+    for team in (team1, team2):
+        found: list[tuple[SeasonPartition, np.ndarray]] = stats_store.recent_rows(
+            team, date, h2h_max_window
+        )
+        team_dates: np.ndarray = np.concatenate(
+            [partition.dates[rows] for partition, rows in found] or [np.empty(0, str)]
+        )
+        dates.append((team_dates.astype("datetime64[ms]").astype(np.int64)).tolist())
+
+        # Rounded values keep the payload small, NaN becomes null
+        block: np.ndarray = np.concatenate(
+            [partition.values[rows][:, positions] for partition, rows in found]
+            or [np.empty((0, len(stats)))]
+        ).round(3)
+        for i, stat in enumerate(stats):
+            values[stat].append(
+                [None if np.isnan(v) else float(v) for v in block[:, i]]
+            )
+
+    return {"dates": dates, "stats": values}
+
+
+# Overlays of the H2H plot, selectable smoothing windows (games) and the
+# percentiles of the league band
+h2h_overlay_names: dict[str, str] = {
+    "rolling": "Rolling mean",
+    "ewm": "Exponential average",
+    "mean": "League average",
+    "band": "League percentile band",
+}
+h2h_smoothing_windows: list[int] = [3, 5, 10]
+h2h_band_percentiles: tuple[int, int] = (25, 75)
+
+
+# Summarize the stats of every team on every date of a season
+@cached("league")
+def league_series(season: int) -> dict[str, np.ndarray]:
+    """
+    Return the league average and percentile band of every stat over a season.
+
+    The as-of stats of the season are collected once with `season_matrix`,
+    so every stat and date is served from the same cached summary.
+
+    Parameters
+    ----------
+    season : int
+        The season, as returned by `season_key`.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        `dates` holds the sorted stats dates of the season. `mean`, `low` and
+        `high` are `(len(dates) + 1, n_stats)` matrices of the average and the
+        `h2h_band_percentiles` of the teams' stats, in the order of the stat
+        columns, indexed like the `season_matrix` slices.
+    """
+    columns: list[str] = stats_store.columns()[2:]
+    matrix: dict[str, np.ndarray] = season_matrix(season, columns)
+
+    # Slices where a stat is missing for every team stay NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean: np.ndarray = np.nanmean(matrix["values"], axis=1)
+        low, high = np.nanpercentile(matrix["values"], h2h_band_percentiles, axis=1)
+    return {"dates": matrix["dates"], "mean": mean, "low": low, "high": high}
+
+
+# Get the smoothed series and league context of a team's recent values of a stat
+@cached("overlays")
+def h2h_overlays(
+    team: str, stat: str, window: int, date: str
+) -> dict[str, list[float | None] | list[list[float | None]]]:
+    """
+    Return the overlays of a team's H2H series for one stat.
+
+    The rolling mean is computed with cumulative sums and the exponential
+    average with the `ewm` kernel of pandas, over the team's partition rows,
+    so no DataFrame is scanned when overlays are toggled.
+
+    Parameters
+    ----------
+    team : str
+        Name of the team.
+    stat : str
+        Statistic to smooth.
+    window : int
+        Number of games of the rolling mean, and span of the exponential
+        average.
+    date : str
+        Reference date in `YYYY-MM-DD` format. Only games before this date
+        are included.
+
+    Returns
+    -------
+    dict[str, list[float | None] | list[list[float | None]]]
+        `rolling`, `ewm` and `mean` (the league average on each game date)
+        are aligned with the team's dates of `h2h_series`, most recent first.
+        `band` holds the `[low, high]` league percentiles on the same dates.
+        Missing values are `None`.
+
+    Raises
+    ------
+    ValueError
+        If the stat is not found in the dataset columns.
+    """
+    columns: list[str] = stats_store.columns()[2:]
+    if stat not in columns:
+        raise ValueError(f"'{stat}' not found in dataset columns.")
+    position: int = columns.index(stat)
+
+    # Games shown on the plot, plus enough earlier ones for the exponential
+    # average of the first games to settle (weights below 1e-3 after 4 spans)
+    found: list[tuple[SeasonPartition, np.ndarray]] = stats_store.recent_rows(
+        team, date, h2h_max_window + 4 * window
+    )
+    dates: np.ndarray = np.concatenate(
+        [partition.dates[rows] for partition, rows in found] or [np.empty(0, str)]
+    )[::-1]
+    values: np.ndarray = np.concatenate(
+        [partition.values[rows, position] for partition, rows in found] or [np.empty(0)]
+    )[::-1]
+
+    # Rolling mean of the last `window` games, skipping missing values
+    missing: np.ndarray = np.isnan(values)
+    sums: np.ndarray = np.concatenate(
+        ([0.0], np.cumsum(np.where(missing, 0.0, values)))
+    )
+    counts: np.ndarray = np.concatenate(([0], np.cumsum(~missing)))
+    end: np.ndarray = np.arange(1, len(values) + 1)
+    start: np.ndarray = np.maximum(end - window, 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rolling: np.ndarray = (sums[end] - sums[start]) / (counts[end] - counts[start])
+    ewm: np.ndarray = (
+        pd.Series(values).ewm(span=window, ignore_na=True).mean().to_numpy()
+    )
+
+    # League summary of the season of each date, as of the end of that date
+    league: np.ndarray = np.full((len(dates), 3), np.nan)
+    seasons: np.ndarray = season_keys(dates)
+    for season in np.unique(seasons):
+        summary: dict[str, np.ndarray] = league_series(int(season))
+        rows: np.ndarray = np.flatnonzero(seasons == season)
+        slots: np.ndarray = np.searchsorted(summary["dates"], dates[rows], side="right")
+        league[rows] = np.column_stack(
+            [summary[key][slots, position] for key in ("mean", "low", "high")]
+        )
+
+    # Most recent first, like `h2h_series`, rounded and with NaN as null
+    def listed(array: np.ndarray) -> list:
+        return np.where(np.isnan(array), None, array.round(3))[::-1][
+            :h2h_max_window
+        ].tolist()
+
+    return {
+        "rolling": listed(rolling),
+        "ewm": listed(ewm),
+        "mean": listed(league[:, 0]),
+        "band": listed(league[:, 1:]),
+    }
+
+
+# Overlays endpoint of the static H2H plots
+@app.get("/api/h2h/{date}")
+def h2h_overlays_api(date: str, home: str, away: str, stat: str, window: int) -> dict:
+    """
+    Return the overlays of both teams of a matchup, as used by `H2HPlot`.
+
+    Parameters
+    ----------
+    date : str
+        Reference date in `YYYY-MM-DD` format.
+    home : str
+        Name of the home team.
+    away : str
+        Name of the away team.
+    stat : str
+        Statistic to smooth.
+    window : int
+        Smoothing window, one of `h2h_smoothing_windows`.
+
+    Returns
+    -------
+    dict
+        `teams` holds the `h2h_overlays` of the home then the away team.
+
+    Raises
+    ------
+    fastapi.HTTPException
+        With status 400 for an unknown stat or smoothing window.
+    """
+    if window not in h2h_smoothing_windows or stat not in stat_to_full_name_desc:
+        raise HTTPException(400, "Unknown stat or smoothing window")
+    try:
+        return {
+            "teams": [h2h_overlays(team, stat, window, date) for team in (home, away)]
+        }
+    except (FileNotFoundError, KeyError, ValueError) as e:
+        raise HTTPException(400, str(e))
+
+
+# Background prefetch: parallel jobs (0 disables it), days prefetched around a
+# visited date and pause (seconds) before checking again for active requests
+prefetch_workers: int = int(os.environ.get("DEEPSHOT_PREFETCH_WORKERS", "1"))
+prefetch_radius: int = 1
+prefetch_backoff: float = 0.2
+
+# Number of HTTP requests being served by this worker
+active_requests: int = 0
+
+
+# Count the requests in flight, so the prefetcher yields to them
+@app.middleware("http")
+async def count_requests(request: Request, call_next: Callable) -> Response:
+    """
+    Keep `active_requests` up to date while a request is served.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        The incoming request.
+    call_next : Callable
+        The next handler of the middleware chain.
+
+    Returns
+    -------
+    fastapi.Response
+        The response of the next handler, unchanged.
+    """
+    global active_requests
+    active_requests += 1
+    try:
+        return await call_next(request)
+    finally:
+        active_requests -= 1
+
+
+# Low priority warming of the pages likely to be opened next
+class Prefetcher:
+    def __init__(self, workers: int = prefetch_workers) -> None:
+        """
+        Warm the cache with the results of the likely next navigations.
+
+        Jobs call cached functions in the thread pool, at most `workers` at a
+        time, and only start while no HTTP request is being served. Jobs
+        already queued or running are not queued twice.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Maximum number of jobs running at once. 0 disables the prefetch.
+        """
+        self.workers: int = workers
+        self.semaphore: asyncio.Semaphore | None = None
+        self.pending: set[tuple] = set()
+        self.stats: defaultdict[str, int] = defaultdict(int)
+
+    def submit(self, func: Callable, *args) -> None:
+        """
+        Queue a call of a cached function.
+        """
+        key: tuple = (func.__name__, data_version(), *args)
+        if self.workers <= 0 or key in self.pending:
+            self.stats["skipped"] += 1
+            return
+        self.pending.add(key)
+        self.stats["queued"] += 1
+        background_tasks.create(self.run(key, func, *args), name=f"prefetch {key}")
+
+    async def run(self, key: tuple, func: Callable, *args) -> None:
+        """
+        Run a queued call once the worker is idle.
+        """
+        self.semaphore = self.semaphore or asyncio.Semaphore(self.workers)
+        try:
+            async with self.semaphore:
+                while active_requests:
+                    await asyncio.sleep(prefetch_backoff)
+                await run.io_bound(func, *args)
+            self.stats["done"] += 1
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            self.stats["failed"] += 1
+            print(f"Error: Could not prefetch {func.__name__}{args} - {e}")
+        finally:
+            self.pending.discard(key)
+
+    def visit(self, date: str) -> None:
+        """
+        Prefetch what is likely opened after a date page: the predictions of
+        the neighbouring dates, then the details of the games of the date.
+        """
+        try:
+            start, end = picker_bounds()
+            day: datetime.date = datetime.date.fromisoformat(date)
+            for offset in range(1, prefetch_radius + 1):
+                for step in (offset, -offset):
+                    neighbour: str = (day + datetime.timedelta(days=step)).isoformat()
+                    if start <= neighbour <= end:
+                        self.submit(predict_games, neighbour)
+            for game in predict_games(date):
+                home, away = game["home_team"], game["away_team"]
+                self.submit(h2h_series, home, away, date)
+                self.submit(sensitivity_curves, date, home, away)
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            print(f"Error: Could not prefetch around {date} - {e}")
+
+
+# Prefetcher of this worker
+prefetcher: Prefetcher = Prefetcher()
+
+
+# Cache statistics endpoint
+@app.get("/api/cache/stats")
+def cache_stats() -> dict:
+    """
+    Return the hit / miss counters of the cache of this worker.
+
+    Returns
+    -------
+    dict
+        The worker process id, the shared tier in use, and the number of
+        in-process hits, shared tier hits and misses, followed by the loaded
+        season partitions, their memory and their hit / load / eviction counts,
+        and the counters of the background prefetch.
+    """
+    return {
+        "pid": os.getpid(),
+        "shared": type(cache.shared).__name__ if cache.shared else None,
+        **cache.stats,
+        "partitions": {
+            "loaded": [
+                f"{os.path.basename(d)}/{s}" for d, s, *_ in partition_cache.entries
+            ],
+            "bytes": partition_cache.size,
+            "budget": partition_cache.budget,
+            **partition_cache.stats,
+        },
+        "prefetch": {"pending": len(prefetcher.pending), **prefetcher.stats},
+    }
+
+
+# Build the Highcharts config of a head-to-head chart
+def h2h_chart_config(
+    h2h: dict[str, list | dict],
+    stat: str,
+    window: int,
+    teams: tuple[str, str],
+    colors: tuple[str, str],
+) -> dict:
+    """
+    Build the config of the head-to-head line chart of two teams.
+
+    The config is shared by `H2HPlot` and the game snapshot pages. The full
+    series are embedded under the `deepshot` key, for `deepshotH2H` in
+    `static/deepshot.js` to show another stat, window or overlays in place.
+
+    Parameters
+    ----------
+    h2h : dict[str, list | dict]
+        Head-to-head series, as returned by `h2h_series`.
+    stat : str
+        The statistic shown first.
+    window : int
+        Number of most recent games shown for each team.
+    teams : tuple[str, str]
+        Names of the home and away teams.
+    colors : tuple[str, str]
+        Hex colors of the home and away team lines.
+
+    Returns
+    -------
+    dict
+        The Highcharts options; the percentile band overlay needs the
+        highcharts-more module.
+    """
+    # Generate both series for the selected stat and window
+    series: list[dict[str, str]] = [
+        {
+            "name": team,
+            "data": [
+                list(point)
+                for point in zip(
+                    h2h["dates"][i][:window],
+                    h2h["stats"][stat][i][:window],
+                )
+            ],
+            "color": color,
+        }
+        for i, (team, color) in enumerate(zip(teams, colors))
+    ]
+
+    # Highcharts config with datetime x-axis
+    config: dict[str, dict[str, str]] = {
+        "chart": {
+            "type": "line",
+            "spacingTop": 25,
+            "spacingBottom": 25,
+        },
+        "title": {"text": f"{teams[0]} vs {teams[1]} {stat_to_full_name_desc[stat]}"},
+        "xAxis": {
+            "type": "datetime",
+            "labels": {"format": "{value:%b %d}"},
+        },
+        "yAxis": {"title": {"text": stat_to_full_name_desc[stat]}},
+        "legend": {
+            "layout": "horizontal",
+            "align": "center",
+            "verticalAlign": "top",
+        },
+        "tooltip": {
+            "xDateFormat": "%b %d, %Y",
+            "shared": True,
+        },
+        "series": series,
+        "deepshot": h2h,
+    }
+    return config
+
+
+# Creating the Head-2-Head plot component
+class H2HPlot:
+    def __init__(
+        self,
+        stat: str,
+        date: str,
+        window: int,
+        team1: str,
+        team2: str,
+        home_color: str,
+        away_color: str,
+    ) -> None:
+        """
+        Component to render a head-to-head (H2H) performance plot between two teams.
+
+        This class generates an interactive line chart comparing a specific
+        statistical metric for two teams over their most recent games prior
+        to a selected date. It uses the historical team statistics of
+        `stats_store` and renders the chart with NiceGUI's `ui.highchart`.
+
+        Parameters
+        ----------
+        stat : str
+            The statistical metric to plot (must exist in the CSV columns).
+        date : str
+            Reference date in `YYYY-MM-DD` format. Only games before this
+            date are included in the plot.
+        window : int
+            Number of most recent games shown for each team.
+        team1 : str
+            Name of the first team (home team).
+        team2 : str
+            Name of the second team (away team).
+        home_color : str
+            Hex color code for the first team's plot line.
+        away_color : str
+            Hex color code for the second team's plot line.
+
+        Notes
+        -----
+        - The plot displays up to the last 25 games for each team prior to the
+          specified date.
+        - The x-axis represents game dates, formatted as month/day.
+        - The y-axis shows the selected statistic values.
+        - Series colors are set according to `home_color` and `away_color`.
+        - The series of every stat are sent once with the chart, later stat and
+          window changes only update the existing chart in the browser.
+        - The `overlays` (keys of `h2h_overlay_names`) smoothed over
+          `smoothing` games are computed by `h2h_overlays` and sent with each
+          update.
+        - Raises ValueError if the specified stat is not present in the dataset.
+        """
+
+        # Storing vars for future plot updates
+        self.stat: str = stat
+        self.date: str = date
+        self.window: int = window
+        self.team1: str = team1
+        self.team2: str = team2
+        self.home_color: str = home_color
+        self.away_color: str = away_color
+        self.overlays: list[str] = list()
+        self.smoothing: int = h2h_smoothing_windows[1]
+
+        # Plotting at first component mount
+        self.chart: ui.highchart = self.plot_stat()
+
+    def plot_stat(self) -> ui.highchart:
+        """
+        Render the head-to-head plot.
+
+        Gets the cached series of both teams for every stat before the
+        selected date and configures a Highcharts line chart showing the
+        selected stat and window. The full series are embedded in the chart
+        options, under the `deepshot` key, for `deepshotH2H` to use.
+
+        Returns
+        -------
+        ui.highchart
+            The NiceGUI Highcharts plot component for the H2H comparison.
+
+        Raises
+        ------
+        ValueError
+            If the selected stat is not found in the CSV dataset columns.
+        """
+
+        # Prefetch the series of every stat (served from the shared cache)
+        h2h: dict[str, list | dict] = h2h_series(self.team1, self.team2, self.date)
+        if self.stat not in h2h["stats"]:
+            raise ValueError(f"'{self.stat}' not found in dataset columns.")
+
+        # Line chart of the selected stat and window
+        config: dict = h2h_chart_config(
+            h2h,
+            self.stat,
+            self.window,
+            (self.team1, self.team2),
+            (self.home_color, self.away_color),
+        )
+
+        # The arearange series of the percentile band needs highcharts-more
+        return ui.highchart(options=config, extras=["highcharts-more"]).classes(
+            "rounded-lg"
+        )
+
+    def update_plot(self) -> None:
+        """
+        Show the selected stat, window and overlays on the existing chart.
+
+        Only the stat, window, axis title and the overlays of the selected
+        stat are sent to the browser, where `deepshotH2H` in
+        `static/deepshot.js` slices the prefetched series and updates the
+        chart in place.
+        """
+        overlays: dict[str, list | dict] = {
+            "names": {key: h2h_overlay_names[key] for key in self.overlays},
+            "teams": (
+                [
+                    h2h_overlays(team, self.stat, int(self.smoothing), self.date)
+                    for team in (self.team1, self.team2)
+                ]
+                if self.overlays
+                else []
+            ),
+        }
+        ui.run_javascript(
+            f"deepshotH2H({self.chart.id}, {json.dumps(self.stat)}, "
+            f"{int(self.window)}, {json.dumps(stat_to_full_name_desc[self.stat])}, "
+            f"{json.dumps(overlays)})"
+        )
+
+
+# Build the what-if analysis widget
+def whatif_html(
+    curves: dict[str, list | dict],
+    game: dict[str, str | int | float],
+    home_color: str,
+    away_color: str,
+) -> str:
+    """
+    Build the HTML of the client-side what-if analysis widget.
+
+    The widget embeds the response curves of `sensitivity_curves` and uses
+    native controls whose events are handled by `deepshotWhatIf` in
+    `static/deepshot.js`, so no server round trip happens while sliding.
+
+    Parameters
+    ----------
+    curves : dict[str, list | dict]
+        Response curves, as returned by `sensitivity_curves`.
+    game : dict[str, str | int | float]
+        The game being displayed.
+    home_color : str
+        Hex color of the home team bar.
+    away_color : str
+        Hex color of the away team bar.
+
+    Returns
+    -------
+    str
+        The widget HTML.
+    """
+    stat_options: str = "".join(
+        f'<option value="{escape(stat)}">'
+        f"{escape(stat_to_full_name_desc.get(stat, stat))}</option>"
+        for stat in curves["curves"]
+    )
+    base: float = curves["curves"][stats_tags[0]]["home"][len(curves["shifts"]) // 2]
+    shifts: list[float] = curves["shifts"]
+    return f"""
+<div class="deepshot-whatif flex flex-col gap-3 p-4"
+  data-curves="{escape(json.dumps(curves))}">
+  <div class="flex gap-3 items-center">
+    <select class="border rounded p-1 flex-1"
+      onchange="deepshotWhatIf(this, 'stat', this.value)">{stat_options}</select>
+    <select class="border rounded p-1 flex-1"
+      onchange="deepshotWhatIf(this, 'side', this.value)">
+      <option value="home">{escape(game["home_team"])}</option>
+      <option value="away">{escape(game["away_team"])}</option>
+    </select>
+  </div>
+  <div class="flex gap-3 items-center">
+    <input type="range" class="flex-1" min="{shifts[0]}" max="{shifts[-1]}"
+      step="0.5" value="0" oninput="deepshotWhatIf(this, 'shift', Number(this.value))">
+    <span class="text-sm w-16 text-right" data-role="shift">+0 %</span>
+  </div>
+  <div class="flex justify-between text-md font-bold">
+    <span data-role="home-prob">W {round(base)} %</span>
+    <span data-role="away-prob">W {round(100 - base)} %</span>
+  </div>
+  <div class="flex w-full h-4">
+    <div class="rounded-md mr-1" data-role="home-bar"
+      style="flex: {base}; background-color: {home_color}"></div>
+    <div class="rounded-md ml-1" data-role="away-bar"
+      style="flex: {100 - base}; background-color: {away_color}"></div>
+  </div>
+</div>
+"""
+
+
+# Single game details page
+@ui.page("/{date}/{game}")
+def game(date: str, game: str) -> None:
+    """
+    Render a single game details page with team stats and head-to-head plot.
+
+    This page displays a detailed view for a specific game, including:
+    - Team logos, names, and win probabilities
+    - Visual win probability bars
+    - The top drivers of the prediction, from cached TreeSHAP attributions
+    - Interactive head-to-head (H2H) plot for selectable statistics
+    - A dropdown to select different stats to visualize
+
+    A back button allows users to return to the main date page.
+
+    Parameters
+    ----------
+    date : str
+        The date of the game in `YYYY-MM-DD` format.
+    game : str
+        JSON-encoded string representing the game object with home/away
+        team names, statistics, and prediction probabilities.
+
+    Returns
+    -------
+    None
+        This function does not return a value. It renders the UI directly
+        using NiceGUI.
+
+    Notes
+    -----
+    - The `game` parameter is decoded using `json.loads` after URL unquoting.
+    - Team colors are determined using `get_best_color_pair`.
+    - H2H plots are created with the `H2HPlot` class, allowing interactive
+      selection of statistics to display.
+    - Custom CSS is applied to style the layout, align elements, and set
+      background colors.
+    """
+
+    # Re-converting the game object
+    game: list[dict[str, str | int | float]] = json.loads(unquote(game))
+
+    # Client-side helpers (what-if interpolation)
+    ui.add_head_html('<script src="/static/deepshot.js"></script>')
+
+    # Add custom CSS to remove unwanted borders and padding
+    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
+    ui.add_css(".nicegui-content { display: flex; flex-direction: column; }")
+
+    # Alligning the details card to the center
+    ui.add_css(".nicegui-content { justify-content: center;  align-items: center; }")
+
+    # Customizing the bg color
+    ui.add_css(".nicegui-content { background-color: #5a5f70; }")
+
+    # Back button
+    with ui.page_sticky("top-left", x_offset=32, y_offset=32).classes("mt-8 ml-8"):
+        ui.icon("arrow_back").classes("cursor-pointer text-3xl").style(
+            "color: #e3e4e6"
+        ).on("click", lambda: ui.navigate.to(f"/{date}"))
+
+    # Creating the card fot the games details
+    card: ui.card = (
+        ui.card()
+        .classes("m-4 p-6 rounded-2xl shadow-md border w-[850px]")
+        .style("background-color: #e3e4e6;")
+    )
+
+    # Filling the card
+    with card:
+
+        # Calculating the color for each team
+        home_color, away_color = get_best_color_pair(
+            game["home_team"], game["away_team"]
+        )
+
+        # Row for Team Logos and "VS"
+        with ui.row(align_items="center").classes(
+            "items-center justify-between w-full"
+        ):
+            asset_image(game["home_team"], 112).classes("w-28")
+            asset_image("vs", 48).classes("w-12")
+            asset_image(game["away_team"], 112).classes("w-28")
+
+        # Row for Team Names and Win Probabilities
+        with ui.row(align_items="stretch").classes("justify-between w-full"):
+            with ui.column(align_items="start"):
+                ui.label(game["home_team"]).classes("text-left text-md font-bold")
+                ui.label(f"W {game['home_prob']} %").classes(
+                    f"text-left text-md font-bold"
+                )
+            with ui.column(align_items="end"):
+                ui.label(game["away_team"]).classes("text-right text-md font-bold")
+                ui.label(f"W {game['away_prob']} %").classes(
+                    f"text-right text-md font-bold"
+                )
+
+        # HTML element to create W % bars
+        with ui.element("div").classes("flex w-full h-6"):
+            ui.element("div").style(
+                f"flex: {game['home_prob']}; background-color: {home_color}"
+            ).classes("rounded-md mr-1")
+            ui.element("div").style(
+                f"flex: {game['away_prob']}; background-color: {away_color}"
+            ).classes("rounded-md ml-1")
+
+        # Top drivers of the prediction, from the cached TreeSHAP attributions
+        drivers: list[dict[str, str | float]] = game_drivers(
+            date, game["home_team"], game["away_team"]
+        )
+        if drivers:
+            ui.label("Top drivers").classes("text-md font-bold mt-2")
+            max_impact: float = max(d["impact"] for d in drivers) or 1.0
+            with ui.grid(columns="2fr 3fr 1fr").classes("w-full items-center gap-1"):
+                for driver in drivers:
+                    name: str = stat_to_full_name_desc.get(
+                        driver["stat"], driver["stat"]
+                    )
+                    color: str = (
+                        home_color
+                        if driver["favours"] == game["home_team"]
+                        else away_color
+                    )
+                    ui.label(f"{name} ({driver['team']})").classes("text-sm")
+                    ui.element("div").classes("h-3 rounded-md").style(
+                        f"width: {driver['impact'] / max_impact * 100}%; "
+                        f"background-color: {color}"
+                    )
+                    ui.label(f"→ {driver['favours']}").classes("text-xs text-right")
+
+        # What-if analysis, interpolated client-side from the cached response curves
+        curves: dict[str, list | dict] = sensitivity_curves(
+            date, game["home_team"], game["away_team"]
+        )
+        with ui.expansion("What-if analysis", icon="tune").classes(
+            "w-full bg-gray-100 rounded-2xl"
+        ):
+            ui.html(
+                whatif_html(curves, game, home_color, away_color), sanitize=False
+            ).classes("w-full")
+
+        # Creating the 2 containers for the selection and plotting of a specified stat
+        selectors_section: ui.element = ui.element("div").classes("w-full")
+        plotting_section: ui.element = ui.element("div").classes("w-full")
+
+        # Creating a first plot
+        with plotting_section:
+            plot: H2HPlot = H2HPlot(
+                "pts",
+                date,
+                10,
+                game["home_team"],
+                game["away_team"],
+                home_color,
+                away_color,
+            )
+
+        # Dropdown selectin to choose stats, and used game window, to display for both teams
+        with selectors_section:
+            with ui.grid(columns="1fr 1fr"):
+                ui.select(
+                    stat_to_full_name_desc,
+                    label="Selected a stat:",
+                    value="pts",
+                    with_input=True,
+                    on_change=plot.update_plot,
+                ).style("border-radius: 0.25rem;").classes("w-full").props(
+                    "outlined color=grey-9  bg-color=grey-2"
+                ).bind_value_to(
+                    plot, "stat"
+                )
+                ui.select(
+                    [n for n in range(5, 26)],
+                    value=10,
+                    label="Selected a game window:",
+                    with_input=True,
+                    on_change=plot.update_plot,
+                ).style("border-radius: 0.25rem;").classes("w-full").props(
+                    "outlined color=grey-9  bg-color=grey-2"
+                ).bind_value_to(
+                    plot, "window"
+                )
+                ui.select(
+                    h2h_overlay_names,
+                    label="Overlays:",
+                    value=[],
+                    multiple=True,
+                    on_change=plot.update_plot,
+                ).style("border-radius: 0.25rem;").classes("w-full").props(
+                    "outlined use-chips color=grey-9  bg-color=grey-2"
+                ).bind_value_to(
+                    plot, "overlays"
+                )
+                ui.select(
+                    h2h_smoothing_windows,
+                    value=plot.smoothing,
+                    label="Smoothing window:",
+                    on_change=plot.update_plot,
+                ).style("border-radius: 0.25rem;").classes("w-full").props(
+                    "outlined color=grey-9  bg-color=grey-2"
+                ).bind_value_to(
+                    plot, "smoothing"
+                )
+
+
+# Directory of the exported static snapshots and their HTTP cache lifetime
+snapshots_directory: str = os.environ.get("DEEPSHOT_SNAPSHOTS", "./snapshots")
+snapshot_max_age: int = 24 * 60 * 60
+
+# Highcharts build loaded by the game snapshots (the one of nicegui-highcharts)
+snapshot_highcharts_url: str = "https://code.highcharts.com/12.4.0"
+
+
+# Get the file name of a game snapshot
+def game_slug(home_team: str, away_team: str) -> str:
+    """
+    Return the URL and file system safe name of a matchup.
+
+    Parameters
+    ----------
+    home_team : str
+        Name of the home team.
+    away_team : str
+        Name of the away team.
 
     Returns
     -------
-    None
-        This function does not return a value. It renders a full-page UI
-        using NiceGUI.
+    str
+        The matchup name, e.g. `boston-celtics_new-york-knicks`.
+    """
+    return f"{home_team}_{away_team}".lower().replace(" ", "-")
 
-    Notes
-    -----
-    - Custom CSS is applied to remove default padding and borders and to style
-      containers.
-    - Game predictions and statistics are handled by the `GameList` class.
-    - The date picker is bound to the `games_list.date` attribute to trigger
-      updates when a new date is selected.
-    - External data sources:
-        - Game schedules and stats are sourced from preprocessed CSV files.
-        - Data attribution: Basketball Reference.
+
+# Build the logos, names and win probability bars of a matchup
+def matchup_html(
+    game: dict[str, str | int | float],
+    logo_width: int,
+    vs_width: int,
+    home_color: str,
+    away_color: str,
+) -> str:
     """
+    Build the HTML of the header shared by game cards and details pages.
 
-    # Add custom CSS to remove unwanted borders and padding
-    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
-    ui.add_css(".w-1/3, .w-2/3 { border: none; box-shadow: none; }")
+    Parameters
+    ----------
+    game : dict[str, str | int | float]
+        The game, with team names and win probabilities.
+    logo_width : int
+        Displayed width of the team logos in CSS pixels.
+    vs_width : int
+        Displayed width of the "VS" image in CSS pixels.
+    home_color : str
+        Hex color of the home team bar.
+    away_color : str
+        Hex color of the away team bar.
 
-    # Main app logic
-    with ui.element("div").classes("w-full h-full flex"):
+    Returns
+    -------
+    str
+        The header HTML.
+    """
+    home: str = escape(game["home_team"])
+    away: str = escape(game["away_team"])
+    logos: str = "".join(
+        asset_picture(name, width, f"width: {width}px")
+        for name, width in (
+            (game["home_team"], logo_width),
+            ("vs", vs_width),
+            (game["away_team"], logo_width),
+        )
+    )
+    return f"""
+<div class="flex items-center justify-between w-full">{logos}</div>
+<div class="flex justify-between w-full text-lg font-bold">
+  <div class="flex flex-col items-start">
+    <span>{home}</span><span>W {game["home_prob"]} %</span>
+  </div>
+  <div class="flex flex-col items-end">
+    <span>{away}</span><span>W {game["away_prob"]} %</span>
+  </div>
+</div>
+<div class="flex w-full h-6">
+  <div class="rounded-md mr-1"
+    style="flex: {game["home_prob"]}; background-color: {home_color}"></div>
+  <div class="rounded-md ml-1"
+    style="flex: {game["away_prob"]}; background-color: {away_color}"></div>
+</div>
+"""
+
+
+# Build a game card as plain HTML
+def game_card_html(game: dict[str, str | int | float], date: str) -> str:
+    """
+    Build the HTML equivalent of a `GameCard`.
 
-        # Creating the 2 containers
-        with ui.element("div").classes(
-            "w-1/3 flex justify-center items-center fixed h-full"
-        ).style("background-color: #333436;"):
-            date_container: ui.element = ui.element("div")
+    The card only relies on native elements: the details button is a link and
+    the "Click for more" section is a `<details>` element, so it needs no
+    server round trip and can be served as a static page.
 
-        with ui.element("div").classes("w-2/3 ml-auto h-full overflow-auto p-16").style(
-            "background-color: #5a5f70;"
-        ):
-            cards_container: ui.element = ui.element("div")
+    Parameters
+    ----------
+    game : dict[str, str | int | float]
+        The game, as returned by `predict_games`.
+    date : str
+        Game date in `YYYY-MM-DD` format, used for the details link.
 
-        # Rendering the games list
-        with cards_container:
-            games_list: GameList = GameList(date)
-            with ui.column(align_items="center"):
-                games_list.render()
+    Returns
+    -------
+    str
+        The card HTML, styled by `static/deepshot.css`.
+    """
+    home_color, away_color = get_best_color_pair(game["home_team"], game["away_team"])
+
+    # Stats comparison rows, highlighted like in `GameCard`
+    rows: str = ""
+    for stat in stats_tags:
+        home, away = game[f"home_{stat}"], game[f"away_{stat}"]
+        home_class: str = stat_highlight(float(home), float(away), stat)
+        away_class: str = stat_highlight(float(away), float(home), stat)
+        rows += (
+            f'<span class="text-left {home_class}">{home}</span>'
+            f'<span class="text-center font-bold">'
+            f"{escape(stat_to_full_name_desc[stat])}</span>"
+            f'<span class="text-right {away_class}">{away}</span>'
+        )
+    return f"""
+<div class="deepshot-card flex flex-col gap-4 m-4 p-10 rounded-2xl shadow-md border"
+  style="width: 650px">
+  {matchup_html(game, 128, 64, home_color, away_color)}
+  <div class="flex justify-center w-full">
+    <a class="deepshot-button" href="/{date}/{quote(json.dumps(game))}">Details</a>
+  </div>
+  <details class="w-full shadow-md bg-gray-100 rounded-2xl overflow-hidden">
+    <summary class="text-md font-bold text-center p-3">Click for more</summary>
+    <div class="grid w-full p-4 gap-1 text-sm"
+      style="grid-template-columns: 1fr 3.5fr 1fr">{rows}</div>
+  </details>
+</div>
+"""
+
+
+# Wrap a snapshot body into a standalone page
+def snapshot_page(body: str, scripts: tuple[str, ...] = ()) -> str:
+    """
+    Build a standalone HTML page around a snapshot body.
 
-        # Creating the date picker
-        with date_container:
-            with ui.column(align_items="center"):
-                ui.image("static/logo.svg").classes("mb-2")
-                with ui.link(target="https://www.buymeacoffee.com/saccofrancesco"):
-                    ui.image(
-                        "https://img.buymeacoffee.com/button-api/?text=Buy me a coffee&emoji=☕&slug=saccofrancesco&button_colour=FFDD00&font_colour=000000&font_family=Cookie&outline_colour=000000&coffee_colour=ffffff"
-                    ).classes("w-[250px]")
-                date_picker: ui.date = (
-                    ui.date(date)
-                    .bind_value_to(games_list, "date")
-                    .style("border-radius: 16px; background-color: #e3e4e6;")
-                    .props(
-                        '''minimal color=orange-14 :options="date => {const d = new Date(date); const start = new Date('2025-10-20'); const end = new Date('2026-04-12'); return d >= start && d <= end;}"'''
+    Parameters
+    ----------
+    body : str
+        The page content.
+    scripts : tuple[str, ...], optional
+        URLs of the scripts the page needs on top of `static/deepshot.js`.
+
+    Returns
+    -------
+    str
+        The complete HTML document, using the shared stylesheet and scripts.
+    """
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>Deepshot AI</title>
+  <link rel="icon" href="/static/icon.png">
+  <link rel="stylesheet" href="/static/deepshot.css">
+  {"".join(f'<script src="{url}"></script>' for url in scripts)}
+  <script src="/static/deepshot.js"></script>
+</head>
+<body>{body}</body>
+</html>
+"""
+
+
+# Build the snapshot of a date page
+def date_snapshot_html(date: str, games: list[dict[str, str | int | float]]) -> str:
+    """
+    Build the static version of the `home` page of a date.
+
+    Parameters
+    ----------
+    date : str
+        The date in `YYYY-MM-DD` format.
+    games : list[dict[str, str | int | float]]
+        The predictions of the date, as returned by `predict_games`.
+
+    Returns
+    -------
+    str
+        The complete HTML document.
+    """
+    cards: str = "".join(game_card_html(game, date) for game in games)
+    start, end = picker_bounds()
+    return snapshot_page(f"""
+<div class="deepshot-sidebar flex flex-col items-center justify-center gap-4">
+  <img src="/static/logo.svg" alt="DeepShot" style="width: 250px">
+  <a class="deepshot-button deepshot-coffee"
+    href="https://www.buymeacoffee.com/saccofrancesco">Buy me a coffee</a>
+  <form class="flex flex-col items-center gap-4"
+    onsubmit="location.href = '/' + this.date.value; return false;">
+    <input type="date" name="date" value="{date}" min="{start}" max="{end}">
+    <button class="deepshot-button deepshot-predict" type="submit">Predict</button>
+  </form>
+  <a class="deepshot-link" href="/matchups/{date}">All matchups</a>
+  <a class="deepshot-link" href="/simulation/{date}">Season simulation</a>
+  <a class="deepshot-link" href="/rankings/{date}">Power rankings</a>
+  <a class="deepshot-link" href="/history/{date}">Prediction history</a>
+  <span>Data provided by: <a class="deepshot-link"
+    href="https://www.basketball-reference.com">Basketaball Reference</a></span>
+</div>
+<div class="deepshot-main flex flex-col items-center">{cards}</div>
+""")
+
+
+# Build the snapshot of a game details page
+def game_snapshot_html(
+    date: str,
+    game: dict[str, str | int | float],
+    drivers: list[dict[str, str | float]],
+    curves: dict[str, list | dict],
+    h2h: dict[str, list | dict],
+) -> str:
+    """
+    Build the static version of the `game` details page.
+
+    The head-to-head chart uses the `h2h_chart_config` of `H2HPlot` and is
+    updated in place by `deepshotH2H` in `static/deepshot.js`, through
+    `deepshotH2HControl`. Its overlays are fetched from `h2h_overlays_api`
+    when selected.
+
+    Parameters
+    ----------
+    date : str
+        The date in `YYYY-MM-DD` format.
+    game : dict[str, str | int | float]
+        The game, as returned by `predict_games`.
+    drivers : list[dict[str, str | float]]
+        The top drivers of the prediction, as returned by `game_drivers`.
+    curves : dict[str, list | dict]
+        Response curves, as returned by `sensitivity_curves`.
+    h2h : dict[str, list | dict]
+        Head-to-head series, as returned by `h2h_series`.
+
+    Returns
+    -------
+    str
+        The complete HTML document.
+    """
+    home_color, away_color = get_best_color_pair(game["home_team"], game["away_team"])
+
+    # Top drivers of the prediction
+    drivers_html: str = ""
+    if drivers:
+        max_impact: float = max(d["impact"] for d in drivers) or 1.0
+        drivers_html = '<span class="text-md font-bold">Top drivers</span>'
+        drivers_html += (
+            '<div class="grid w-full items-center gap-1 text-sm" '
+            'style="grid-template-columns: 2fr 3fr 1fr">'
+        )
+        for driver in drivers:
+            color: str = (
+                home_color if driver["favours"] == game["home_team"] else away_color
+            )
+            name: str = stat_to_full_name_desc.get(driver["stat"], driver["stat"])
+            drivers_html += (
+                f'<span>{escape(name)} ({escape(driver["team"])})</span>'
+                f'<div class="h-3 rounded-md" style="width: '
+                f'{driver["impact"] / max_impact * 100}%; background-color: {color}">'
+                f"</div>"
+                f'<span class="text-right">→ {escape(driver["favours"])}</span>'
+            )
+        drivers_html += "</div>"
+
+    # Head-to-head plot controls
+    stat_options: str = "".join(
+        f'<option value="{escape(stat)}"{" selected" if stat == "pts" else ""}>'
+        f"{escape(stat_to_full_name_desc[stat])}</option>"
+        for stat in h2h["stats"]
+    )
+    window_options: str = "".join(
+        f'<option value="{n}"{" selected" if n == 10 else ""}>{n}</option>'
+        for n in range(5, h2h_max_window + 1)
+    )
+    overlay_boxes: str = "".join(
+        f'<label class="flex items-center gap-1">'
+        f'<input type="checkbox" name="overlay" value="{key}" '
+        f"onchange=\"deepshotH2HControl(this, 'overlays')\">{escape(name)}</label>"
+        for key, name in h2h_overlay_names.items()
+    )
+    smoothing_options: str = "".join(
+        f'<option value="{n}"{" selected" if n == h2h_smoothing_windows[1] else ""}>'
+        f"{n} games</option>"
+        for n in h2h_smoothing_windows
+    )
+    config: dict = h2h_chart_config(
+        h2h,
+        "pts",
+        10,
+        (game["home_team"], game["away_team"]),
+        (home_color, away_color),
+    )
+    labels: dict[str, str] = {
+        stat: stat_to_full_name_desc[stat] for stat in h2h["stats"]
+    }
+    return snapshot_page(
+        f"""
+<a class="deepshot-back" href="/{date}" aria-label="Back">←</a>
+<div class="deepshot-main flex flex-col items-center">
+  <div class="deepshot-card flex flex-col gap-4 m-4 p-6 rounded-2xl shadow-md border"
+    style="width: 850px">
+    {matchup_html(game, 112, 48, home_color, away_color)}
+    {drivers_html}
+    <details class="w-full bg-gray-100 rounded-2xl">
+      <summary class="text-md font-bold p-3">What-if analysis</summary>
+      {whatif_html(curves, game, home_color, away_color)}
+    </details>
+    <div class="deepshot-h2h flex flex-col gap-3 w-full"
+      data-config="{escape(json.dumps(config))}"
+      data-labels="{escape(json.dumps(labels))}"
+      data-overlays="{escape(json.dumps(h2h_overlay_names))}"
+      data-teams="{escape(json.dumps([game["home_team"], game["away_team"]]))}"
+      data-date="{date}">
+      <div class="flex gap-3">
+        <select class="border rounded p-1 flex-1"
+          onchange="deepshotH2HControl(this, 'stat', this.value)">{stat_options}</select>
+        <select class="border rounded p-1 flex-1"
+          onchange="deepshotH2HControl(this, 'window', Number(this.value))">
+          {window_options}
+        </select>
+      </div>
+      <div class="flex flex-wrap items-center gap-3 text-sm">
+        {overlay_boxes}
+        <select class="border rounded p-1"
+          onchange="deepshotH2HControl(this, 'smoothing', Number(this.value))">
+          {smoothing_options}
+        </select>
+      </div>
+      <div class="rounded-lg" data-role="chart"></div>
+    </div>
+  </div>
+</div>
+<script>
+  document.querySelectorAll(".deepshot-h2h").forEach(deepshotH2HChart);
+</script>
+""",
+        (
+            f"{snapshot_highcharts_url}/highcharts.js",
+            f"{snapshot_highcharts_url}/highcharts-more.js",
+        ),
+    )
+
+
+# Fingerprint the model and the seasons the pages of a date are built from
+def snapshot_version(date: str) -> str:
+    """
+    Compute the version of the snapshot bundle of a date.
+
+    The pages of a date only depend on the model and on the stats, schedule
+    and results of the seasons up to the one of the date. The version is made
+    of `model_version` and of the manifest build and per-season `version`
+    counters of those seasons in every store of `versioned_stores`, so rows
+    appended to a later season keep the snapshots of earlier dates valid.
+
+    Parameters
+    ----------
+    date : str
+        The date in `YYYY-MM-DD` format.
+
+    Returns
+    -------
+    str
+        A 12 characters hexadecimal fingerprint.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a store has neither a source file nor partitions.
+    """
+    season: int = season_key(date)
+    digest = hashlib.sha1(f"{model_version};".encode())
+    for store in versioned_stores:
+        manifest: dict = store.manifest()
+        digest.update(f"{store.directory}:{manifest['built']};".encode())
+        for key, entry in manifest["seasons"].items():
+            if int(key) <= season:
+                digest.update(f"{key}:{entry.get('version', 0)};".encode())
+    return digest.hexdigest()[:12]
+
+
+# Export the static snapshots of the date picker range
+def export_snapshots(
+    start: str | None = None, end: str | None = None, target: str = snapshots_directory
+) -> None:
+    """
+    Pre-render every date and game details page of a date range.
+
+    For each date, the page HTML (`index.html`) and its predictions
+    (`games.json`) are written, and for each game its details page
+    (`<slug>.html`) and the data behind it (`<slug>.json`). Bundles are
+    written to `<target>/<snapshot version>/<date>/`, keyed by the
+    `snapshot_version` of their own date, so a data or model update never
+    serves stale pages: `serve_snapshots` only uses a bundle while the
+    version of its date is unchanged.
+
+    Parameters
+    ----------
+    start : str | None, optional
+        First date to export, in `YYYY-MM-DD` format. Defaults to the first
+        date of the date picker.
+    end : str | None, optional
+        Last date to export, in `YYYY-MM-DD` format. Defaults to the last
+        date of the date picker.
+    target : str, optional
+        Snapshots root directory. Defaults to `snapshots_directory`.
+
+    Notes
+    -----
+    - The export is written to a temporary directory and then moved in place
+      date by date, and the bundles whose version is no longer the one of
+      their date are removed.
+    - Pages reference `/static` and `/assets`, which must be served next to
+      them when they are put behind a CDN.
+    """
+    first, last = picker_bounds()
+    partial: str = os.path.join(target, ".partial")
+    shutil.rmtree(partial, ignore_errors=True)
+
+    exported_dates: int = 0
+    exported_games: int = 0
+    for day in pd.date_range(start or first, end or last):
+        date: str = day.strftime("%Y-%m-%d")
+        version: str = snapshot_version(date)
+        games: list[dict[str, str | int | float]] = predict_games(date)
+        if not games:
+            continue
+
+        # Attributions of the whole slate are computed in one batch
+        explain_date(date)
+
+        directory: str = os.path.join(partial, version, date)
+        os.makedirs(directory)
+        with open(os.path.join(directory, "index.html"), "w") as f:
+            f.write(date_snapshot_html(date, games))
+        with open(os.path.join(directory, "games.json"), "w") as f:
+            json.dump({"date": date, "version": version, "games": games}, f)
+
+        for game in games:
+            home, away = game["home_team"], game["away_team"]
+            bundle: dict = {
+                "date": date,
+                "version": version,
+                "game": game,
+                "drivers": game_drivers(date, home, away),
+                "curves": sensitivity_curves(date, home, away),
+                "h2h": h2h_series(home, away, date),
+            }
+            slug: str = game_slug(home, away)
+            with open(os.path.join(directory, f"{slug}.html"), "w") as f:
+                f.write(
+                    game_snapshot_html(
+                        date, game, bundle["drivers"], bundle["curves"], bundle["h2h"]
                     )
-                    .classes("mt-2")
                 )
+            with open(os.path.join(directory, f"{slug}.json"), "w") as f:
+                json.dump(bundle, f)
+            exported_games += 1
+        exported_dates += 1
+
+    # Publishing the new bundles date by date
+    os.makedirs(partial, exist_ok=True)
+    for version in os.listdir(partial):
+        for date in os.listdir(os.path.join(partial, version)):
+            output: str = os.path.join(target, version, date)
+            shutil.rmtree(output, ignore_errors=True)
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+            os.replace(os.path.join(partial, version, date), output)
+    shutil.rmtree(partial)
+
+    # Removing the bundles of dates whose data or model changed since
+    for version in os.listdir(target):
+        if not os.path.isdir(os.path.join(target, version)):
+            continue
+        for date in os.listdir(os.path.join(target, version)):
+            if snapshot_version(date) != version:
+                shutil.rmtree(os.path.join(target, version, date))
+        if not os.listdir(os.path.join(target, version)):
+            os.rmdir(os.path.join(target, version))
+    print(f"Exported {exported_dates} dates and {exported_games} games to {target}")
+
+
+# Serving the exported JSON bundles (versioned paths, so they never change)
+if os.path.isdir(snapshots_directory):
+    app.add_static_files("/snapshots", snapshots_directory, max_cache_age=31536000)
+
+
+# Serve the snapshots of past dates instead of building live pages
+@app.middleware("http")
+async def serve_snapshots(request: Request, call_next: Callable) -> Response:
+    """
+    Answer date and game pages of past dates with their exported snapshot.
 
-                ui.button(
-                    "Predict", on_click=lambda: ui.navigate.to(f"/{date_picker.value}")
-                ).props("rounded push size=lg color=orange-14").classes(
-                    "rounded-2xl mt-4"
+    A snapshot is only used while the `snapshot_version` of its date is the
+    one it was exported under; any other request, or a missing snapshot,
+    falls through to the live NiceGUI pages.
+    """
+    if request.method != "GET":
+        return await call_next(request)
+
+    # Matching `/{date}` and `/{date}/{game}` paths of past dates only
+    parts: list[str] = request.scope["path"].split("/", 2)
+    date: str = parts[1]
+    try:
+        if datetime.date.fromisoformat(date) >= datetime.date.today():
+            return await call_next(request)
+    except ValueError:
+        return await call_next(request)
+
+    if len(parts) == 2 or not parts[2]:
+        name: str = "index.html"
+    else:
+        try:
+            game: dict[str, str | int | float] = json.loads(unquote(parts[2]))
+            name: str = f"{game_slug(game['home_team'], game['away_team'])}.html"
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return await call_next(request)
+
+    try:
+        version: str = snapshot_version(date)
+    except FileNotFoundError:
+        return await call_next(request)
+
+    # Team names come from the URL, so the file must stay inside the snapshot
+    root: str = os.path.realpath(os.path.join(snapshots_directory, version, date))
+    path: str = os.path.realpath(os.path.join(root, name))
+    if os.path.dirname(path) != root or not os.path.isfile(path):
+        return await call_next(request)
+    return FileResponse(
+        path, headers={"Cache-Control": f"public, max-age={snapshot_max_age}"}
+    )
+
+
+# Ingestion feed: source (a JSON feed or Basketball-Reference), base URL, parallel
+# requests, request rate (per second), retries, passes over the box scores of a
+# date (the failed games are fetched again) and refresh interval (seconds) of
+# the background service
+ingest_source: str = os.environ.get("DEEPSHOT_INGEST_SOURCE", "feed")
+ingest_url: str = os.environ.get("DEEPSHOT_INGEST_URL", "")
+ingest_concurrency: int = int(os.environ.get("DEEPSHOT_INGEST_CONCURRENCY", "4"))
+ingest_rate: float = float(os.environ.get("DEEPSHOT_INGEST_RATE", "2"))
+ingest_retries: int = 4
+ingest_game_passes: int = 2
+ingest_interval: float = 15 * 60
+
+# Ingestion locks: the background service only runs in the worker process holding
+# the leader lock, and ingestions (service or command line) run one at a time
+ingest_leader_lock: FileLock = file_lock(
+    os.path.join(partitions_directory, "ingest-leader.lock")
+)
+ingest_lock: FileLock = file_lock(os.path.join(partitions_directory, "ingest.lock"))
+
+# Parameters of the averaging pipeline (`data/averager.ipynb`), mirrored by the
+# incremental updates of the stats
+average_window: int = 25
+average_weights: tuple[float, float] = (0.3, 0.7)  # Rolling mean, EWMA
+elo_config: dict[str, float] = {
+    "base_rating": 1500.0,
+    "k_factor": 20.0,
+    "home_advantage": 65.0,
+    "carry_over": 0.75,
+    "min_margin": 1.0,
+}
+
+
+# Rate limiter shared by the requests of a feed client
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """
+        Allow on average `rate` acquisitions per second, in bursts of `capacity`.
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self.updated: float = time.monotonic()
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        async with self.lock:
+            while True:
+                now: float = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
                 )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
-                with ui.row().classes("mt-4 justify-center items-center gap-2"):
-                    ui.label("Data provided by: ").style("color: #e3e4e6;")
-                    ui.link(
-                        "Basketaball Reference", "https://www.basketball-reference.com"
-                    ).style("color: #e3e4e6;")
 
+# Get the file of a recorded feed response
+def fixture_path(directory: str, path: str, params: dict[str, str]) -> str:
+    """
+    Return the fixture file of a feed request, e.g. `schedule/2026-02-01.json`.
 
-# Creating the Head-2-Head plot component
-class H2HPlot:
+    Parameters
+    ----------
+    directory : str
+        Root directory of the fixtures.
+    path : str
+        Request path, e.g. `/schedule` or `/boxscore/<game id>`.
+    params : dict[str, str]
+        Query parameters, whose values are appended to the path.
+
+    Returns
+    -------
+    str
+        The fixture path.
+    """
+    parts: list[str] = [part for part in path.split("/") if part]
+    return os.path.join(directory, *parts, *map(str, params.values())) + ".json"
+
+
+# Async HTTP client of the game data feed
+class FeedClient:
     def __init__(
         self,
-        stat: str,
-        date: str,
-        window: int,
-        team1: str,
-        team2: str,
-        home_color: str,
-        away_color: str,
-        csv_path: str,
+        base_url: str = ingest_url,
+        concurrency: int = ingest_concurrency,
+        rate: float = ingest_rate,
+        retries: int = ingest_retries,
+        record: str | None = None,
     ) -> None:
         """
-        Component to render a head-to-head (H2H) performance plot between two teams.
+        Pooled, rate limited and retrying client of the game data feed.
 
-        This class generates an interactive line chart comparing a specific
-        statistical metric for two teams over their most recent games prior
-        to a selected date. It uses historical game data from a CSV file
-        and renders the chart with NiceGUI's `ui.highchart`.
+        The feed serves JSON documents:
+        - `GET /schedule?date=YYYY-MM-DD`: `{"date", "games": [{"game_id",
+          "home_team", "away_team", "status"}]}`, where `status` is `final`
+          once the game was played.
+        - `GET /boxscore/<game id>`: `{"game_id", "date", "home_team",
+          "away_team", "teams": {<team>: {<stat>: value}}}`, with the team
+          stats of the game under the game logs column names.
 
         Parameters
         ----------
-        stat : str
-            The statistical metric to plot (must exist in the CSV columns).
-        date : str
-            Reference date in `YYYY-MM-DD` format. Only games before this
-            date are included in the plot.
-        team1 : str
-            Name of the first team (home team).
-        team2 : str
-            Name of the second team (away team).
-        home_color : str
-            Hex color code for the first team's plot line.
-        away_color : str
-            Hex color code for the second team's plot line.
-        csv_path : str
-            Path to the CSV file containing historical team statistics.
+        base_url : str, optional
+            Base URL of the feed. Defaults to `DEEPSHOT_INGEST_URL`.
+        concurrency : int, optional
+            Maximum number of requests in flight, which is also the size of
+            the connection pool.
+        rate : float, optional
+            Maximum average number of requests per second.
+        retries : int, optional
+            Number of retries of failed requests (connection errors, 429 and
+            5xx responses), with exponential backoff.
+        record : str | None, optional
+            Directory where every response is saved as a fixture, to be
+            replayed offline with `serve_fixtures`.
 
         Notes
         -----
-        - The plot displays up to the last 25 games for each team prior to the
-          specified date.
-        - The x-axis represents game dates, formatted as month/day.
-        - The y-axis shows the selected statistic values.
-        - Series colors are set according to `home_color` and `away_color`.
-        - Raises ValueError if the specified stat is not present in the dataset.
+        - Use as an async context manager, which opens and closes the pool.
         """
+        self.base_url: str = base_url
+        self.concurrency: int = concurrency
+        self.retries: int = retries
+        self.record: str | None = record
+        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        self.bucket: TokenBucket = TokenBucket(rate)
+        self.client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "FeedClient":
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+            timeout=httpx.Timeout(10.0),
+            headers={"User-Agent": "deepshot"},
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.client.aclose()
+
+    async def request(self, path: str, params: dict[str, str]) -> httpx.Response:
+        """
+        Send a GET request, within the pool and rate limits.
+
+        Raises
+        ------
+        httpx.HTTPError
+            If the request still fails after the retries, or fails with a
+            client error.
+        """
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                await self.bucket.acquire()
+                delay: float = 0.5 * 2**attempt
+                try:
+                    response: httpx.Response = await self.client.get(
+                        path, params=params
+                    )
+                    if response.status_code != 429 and response.status_code < 500:
+                        response.raise_for_status()
+                        break
+                    try:
+                        delay = float(response.headers.get("Retry-After", delay))
+                    except ValueError:
+                        pass
+                    if attempt == self.retries:
+                        response.raise_for_status()
+                except httpx.TransportError:
+                    if attempt == self.retries:
+                        raise
+                await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+        return response
+
+    async def fetch(self, path: str, params: dict[str, str]) -> dict:
+        """
+        Get a feed document from the feed.
+        """
+        return (await self.request(path, params)).json()
+
+    async def get_json(self, path: str, params: dict[str, str] | None = None) -> dict:
+        """
+        Get a feed document, and record it as a fixture if requested.
+
+        Raises
+        ------
+        httpx.HTTPError
+            If the document can't be fetched.
+        """
+        params = params or dict()
+        data: dict = await self.fetch(path, params)
+        if self.record:
+            target: str = fixture_path(self.record, path, params)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "w") as file:
+                json.dump(data, file, indent=2)
+        return data
+
+
+# Basketball-Reference source: base URL, request rate (the site blocks clients
+# over about 20 requests per minute) and team codes used in its URLs
+reference_url: str = "https://www.basketball-reference.com"
+reference_rate: float = 1 / 3.5
+reference_teams: dict[str, str] = {
+    "Atlanta Hawks": "ATL",
+    "Boston Celtics": "BOS",
+    "Brooklyn Nets": "BRK",
+    "Charlotte Hornets": "CHO",
+    "Chicago Bulls": "CHI",
+    "Cleveland Cavaliers": "CLE",
+    "Dallas Mavericks": "DAL",
+    "Denver Nuggets": "DEN",
+    "Detroit Pistons": "DET",
+    "Golden State Warriors": "GSW",
+    "Houston Rockets": "HOU",
+    "Indiana Pacers": "IND",
+    "Los Angeles Clippers": "LAC",
+    "Los Angeles Lakers": "LAL",
+    "Memphis Grizzlies": "MEM",
+    "Miami Heat": "MIA",
+    "Milwaukee Bucks": "MIL",
+    "Minnesota Timberwolves": "MIN",
+    "New Orleans Pelicans": "NOP",
+    "New York Knicks": "NYK",
+    "Oklahoma City Thunder": "OKC",
+    "Orlando Magic": "ORL",
+    "Philadelphia 76ers": "PHI",
+    "Phoenix Suns": "PHO",
+    "Portland Trail Blazers": "POR",
+    "Sacramento Kings": "SAC",
+    "San Antonio Spurs": "SAS",
+    "Toronto Raptors": "TOR",
+    "Utah Jazz": "UTA",
+    "Washington Wizards": "WAS",
+}
+
+# Team game logs pages of Basketball-Reference (`data/fetcher.ipynb`): row id
+# prefix, and game logs column of each stat (`data-stat` attribute)
+reference_logs: dict[str, tuple[str, dict[str, str]]] = {
+    "gamelog": (
+        "team_game_log_reg.",
+        {
+            "pts": "team_game_score",
+            "fg": "fg",
+            "fga": "fga",
+            "fg_pct": "fg_pct",
+            "fg3": "fg3",
+            "fg3a": "fg3a",
+            "fg3_pct": "fg3_pct",
+            "fg2": "fg2",
+            "fg2a": "fg2a",
+            "fg2_pct": "fg2_pct",
+            "ft": "ft",
+            "fta": "fta",
+            "ft_pct": "ft_pct",
+            "orb": "orb",
+            "drb": "drb",
+            "trb": "trb",
+            "ast": "ast",
+            "stl": "stl",
+            "blk": "blk",
+            "tov": "tov",
+            "pf": "pf",
+        },
+    ),
+    "gamelog-advanced": (
+        "team_game_log_adv_reg.",
+        {
+            "ortg": "team_off_rtg",
+            "drtg": "team_def_rtg",
+            "pace": "pace",
+            "ftr": "fta_per_fga_pct",
+            "3ptar": "fg3a_per_fga_pct",
+            "ts": "ts_pct",
+            "trb_pct": "team_trb_pct",
+            "ast_pct": "team_ast_pct",
+            "stl_pct": "team_stl_pct",
+            "blk_pct": "team_blk_pct",
+            "efg_pct": "efg_pct",
+            "tov_pct": "team_tov_pct",
+            "orb_pct": "team_orb_pct",
+            "ft_rate": "ft_rate",
+        },
+    ),
+}
 
-        # Storing vars for future plot updates
-        self.stat: str = stat
-        self.date: str = date
-        self.window: int = window
-        self.team1: str = team1
-        self.team2: str = team2
-        self.home_color: str = home_color
-        self.away_color: str = away_color
-        self.path: str = csv_path
 
-        # Plotting at first component mount
-        self.plot_stat()
+# Feed client scraping Basketball-Reference
+class ReferenceClient(FeedClient):
+    def __init__(
+        self,
+        base_url: str = reference_url,
+        concurrency: int = ingest_concurrency,
+        rate: float = reference_rate,
+        retries: int = ingest_retries,
+        record: str | None = None,
+    ) -> None:
+        """
+        Feed client translating the Basketball-Reference pages scraped by the
+        data notebooks into the feed documents (see `FeedClient`).
+
+        - Schedules come from the monthly schedule pages
+          (`/leagues/NBA_<season>_games-<month>.html`), where a game is
+          `final` once its box score is linked.
+        - Box scores come from both teams' basic and advanced game logs
+          (`/teams/<code>/<season>/gamelog/`), with the stats of
+          `data/fetcher.ipynb`.
+        - Game ids are `<date>_<home code>_<away code>`, e.g.
+          `2026-02-01_BOS_NYK`.
+
+        Notes
+        -----
+        - Every page is fetched once per client, since a schedule page
+          covers a month and a game logs page a team's season.
+        - Recorded fixtures hold the translated documents, so they are
+          replayed by `serve_fixtures` like those of any other feed.
+        """
+        super().__init__(base_url, concurrency, rate, retries, record)
+        self.pages: dict[str, asyncio.Future] = dict()
 
-    @ui.refreshable
-    def plot_stat(self) -> ui.plotly:
+    async def page(self, path: str) -> "bs4.BeautifulSoup":
+        """
+        Fetch and parse a page, or wait for the pending fetch of the same page.
         """
-        Render or refresh the head-to-head plot.
+        import bs4
 
-        Loads the CSV data, filters games by date, generates series for
-        each team, and configures a Highcharts line chart.
+        async def fetch_page() -> bs4.BeautifulSoup:
+            response: httpx.Response = await self.request(path, dict())
+            return bs4.BeautifulSoup(response.content, "html.parser")
 
-        Returns
-        -------
-        ui.plotly
-            The NiceGUI Highcharts plot component for the H2H comparison.
+        if path not in self.pages:
+            self.pages[path] = asyncio.ensure_future(fetch_page())
+        try:
+            return await self.pages[path]
+        except httpx.HTTPError:
+            self.pages.pop(path, None)
+            raise
+
+    async def fetch(self, path: str, params: dict[str, str]) -> dict:
+        """
+        Build a feed document from the pages.
 
         Raises
         ------
         ValueError
-            If the selected stat is not found in the CSV dataset columns.
+            If the path isn't a feed document, or a played game has no
+            game logs yet.
+        KeyError
+            If a team is missing from `reference_teams`.
+        """
+        parts: list[str] = [part for part in path.split("/") if part]
+        if parts == ["schedule"]:
+            return await self.schedule(params["date"])
+        if len(parts) == 2 and parts[0] == "boxscore":
+            return await self.boxscore(parts[1])
+        raise ValueError(f"Unknown feed document {path}")
+
+    async def schedule(self, date: str) -> dict:
         """
+        Build the schedule document of a date.
+        """
+        month: str = datetime.date.fromisoformat(date).strftime("%B").lower()
+        try:
+            soup = await self.page(
+                f"/leagues/NBA_{season_key(date) + 1}_games-{month}.html"
+            )
+        except httpx.HTTPStatusError as e:
+            # No schedule page in the off-season months
+            if e.response.status_code == 404:
+                return {"date": date, "games": list()}
+            raise
+
+        games: list[dict[str, str]] = list()
+        for row in soup.select("table#schedule tbody tr"):
+            cell = row.find("th", {"data-stat": "date_game"})
+            fields: dict[str, str] = {
+                td["data-stat"]: td.text for td in row.find_all("td")
+            }
+            if cell is None or "home_team_name" not in fields:
+                continue
+            played: str = datetime.datetime.strptime(
+                cell.text, "%a, %b %d, %Y"
+            ).strftime("%Y-%m-%d")
+            if played != date:
+                continue
+            home, away = fields["home_team_name"], fields["visitor_team_name"]
+            codes: str = f"{reference_teams[home]}_{reference_teams[away]}"
+            games.append(
+                {
+                    "game_id": f"{date}_{codes}",
+                    "home_team": home,
+                    "away_team": away,
+                    "status": "final" if fields.get("home_pts") else "scheduled",
+                }
+            )
+        return {"date": date, "games": games}
 
-        # Load data
-        df: pd.DataFrame = pd.read_csv(self.path, parse_dates=["date"])
+    async def boxscore(self, game_id: str) -> dict:
+        """
+        Build the box score document of a game from both teams' game logs.
+        """
+        date, *codes = game_id.split("_")
+        teams: dict[str, str] = {code: team for team, code in reference_teams.items()}
+        home, away = (teams[code] for code in codes)
+        stats: list[dict[str, float]] = await asyncio.gather(
+            *(self.team_game(code, date) for code in codes)
+        )
+        return {
+            "game_id": game_id,
+            "date": date,
+            "home_team": home,
+            "away_team": away,
+            "teams": {home: stats[0], away: stats[1]},
+        }
 
-        # Checking if the selected stat is present in the column
-        if self.stat not in df.columns:
-            raise ValueError(f"'{self.stat}' not found in dataset columns.")
+    async def team_game(self, code: str, date: str) -> dict[str, float]:
+        """
+        Get a team's stats in a game, under the game logs column names.
+        """
+        season: int = season_key(date) + 1
+        pages: list = await asyncio.gather(
+            *(self.page(f"/teams/{code}/{season}/{name}/") for name in reference_logs)
+        )
+        stats: dict[str, float] = dict()
+        for soup, (prefix, columns) in zip(pages, reference_logs.values()):
+            for row in soup.find_all("tr", id=lambda x: x and x.startswith(prefix)):
+                fields: dict[str, str] = {
+                    td["data-stat"]: td.text for td in row.find_all("td")
+                }
+                if fields.get("date") != date:
+                    continue
+                for column, stat in columns.items():
+                    value: str = fields.get(stat, "")
+                    if value:
+                        stats[column] = (
+                            int(value) if value.lstrip("-").isdigit() else float(value)
+                        )
+        if "pts" not in stats:
+            raise ValueError(f"No game logs of {code} on {date} yet")
+        return stats
 
-        # Specify the start date (converting to timestamp)
-        start_date: pd.Timestamp = pd.to_datetime(self.date)
 
-        # Function to convert date to JS timestamp (ms since epoch)
-        def make_series(df: pd.DataFrame, team: str, color: str) -> dict[str, str]:
+# Ingestion sources, by name
+ingest_sources: dict[str, type[FeedClient]] = {
+    "feed": FeedClient,
+    "basketball-reference": ReferenceClient,
+}
 
-            # Filter for games starting from the given date and going backwards
-            df_team: pd.DataFrame = (
-                df[(df["team"] == team) & (df["date"] < start_date)]
-                .sort_values("date", ascending=False)
-                .head(self.window)
-            )  # Get the N game (controlled by the window input)
 
-            # Prepare the data
-            data: list[str] = [
-                [int(d.date.timestamp() * 1000), float(getattr(d, self.stat))]
-                for d in df_team.itertuples()
-            ]
-            return {
-                "name": team,
-                "data": data,
-                "color": color,
-            }
+# Create the client of an ingestion source
+def feed_client(
+    source: str = ingest_source, base_url: str = ingest_url, record: str | None = None
+) -> FeedClient:
+    """
+    Create a client of an ingestion source, `feed` or `basketball-reference`.
 
-        # Generate both series
-        series: list[dict[str, str]] = [
-            make_series(df, self.team1, self.home_color),
-            make_series(df, self.team2, self.away_color),
-        ]
+    Parameters
+    ----------
+    source : str, optional
+        Name of the source. Defaults to `DEEPSHOT_INGEST_SOURCE`.
+    base_url : str, optional
+        Base URL of the source, which defaults to the Basketball-Reference
+        website for that source.
+    record : str | None, optional
+        Directory where the feed documents are saved as fixtures.
 
-        # Highcharts config with datetime x-axis
-        config: dict[str, dict[str, str]] = {
-            "chart": {
-                "type": "line",
-                "spacingTop": 25,
-                "spacingBottom": 25,
-            },
-            "title": {
-                "text": f"{self.team1} vs {self.team2} {stat_to_full_name_desc[self.stat]}"
-            },
-            "xAxis": {
-                "type": "datetime",
-                "labels": {"format": "{value:%b %d}"},
-            },
-            "yAxis": {"title": {"text": stat_to_full_name_desc[self.stat]}},
-            "legend": {
-                "layout": "horizontal",
-                "align": "center",
-                "verticalAlign": "top",
-            },
-            "tooltip": {
-                "xDateFormat": "%b %d, %Y",
-                "shared": True,
-            },
-            "series": series,
-        }
+    Returns
+    -------
+    FeedClient
+        The client, to be opened with `async with`.
+    """
+    if source == "basketball-reference":
+        return ReferenceClient(base_url or reference_url, record=record)
+    return ingest_sources[source](base_url, record=record)
 
-        ui.highchart(options=config).classes("rounded-lg")
 
+# Compute the pre-game Elo rating of a team from its previous game
+def next_elo(team: str, date: str, previous: str, rating: float) -> float:
+    """
+    Update a team's pre-game Elo rating with the outcome of its previous game.
 
-# Single game details page
-@ui.page("/{date}/{game}")
-def game(date: str, game: str) -> None:
+    Mirrors `compute_team_elos` of the averaging pipeline: home advantage,
+    margin of victory multiplier and carry-over between seasons.
+
+    Parameters
+    ----------
+    team : str
+        Name of the team.
+    date : str
+        Date of the upcoming game, in `YYYY-MM-DD` format.
+    previous : str
+        Date of the team's previous game.
+    rating : float
+        The team's pre-game rating of the previous game.
+
+    Returns
+    -------
+    float
+        The pre-game rating of the upcoming game.
     """
-    Render a single game details page with team stats and head-to-head plot.
+    schedule: pd.DataFrame = schedule_store.frame(season_key(previous))
+    game: pd.DataFrame = schedule[
+        (schedule["date"] == previous)
+        & ((schedule["home_team"] == team) | (schedule["away_team"] == team))
+    ]
+    if len(game):
+        home, away = game["home_team"].iloc[0], game["away_team"].iloc[0]
+        opponent: str = away if home == team else home
+
+        # Opponent rating and both scores of the previous game
+        found: tuple[SeasonPartition, int] | None = stats_store.team_row(
+            opponent, previous
+        )
+        opponent_rating: float = elo_config["base_rating"]
+        if found is not None:
+            partition, row = found
+            opponent_rating = float(partition.frame["elo"].iloc[row])
+        points: dict[str, float] = dict()
+        for side in (home, away):
+            found = gamelogs_store.team_row(side, previous)
+            if found is not None:
+                partition, row = found
+                points[side] = float(partition.frame["pts"].iloc[row])
+
+        # Outcome from the results, or from the scores
+        results: pd.DataFrame = results_store.frame(season_key(previous))
+        result: pd.DataFrame = results[
+            (results["date"] == previous)
+            & (results["home_team"] == home)
+            & (results["away_team"] == away)
+        ]
+        actual_home: float | None = None
+        if len(result):
+            actual_home = 1.0 - float(result["winning_team"].iloc[0])
+        elif len(points) == 2:
+            actual_home = 1.0 if points[home] > points[away] else 0.0
+
+        if actual_home is not None:
+            home_rating, away_rating = (
+                (rating, opponent_rating) if home == team else (opponent_rating, rating)
+            )
+            expected_home: float = 1 / (
+                1
+                + 10
+                ** ((away_rating - (home_rating + elo_config["home_advantage"])) / 400)
+            )
+            multiplier: float = 1.0
+            if len(points) == 2:
+                margin: float = max(
+                    abs(points[home] - points[away]), elo_config["min_margin"]
+                )
+                multiplier = math.log(margin + 1) * (
+                    2.2 / (abs(home_rating - away_rating) * 0.001 + 2.2)
+                )
+            delta: float = (
+                elo_config["k_factor"] * multiplier * (actual_home - expected_home)
+            )
+            rating += delta if home == team else -delta
 
-    This page displays a detailed view for a specific game, including:
-    - Team logos, names, and win probabilities
-    - Visual win probability bars
-    - Interactive head-to-head (H2H) plot for selectable statistics
-    - A dropdown to select different stats to visualize
+    # Regression toward the mean between seasons
+    if season_key(date) != season_key(previous):
+        rating = (
+            elo_config["carry_over"] * rating
+            + (1 - elo_config["carry_over"]) * elo_config["base_rating"]
+        )
+    return rating
 
-    A back button allows users to return to the main date page.
+
+# Compute the pre-game averages of a team from its game logs
+def team_averages(team: str, date: str, game: dict[str, float]) -> list[str] | None:
+    """
+    Compute the stats row of a team before a game, incrementally.
+
+    The averaging pipeline combines a rolling mean and an EWMA of the previous
+    games. The EWMA state of the previous game is recovered from its stored
+    averages and the rolling mean of the game logs, then advanced by one game,
+    so only the last `average_window + 1` game logs are read.
 
     Parameters
     ----------
+    team : str
+        Name of the team.
     date : str
-        The date of the game in `YYYY-MM-DD` format.
-    game : str
-        JSON-encoded string representing the game object with home/away
-        team names, statistics, and prediction probabilities.
+        Date of the game, in `YYYY-MM-DD` format.
+    game : dict[str, float]
+        The team's stats in this game, only used for its very first game,
+        which the pipeline fills with the game's own values.
 
     Returns
     -------
-    None
-        This function does not return a value. It renders the UI directly
-        using NiceGUI.
+    list[str] | None
+        The row, in the column order of `stats_store`, or None if the
+        previous game's stats row is missing.
+    """
+    columns: list[str] = stats_store.columns()
+    logs: list[str] = gamelogs_store.columns()[2:]
+    averaged: list[str] = [column for column in columns[2:] if column != "elo"]
+
+    # Previous game logs (chronological), with the engineered features
+    found: list[tuple[SeasonPartition, np.ndarray]] = gamelogs_store.recent_rows(
+        team, date, average_window + 1
+    )
+    history: pd.DataFrame = pd.DataFrame(
+        np.concatenate(
+            [partition.values[rows] for partition, rows in found]
+            or [np.empty((0, len(logs)))]
+        )[::-1],
+        columns=logs,
+    )
+    if history.empty:
+        history = pd.DataFrame([game], columns=logs).astype(float)
+    history["ast_tov"] = (history["ast"] / history["tov"]).round(2)
+    history["ast_ratio"] = (
+        history["ast"] / (history["fg"] + history["ast"] + history["tov"])
+    ).round(2)
+    values: np.ndarray = history[averaged].to_numpy(dtype=float)
+
+    # First game: the game's own values, second game: the first game's values
+    if not found or len(values) == 1:
+        stats: np.ndarray = values[-1]
+        rating: float = elo_config["base_rating"]
+        if found:
+            previous: str = found[0][0].dates[found[0][1][0]]
+            rating = next_elo(team, date, previous, rating)
+    else:
+        previous: str = found[0][0].dates[found[0][1][0]]
+        row: tuple[SeasonPartition, int] | None = stats_store.team_row(team, previous)
+        if row is None:
+            return None
+        partition, position = row
+        stored: pd.Series = partition.frame.iloc[position]
+        previous_stats: np.ndarray = stored[averaged].astype(float).to_numpy()
+
+        # Recover the EWMA before the previous game, then add the previous game
+        alpha: float = 2 / (average_window + 1)
+        rolling_weight, ewma_weight = average_weights
+        previous_mean: np.ndarray = values[:-1][-average_window:].mean(axis=0)
+        ewma: np.ndarray = (
+            previous_stats - rolling_weight * previous_mean
+        ) / ewma_weight
+        ewma = (1 - alpha) * ewma + alpha * values[-1]
+        stats = (
+            rolling_weight * values[-average_window:].mean(axis=0) + ewma_weight * ewma
+        )
+        rating = next_elo(team, date, previous, float(stored["elo"]))
+
+    by_column: dict[str, float] = dict(zip(averaged, np.round(stats, 2).tolist()))
+    by_column["elo"] = round(rating, 2)
+    return [date, team] + [
+        "" if np.isnan(by_column[column]) else str(by_column[column])
+        for column in columns[2:]
+    ]
+
+
+# Store a game schedule
+def apply_schedule(date: str, games: list[dict[str, str]]) -> int:
+    """
+    Append the new games of a feed schedule to the schedule store.
+
+    Returns
+    -------
+    int
+        The number of new games.
+    """
+    schedule: pd.DataFrame = schedule_store.frame(season_key(date))
+    known: set[tuple[str, str]] = set(
+        zip(
+            *(
+                schedule.loc[schedule["date"] == date, c]
+                for c in ("home_team", "away_team")
+            )
+        )
+    )
+    rows: list[list[str]] = [
+        [date, game["home_team"], game["away_team"]]
+        for game in games
+        if (game["home_team"], game["away_team"]) not in known
+    ]
+    schedule_store.append(rows)
+    return len(rows)
+
+
+# Store a box score
+def apply_boxscore(box: dict) -> None:
+    """
+    Store the result, game logs and pre-game stats rows of a played game.
+
+    Parameters
+    ----------
+    box : dict
+        The feed box score of the game.
 
     Notes
     -----
-    - The `game` parameter is decoded using `json.loads` after URL unquoting.
-    - Team colors are determined using `get_best_color_pair`.
-    - H2H plots are created with the `H2HPlot` class, allowing interactive
-      selection of statistics to display.
-    - Custom CSS is applied to style the layout, align elements, and set
-      background colors.
+    - Rows already present are never appended twice.
+    - Without game logs (`data/csv/gamelogs.csv`), only the result is stored:
+      the stats can't be averaged incrementally (`ingest_dates` reports it).
     """
+    date, home, away = box["date"], box["home_team"], box["away_team"]
+    teams_stats: dict[str, dict[str, float]] = box["teams"]
+
+    # Result (winning_team is 0 for a home win, 1 for an away win)
+    results: pd.DataFrame = results_store.frame(season_key(date))
+    if not (
+        (results["date"] == date)
+        & (results["home_team"] == home)
+        & (results["away_team"] == away)
+    ).any():
+        winner: str = (
+            "0" if teams_stats[home]["pts"] > teams_stats[away]["pts"] else "1"
+        )
+        results_store.append([[date, home, away, winner]])
+
+    try:
+        logs: list[str] = gamelogs_store.columns()[2:]
+    except FileNotFoundError:
+        return
+
+    # Pre-game stats first (they only depend on earlier games), then game logs
+    averages: list[list[str]] = list()
+    gamelogs: list[list[str]] = list()
+    for team in (home, away):
+        if gamelogs_store.team_row(team, date) is not None:
+            continue
+        if stats_store.team_row(team, date) is None:
+            row: list[str] | None = team_averages(team, date, teams_stats[team])
+            if row is not None:
+                averages.append(row)
+        gamelogs.append(
+            [date, team] + [str(teams_stats[team].get(column, "")) for column in logs]
+        )
+    stats_store.append(averages)
+    gamelogs_store.append(gamelogs)
 
-    # Re-converting the game object
-    game: list[dict[str, str | int | float]] = json.loads(unquote(game))
 
-    # Add custom CSS to remove unwanted borders and padding
-    ui.add_css(".nicegui-content { margin: 0; padding: 0; height: 100vh; }")
-    ui.add_css(".nicegui-content { display: flex; flex-direction: column; }")
+# Fetch and store the games of some dates
+async def ingest_dates(dates: list[str], client: FeedClient) -> dict[str, int]:
+    """
+    Fetch the schedules and box scores of some dates and store them.
 
-    # Alligning the details card to the center
-    ui.add_css(".nicegui-content { justify-content: center;  align-items: center; }")
+    Schedules are fetched concurrently. Dates are then processed in order,
+    and the box scores of a date are stored one by one as soon as they are
+    received, since each game only depends on earlier dates.
 
-    # Customizing the bg color
-    ui.add_css(".nicegui-content { background-color: #5a5f70; }")
+    Parameters
+    ----------
+    dates : list[str]
+        Dates to ingest, in `YYYY-MM-DD` format.
+    client : FeedClient
+        An open feed client.
 
-    # Back button
-    with ui.page_sticky("top-left", x_offset=32, y_offset=32).classes("mt-8 ml-8"):
-        ui.icon("arrow_back").classes("cursor-pointer text-3xl").style(
-            "color: #e3e4e6"
-        ).on("click", lambda: ui.navigate.to(f"/{date}"))
+    Returns
+    -------
+    dict[str, int]
+        Numbers of new scheduled games, of stored box scores and of games whose
+        box score could not be stored.
 
-    # Creating the card fot the games details
-    card: ui.card = (
-        ui.card()
-        .classes("m-4 p-6 rounded-2xl shadow-md border w-[850px]")
-        .style("background-color: #e3e4e6;")
-    )
+    Notes
+    -----
+    - Waits for the ingestions of other processes, which could store the
+      same games.
+    - A game whose box score can't be fetched or stored is logged and skipped,
+      then fetched again once the other games of its date are stored, up to
+      `ingest_game_passes` times. Games still failing are ingested by a later
+      run, since stored rows are never appended twice.
+    """
+    while not ingest_lock.acquire(blocking=False):
+        await asyncio.sleep(1)
+    try:
+        return await store_dates(dates, client)
+    finally:
+        ingest_lock.release()
+
+
+# Fetch the box score of a game, returning the error instead of raising it
+async def fetch_boxscore(
+    client: FeedClient, game_id: str
+) -> tuple[str, dict | Exception]:
+    """
+    Return the game ID with its box score, or with the error of the request.
+    """
+    try:
+        return game_id, await client.get_json(f"/boxscore/{game_id}")
+    except (httpx.HTTPError, ValueError) as e:
+        return game_id, e
 
-    # Filling the card
-    with card:
 
-        # Calculating the color for each team
-        home_color, away_color = get_best_color_pair(
-            game["home_team"], game["away_team"]
+# Fetch and store the games of some dates, holding the ingestion lock
+async def store_dates(dates: list[str], client: FeedClient) -> dict[str, int]:
+    """
+    Fetch and store the games of some dates, see `ingest_dates`.
+    """
+    counts: dict[str, int] = {"games": 0, "boxscores": 0, "failed": 0}
+
+    # The stats are averaged from the game logs, created by `data/fetcher.ipynb`
+    try:
+        gamelogs_store.columns()
+    except FileNotFoundError:
+        print(
+            f"Error: No game logs in {gamelogs_store.source}, only the schedules "
+            "and results are ingested - run data/fetcher.ipynb to create them"
         )
 
-        # Row for Team Logos and "VS"
-        with ui.row(align_items="center").classes(
-            "items-center justify-between w-full"
-        ):
-            ui.image(f"static/{game['home_team']}.png").classes("w-28")
-            ui.image(f"static/vs.png").classes("w-12")
-            ui.image(f"static/{game['away_team']}.png").classes("w-28")
+    schedules: list[dict] = await asyncio.gather(
+        *(client.get_json("/schedule", {"date": date}) for date in sorted(dates))
+    )
+    for schedule in schedules:
+        counts["games"] += await asyncio.to_thread(
+            apply_schedule, schedule["date"], schedule["games"]
+        )
+        pending: list[str] = [
+            game["game_id"]
+            for game in schedule["games"]
+            if game.get("status") == "final"
+        ]
 
-        # Row for Team Names and Win Probabilities
-        with ui.row(align_items="stretch").classes("justify-between w-full"):
-            with ui.column(align_items="start"):
-                ui.label(game["home_team"]).classes("text-left text-md font-bold")
-                ui.label(f"W {game['home_prob']} %").classes(
-                    f"text-left text-md font-bold"
-                )
-            with ui.column(align_items="end"):
-                ui.label(game["away_team"]).classes("text-right text-md font-bold")
-                ui.label(f"W {game['away_prob']} %").classes(
-                    f"text-right text-md font-bold"
-                )
+        # A failed game is logged and skipped, the others are still stored; only
+        # the failed games are fetched again on the next pass
+        for _ in range(ingest_game_passes):
+            failed: list[str] = list()
+            for response in asyncio.as_completed(
+                [fetch_boxscore(client, game_id) for game_id in pending]
+            ):
+                game_id, box = await response
+                try:
+                    if isinstance(box, Exception):
+                        raise box
+                    await asyncio.to_thread(apply_boxscore, box)
+                    counts["boxscores"] += 1
+                except (httpx.HTTPError, KeyError, ValueError) as e:
+                    print(f"Error: Could not ingest game {game_id} - {e}")
+                    failed.append(game_id)
+            pending = failed
+        counts["failed"] += len(pending)
+    return counts
+
+
+# Ingest a date range from the command line
+def ingest(
+    start: str,
+    end: str,
+    base_url: str = ingest_url,
+    record: str | None = None,
+    source: str = ingest_source,
+) -> None:
+    """
+    Ingest every date between `start` and `end`, and report the throughput.
+    """
+    dates: list[str] = [d.strftime("%Y-%m-%d") for d in pd.date_range(start, end)]
 
-        # HTML element to create W % bars
-        with ui.element("div").classes("flex w-full h-6"):
-            ui.element("div").style(
-                f"flex: {game['home_prob']}; background-color: {home_color}"
-            ).classes("rounded-md mr-1")
-            ui.element("div").style(
-                f"flex: {game['away_prob']}; background-color: {away_color}"
-            ).classes("rounded-md ml-1")
+    async def run_ingestion() -> dict[str, int]:
+        async with feed_client(source, base_url, record) as client:
+            return await ingest_dates(dates, client)
 
-        # Creating the 2 containers for the selection and plotting of a specified stat
-        selectors_section: ui.element = ui.element("div").classes("w-full")
-        plotting_section: ui.element = ui.element("div").classes("w-full")
+    started: float = time.perf_counter()
+    counts: dict[str, int] = asyncio.run(run_ingestion())
+    print(
+        f"Ingested {len(dates)} dates: {counts['games']} new games and "
+        f"{counts['boxscores']} box scores in {time.perf_counter() - started:.1f}s"
+    )
+    if counts["failed"]:
+        print(f"Error: {counts['failed']} box scores could not be ingested")
 
-        # Creating a first plot
-        with plotting_section:
-            plot: H2HPlot = H2HPlot(
-                "pts",
-                date,
-                10,
-                game["home_team"],
-                game["away_team"],
-                home_color,
-                away_color,
-                "./data/csv/averages.csv",
-            )
 
-        # Dropdown selectin to choose stats, and used game window, to display for both teams
-        with selectors_section:
-            with ui.grid(columns="1fr 1fr"):
-                ui.select(
-                    stat_to_full_name_desc,
-                    label="Selected a stat:",
-                    value="pts",
-                    with_input=True,
-                    on_change=plot.plot_stat.refresh,
-                ).style("border-radius: 0.25rem;").classes("w-full").props(
-                    "outlined color=grey-9  bg-color=grey-2"
-                ).bind_value_to(
-                    plot, "stat"
-                )
-                ui.select(
-                    [n for n in range(5, 26)],
-                    value=10,
-                    label="Selected a game window:",
-                    with_input=True,
-                    on_change=plot.plot_stat.refresh,
-                ).style("border-radius: 0.25rem;").classes("w-full").props(
-                    "outlined color=grey-9  bg-color=grey-2"
-                ).bind_value_to(
-                    plot, "window"
-                )
+# Refresh the data from the feed in the background
+async def ingestion_service() -> None:
+    """
+    Ingest yesterday's and today's games every `ingest_interval` seconds.
+
+    Notes
+    -----
+    - With several worker processes, only the one holding the leader lock
+      ingests; another one takes over if it exits.
+    - A new client is opened on every refresh, so the pages cached by a
+      `ReferenceClient` are fetched again.
+    """
+    leader: bool = False
+    while True:
+        leader = leader or ingest_leader_lock.acquire(blocking=False)
+        if leader:
+            today: datetime.date = datetime.date.today()
+            dates: list[str] = [
+                (today - datetime.timedelta(days=1)).isoformat(),
+                today.isoformat(),
+            ]
+            try:
+                async with feed_client() as client:
+                    await ingest_dates(dates, client)
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                print(f"Error: Could not ingest the feed data - {e}")
+        await asyncio.sleep(ingest_interval)
+
+
+if ingest_url or ingest_source == "basketball-reference":
+    app.on_startup(ingestion_service)
+
 
+# Serve recorded feed responses, to ingest data offline
+def serve_fixtures(
+    directory: str, port: int, latency: float = 0.0, failure_rate: float = 0.0
+) -> None:
+    """
+    Run a local mock of the game data feed replaying recorded fixtures.
+
+    Parameters
+    ----------
+    directory : str
+        Fixtures directory, as written by `FeedClient(record=...)`.
+    port : int
+        Port to listen on.
+    latency : float, optional
+        Delay added to every response, in seconds.
+    failure_rate : float, optional
+        Share of requests answered with a 503 error, to exercise the retries.
+    """
+    from aiohttp import web
+
+    root: str = os.path.realpath(directory)
+
+    async def respond(request: web.Request) -> web.StreamResponse:
+        await asyncio.sleep(latency)
+        if random.random() < failure_rate:
+            return web.json_response({"error": "unavailable"}, status=503)
+        path: str = os.path.realpath(
+            fixture_path(root, request.path, dict(request.query))
+        )
+        if not path.startswith(root + os.sep) or not os.path.isfile(path):
+            return web.json_response({"error": "not found"}, status=404)
+        return web.FileResponse(path)
+
+    mock: web.Application = web.Application()
+    mock.router.add_get("/{path:.*}", respond)
+    web.run_app(mock, port=port)
+
+
+# Precompute the explanations of the current season at startup
+async def precompute_explanations() -> None:
+    """
+    Explain every game of the current season in the background.
+    """
+    await run.io_bound(explain_season, default_date())
+
+
+app.on_startup(precompute_explanations)
 
 # Running the app
-ui.run(title="Deepshot AI", favicon="static/icon.png")
+# Command line entry points, e.g. `python main.py build-assets`
+cli_commands: tuple[str, ...] = (
+    "build-assets",
+    "export",
+    "partition",
+    "ingest",
+    "mock-feed",
+    "import",
+)
+
+if __name__ == "__main__" and sys.argv[1:2] and sys.argv[1] in cli_commands:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog="main.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build-assets", help="build the optimized static assets")
+    export: argparse.ArgumentParser = commands.add_parser(
+        "export", help="pre-render the date and game pages as static snapshots"
+    )
+    export.add_argument("--start", help="first date to export")
+    export.add_argument("--end", help="last date to export")
+    export.add_argument(
+        "--output", default=snapshots_directory, help="target directory"
+    )
+    commands.add_parser(
+        "partition", help="split the stats, schedule and results by season"
+    )
+    ingestion: argparse.ArgumentParser = commands.add_parser(
+        "ingest",
+        help="fetch the schedules and box scores of a date range from the feed",
+    )
+    ingestion.add_argument("--start", help="first date to ingest (default: yesterday)")
+    ingestion.add_argument("--end", help="last date to ingest (default: today)")
+    ingestion.add_argument(
+        "--source",
+        default=ingest_source,
+        choices=list(ingest_sources),
+        help="data source: a JSON feed, or the Basketball-Reference pages",
+    )
+    ingestion.add_argument("--url", default=ingest_url, help="base URL of the feed")
+    ingestion.add_argument("--record", help="directory where the responses are saved")
+    archive: argparse.ArgumentParser = commands.add_parser(
+        "import", help="stream compressed CSV / Parquet archives into a table"
+    )
+    archive.add_argument("paths", nargs="+", help="archive files or directories")
+    archive.add_argument(
+        "--table",
+        default="averages",
+        choices=[os.path.basename(store.directory) for store in season_stores],
+        help="table to import into",
+    )
+    archive.add_argument(
+        "--chunk-rows", type=int, default=archive_chunk_rows, help="rows parsed at once"
+    )
+    mock_feed: argparse.ArgumentParser = commands.add_parser(
+        "mock-feed", help="serve recorded feed responses locally"
+    )
+    mock_feed.add_argument(
+        "--fixtures", default="./data/fixtures/feed", help="fixtures directory"
+    )
+    mock_feed.add_argument("--port", type=int, default=8765, help="port to listen on")
+    mock_feed.add_argument(
+        "--latency", type=float, default=0.0, help="delay of the responses (s)"
+    )
+    mock_feed.add_argument(
+        "--failure-rate", type=float, default=0.0, help="share of 503 responses"
+    )
+    arguments: argparse.Namespace = parser.parse_args()
+
+    if arguments.command == "build-assets":
+        build_assets()
+    elif arguments.command == "export":
+        export_snapshots(arguments.start, arguments.end, arguments.output)
+    elif arguments.command == "partition":
+        for store in season_stores:
+            if not os.path.exists(store.source):
+                continue
+            manifest: dict = partition_csv(store.source, store.directory)
+            seasons: int = len(manifest["seasons"])
+            print(f"{store.source}: {seasons} seasons in {store.directory}")
+    elif arguments.command == "ingest":
+        today: datetime.date = datetime.date.today()
+        if not arguments.url and arguments.source == "feed":
+            print("Error: No feed URL, set DEEPSHOT_INGEST_URL or pass --url")
+        else:
+            ingest(
+                arguments.start or (today - datetime.timedelta(days=1)).isoformat(),
+                arguments.end or today.isoformat(),
+                arguments.url,
+                arguments.record,
+                arguments.source,
+            )
+    elif arguments.command == "import":
+        tables: dict[str, SeasonStore] = {
+            os.path.basename(store.directory): store for store in season_stores
+        }
+        import_archive(arguments.paths, tables[arguments.table], arguments.chunk_rows)
+    elif arguments.command == "mock-feed":
+        serve_fixtures(
+            arguments.fixtures,
+            arguments.port,
+            arguments.latency,
+            arguments.failure_rate,
+        )
+else:
+    ui.run(title="Deepshot AI", favicon="static/icon.png")
@@ -0,0 +1,143 @@
+// Client-side helpers for the DeepShot UI
+
+// Linear interpolation of a curve sampled at sorted x positions
+function deepshotInterpolate(xs, ys, x) {
+  if (x <= xs[0]) return ys[0];
+  if (x >= xs[xs.length - 1]) return ys[ys.length - 1];
+  let i = 1;
+  while (xs[i] < x) i++;
+  const t = (x - xs[i - 1]) / (xs[i] - xs[i - 1]);
+  return ys[i - 1] + t * (ys[i] - ys[i - 1]);
+}
+
+// Update a what-if widget after one of its controls changed
+function deepshotWhatIf(control, field, value) {
+  const root = control.closest(".deepshot-whatif");
+  const data = JSON.parse(root.dataset.curves);
+
+  // Widget state (selected stat, shifted team and relative shift)
+  const state = (root.deepshotState ??= {
+    stat: Object.keys(data.curves)[0],
+    side: "home",
+    shift: 0,
+  });
+  state[field] = value;
+
+  // Interpolate the home team win probability at the selected shift
+  const home = deepshotInterpolate(
+    data.shifts,
+    data.curves[state.stat][state.side],
+    state.shift
+  );
+  const find = (role) => root.querySelector(`[data-role="${role}"]`);
+  find("shift").textContent = `${state.shift >= 0 ? "+" : ""}${state.shift} %`;
+  find("home-prob").textContent = `W ${Math.round(home)} %`;
+  find("away-prob").textContent = `W ${Math.round(100 - home)} %`;
+  find("home-bar").style.flex = home;
+  find("away-bar").style.flex = 100 - home;
+}
+
+// Show another stat, game window and overlays on a head-to-head chart, in place
+// (a NiceGUI chart ID, or a snapshot chart created by deepshotH2HChart)
+function deepshotH2H(id, stat, window, label, overlays = { names: {}, teams: [] }) {
+  const component = typeof id === "object" ? id : getElement(id);
+  const h2h = component.options.deepshot;
+  const chart = component.chart;
+
+  // Slice the prefetched series of both teams, most recent games first
+  chart.series.slice(0, 2).forEach((series, i) => {
+    const values = h2h.stats[stat][i];
+    const data = h2h.dates[i].slice(0, window).map((x, j) => [x, values[j]]);
+    series.setData(data, false);
+  });
+
+  // Replace the overlays, drawn for the same games as the teams' series
+  while (chart.series.length > 2) chart.series[2].remove(false);
+  const points = (key) =>
+    overlays.teams.map((team, i) =>
+      h2h.dates[i].slice(0, window).map((x, j) => [x].concat(team[key][j]))
+    );
+  const league = (key) =>
+    [...new Map(points(key).flat().map((point) => [point[0], point])).values()].sort(
+      (a, b) => a[0] - b[0]
+    );
+  const style = { marker: { enabled: false } };
+  for (const [key, name] of Object.entries(overlays.names)) {
+    if (key === "rolling" || key === "ewm") {
+      points(key).forEach((data, i) =>
+        chart.addSeries(
+          {
+            ...style,
+            name: `${chart.series[i].name} (${name})`,
+            data,
+            color: chart.series[i].color,
+            dashStyle: key === "rolling" ? "ShortDash" : "Dot",
+          },
+          false
+        )
+      );
+    } else if (key === "mean") {
+      chart.addSeries({ ...style, name, data: league(key), color: "#6b7280", dashStyle: "Dash" }, false);
+    } else if (key === "band") {
+      chart.addSeries(
+        { ...style, name, type: "arearange", data: league(key), color: "#9ca3af", fillOpacity: 0.25, lineWidth: 0, zIndex: -1 },
+        false
+      );
+    }
+  }
+  chart.update(
+    {
+      title: { text: `${chart.series[0].name} vs ${chart.series[1].name} ${label}` },
+      yAxis: { title: { text: label } },
+    },
+    false
+  );
+  chart.redraw();
+}
+
+// Create a head-to-head chart from its embedded config (static snapshot pages)
+function deepshotH2HChart(root) {
+  const options = JSON.parse(root.dataset.config);
+  const chart = Highcharts.chart(root.querySelector('[data-role="chart"]'), options);
+  root.deepshotChart = { options: { deepshot: options.deepshot }, chart };
+}
+
+// Update a head-to-head chart after one of its controls changed (static snapshot pages)
+function deepshotH2HControl(control, field, value) {
+  const root = control.closest(".deepshot-h2h");
+  const labels = JSON.parse(root.dataset.labels);
+  const names = JSON.parse(root.dataset.overlays);
+  const teams = JSON.parse(root.dataset.teams);
+
+  // Chart state (selected stat, game window, overlays and smoothing window)
+  const state = (root.deepshotState ??= { stat: "pts", window: 10, overlays: [], smoothing: 5 });
+  if (field === "overlays")
+    value = [...root.querySelectorAll("input[name=overlay]:checked")].map((box) => box.value);
+  if (field) state[field] = value;
+
+  // Overlays of the selected stat, fetched once per stat and smoothing window
+  const cache = (root.deepshotOverlays ??= {});
+  const key = `${state.stat}:${state.smoothing}`;
+  if (state.overlays.length && !cache[key]) {
+    const query = new URLSearchParams({
+      home: teams[0],
+      away: teams[1],
+      stat: state.stat,
+      window: state.smoothing,
+    });
+    cache[key] = "pending";
+    fetch(`/api/h2h/${root.dataset.date}?${query}`)
+      .then((response) => (response.ok ? response.json() : Promise.reject(response.status)))
+      .then((overlays) => (cache[key] = overlays))
+      .catch(() => (cache[key] = "failed"))
+      .finally(() => deepshotH2HControl(root));
+  }
+  const overlays =
+    state.overlays.length && typeof cache[key] === "object"
+      ? {
+          names: Object.fromEntries(state.overlays.map((name) => [name, names[name]])),
+          teams: cache[key].teams,
+        }
+      : undefined;
+  deepshotH2H(root.deepshotChart, state.stat, state.window, labels[state.stat], overlays);
+}
@@ -0,0 +1,89 @@
+# Importing libraries
+import importlib.util
+import os
+import shutil
+import sys
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from collections.abc import Iterator
+from types import ModuleType
+from nicegui import ui
+
+# Repository root and first date of the schedule kept in the unit tests workspace
+root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+first_date: str = "2023-10-01"
+
+
+# Write stats for every scheduled game, in the columns expected by the model
+def write_stats(schedule: pd.DataFrame, path: str) -> None:
+    """
+    Write pre-game stats rows for both teams of every game, drawn around a
+    fixed level per team so that the teams are clearly ranked.
+    """
+    features: np.ndarray = joblib.load(
+        os.path.join(root, "model", "deepshot.pkl")
+    ).feature_names_in_
+    stats: list[str] = [
+        str(feature)[len("home_") :]
+        for feature in features
+        if str(feature).startswith("home_")
+    ]
+    rng: np.random.Generator = np.random.default_rng(0)
+    team_names: list[str] = sorted(
+        set(schedule["home_team"]) | set(schedule["away_team"])
+    )
+    levels: dict[str, np.ndarray] = {
+        team: rng.normal(0, 1, len(stats)) for team in team_names
+    }
+    rows: list[list] = list()
+    for date, home, away in schedule.itertuples(index=False):
+        for team in (home, away):
+            values: np.ndarray = 50 + 10 * levels[team] + rng.normal(0, 1, len(stats))
+            rows.append([date, team] + list(np.round(values, 2)))
+    pd.DataFrame(rows, columns=["date", "team"] + stats).to_csv(path, index=False)
+
+
+# Import the app from a working directory holding the data of recent seasons
+@pytest.fixture(scope="session")
+def main(tmp_path_factory) -> Iterator[ModuleType]:
+    """
+    Import `main.py` with the model, the static files, the recent schedule and
+    results and synthetic stats, without starting the server.
+    """
+    workspace: str = str(tmp_path_factory.mktemp("app"))
+    for directory in ("model", "static"):
+        shutil.copytree(
+            os.path.join(root, directory),
+            os.path.join(workspace, directory),
+            ignore=shutil.ignore_patterns("build"),
+        )
+    csv_directory: str = os.path.join(workspace, "data", "csv")
+    os.makedirs(csv_directory)
+    for name in ("schedule.csv", "results.csv"):
+        table: pd.DataFrame = pd.read_csv(os.path.join(root, "data", "csv", name))
+        table[table["date"] >= first_date].to_csv(
+            os.path.join(csv_directory, name), index=False
+        )
+    write_stats(
+        pd.read_csv(os.path.join(csv_directory, "schedule.csv")),
+        os.path.join(csv_directory, "averages.csv"),
+    )
+
+    cwd: str = os.getcwd()
+    os.chdir(workspace)
+    try:
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(ui, "run", lambda *args, **kwargs: None)
+            spec = importlib.util.spec_from_file_location(
+                "main", os.path.join(root, "main.py")
+            )
+            module: ModuleType = importlib.util.module_from_spec(spec)
+
+            # Registered first: NiceGUI locates the source of the element classes
+            sys.modules["main"] = module
+            spec.loader.exec_module(module)
+        yield module
+    finally:
+        os.chdir(cwd)
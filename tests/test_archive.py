@@ -0,0 +1,62 @@
+# Importing libraries
+import os
+import shutil
+import pandas as pd
+import pytest
+from types import ModuleType
+
+
+# Store of a copy of the workspace results, partitioned in a temporary directory
+@pytest.fixture
+def store(main: ModuleType, tmp_path, monkeypatch) -> object:
+    monkeypatch.setattr(main, "partitions_directory", str(tmp_path / "partitions"))
+    source: str = str(tmp_path / "results.csv")
+    shutil.copy(os.path.join("data", "csv", "results.csv"), source)
+    return main.SeasonStore(source, "results")
+
+
+# Archive chunk mixing stored rows of two seasons with new and repeated rows
+def archive_chunk(store) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return the chunk and its rows that are not stored yet, in order.
+    """
+    first, last = store.seasons()[0], store.seasons()[-1]
+    fresh: pd.DataFrame = pd.DataFrame(
+        [
+            [f"{first}-11-05", "Seattle SuperSonics", "Boston Celtics", 0],
+            [f"{last + 1}-01-10", "Seattle SuperSonics", "Miami Heat", 1],
+            [f"{last + 1}-11-02", "Boston Celtics", "Miami Heat", 1],
+        ],
+        columns=store.columns(),
+    )
+    stored: pd.DataFrame = pd.concat(
+        [store.frame(first).head(2), store.frame(last).tail(2)]
+    )
+    chunk: pd.DataFrame = pd.concat(
+        [stored.head(2), fresh.head(2), stored.tail(2), fresh, stored],
+        ignore_index=True,
+    )
+    return chunk, fresh
+
+
+# Rows already stored and repeated rows of the chunk are dropped, in all seasons
+def test_unseen_rows(main: ModuleType, store) -> None:
+    chunk, fresh = archive_chunk(store)
+    unseen: pd.DataFrame = main.unseen_rows(store, chunk)
+    pd.testing.assert_frame_equal(unseen.reset_index(drop=True), fresh)
+
+    # Stored rows are recognised whatever the outcome they are read with
+    chunk["winning_team"] = 1 - chunk["winning_team"]
+    assert len(main.unseen_rows(store, chunk)) == len(fresh)
+
+
+# Importing an archive again stores nothing new
+def test_import_is_idempotent(main: ModuleType, store, tmp_path) -> None:
+    chunk, fresh = archive_chunk(store)
+    path: str = str(tmp_path / "archive.csv.gz")
+    chunk.to_csv(path, index=False)
+    rows: int = len(pd.read_csv(store.source))
+    counts: dict[str, int] = main.import_archive([path], store, chunk_rows=3)
+    assert counts == {"rows": len(chunk), "stored": len(fresh)}
+    assert len(pd.read_csv(store.source)) == rows + len(fresh)
+    assert main.import_archive([path], store) == {"rows": len(chunk), "stored": 0}
@@ -0,0 +1,92 @@
+# Importing libraries
+import numpy as np
+import pytest
+from types import ModuleType
+
+
+# The in-process tier evicts the least recently used entry
+def test_local_lru(main: ModuleType) -> None:
+    local = main.LocalCache(max_entries=2)
+    local.set("a", 1, 60)
+    local.set("b", 2, 60)
+    assert local.get("a") == 1
+    local.set("c", 3, 60)
+    assert local.get("b") is None
+    assert (local.get("a"), local.get("c")) == (1, 3)
+
+
+# Expired entries are misses in both tiers
+def test_ttl(main: ModuleType, tmp_path) -> None:
+    local = main.LocalCache()
+    shared = main.SQLiteCache(str(tmp_path / "cache.sqlite"))
+    for tier in (local, shared):
+        tier.set("fresh", "value", 60)
+        tier.set("stale", "value", -1)
+        assert tier.get("fresh") == "value"
+        assert tier.get("stale") is None
+
+
+# The SQLite tier round-trips pickled values between workers
+def test_sqlite_round_trip(main: ModuleType, tmp_path) -> None:
+    path: str = str(tmp_path / "cache.sqlite")
+    value: dict = {"matrix": np.arange(6.0).reshape(2, 3), "games": [{"a": 1}]}
+    main.SQLiteCache(path).set("key", value, 60)
+    read: dict = main.SQLiteCache(path).get("key")
+    assert np.array_equal(read["matrix"], value["matrix"])
+    assert read["games"] == value["games"]
+
+    # Hits of the shared tier are served to another worker, then in-process
+    writer = main.TieredCache(f"sqlite:///{path}")
+    writer.get_or_compute("tiered", lambda: [1, 2, 3])
+    reader = main.TieredCache(f"sqlite:///{path}")
+    served: list = reader.get_or_compute("tiered", lambda: pytest.fail("recomputed"))
+    assert served == [1, 2, 3]
+    reader.get("tiered")
+    assert (reader.stats["shared_hits"], reader.stats["local_hits"]) == (1, 1)
+
+
+# None means a miss: such results are recomputed, other falsy ones are cached
+def test_none_is_not_cached(main: ModuleType) -> None:
+    cache = main.TieredCache("")
+    calls: list[str] = list()
+
+    def compute(value: object) -> object:
+        calls.append(value)
+        return value
+
+    for _ in range(2):
+        assert cache.get_or_compute("none", lambda: compute(None)) is None
+        assert cache.get_or_compute("zero", lambda: compute(0)) == 0
+    assert calls == [None, 0, None]
+    assert cache.stats["misses"] == 3
+
+
+# An unavailable shared tier is logged and treated as a miss
+def test_shared_errors_are_misses(main: ModuleType, tmp_path, capsys) -> None:
+    cache = main.TieredCache(f"sqlite:///{tmp_path / 'cache.sqlite'}")
+    cache.shared.connection.close()
+    assert cache.get_or_compute("key", lambda: "value") == "value"
+    assert cache.get("key") == "value"
+    assert "Error: Shared cache unavailable" in capsys.readouterr().out
+
+
+# Unsupported cache URLs are rejected
+def test_unsupported_url(main: ModuleType) -> None:
+    with pytest.raises(ValueError):
+        main.TieredCache("memcached://localhost")
+
+
+# Cached functions are keyed by the data version
+def test_cached_keys_include_data_version(main: ModuleType, monkeypatch) -> None:
+    calls: list[int] = list()
+
+    @main.cached("tests")
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert square(3) == square(3) == 9
+    monkeypatch.setattr(main, "data_version", lambda: "other")
+    assert square(3) == 9
+    assert calls == [3, 3]
+    assert main.cache_key("tests", (3,)) == "deepshot:tests:other:[3]"
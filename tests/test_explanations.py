@@ -0,0 +1,57 @@
+# Importing libraries
+import numpy as np
+import pytest
+from types import ModuleType
+
+# Date whose slate is explained
+date: str = "2025-02-05"
+
+
+# Attributions and the bias add up to the model margin of each game
+def test_contributions_sum_to_margin(main: ModuleType) -> None:
+    main.explain_date(date)
+    probs: np.ndarray = main.matchup_matrix(date)
+    games: list[dict] = main.extract_games(date)
+    assert games
+    for game in games:
+        contrib: np.ndarray | None = main.cached_attributions(
+            (date, game["home_team"], game["away_team"])
+        )
+        assert contrib is not None
+        assert len(contrib) == len(main.model.feature_names_in_) + 1
+
+        # Margin of the away team win (class 1), from the home win probability
+        home_prob: float = float(
+            probs[
+                main.teams.index(game["home_team"]), main.teams.index(game["away_team"])
+            ]
+        )
+        margin: float = np.log((1 - home_prob) / home_prob)
+        assert float(contrib.sum()) == pytest.approx(margin, abs=1e-4)
+
+
+# Explained games are stored in the shared cache under the data version
+def test_attributions_are_cached(main: ModuleType) -> None:
+    game: tuple[str, str, str] = (date, main.teams[0], main.teams[1])
+    main.explain_games([game])
+    key: str = main.cache_key("attributions", game)
+    assert main.cache.get(key) is main.cached_attributions(game)
+    assert (
+        main.cached_attributions((date, main.teams[0], "Seattle SuperSonics")) is None
+    )
+
+
+# Drivers are the largest attributions, pointing to the team they favour
+def test_game_drivers(main: ModuleType) -> None:
+    game: dict = main.extract_games(date)[0]
+    home, away = game["home_team"], game["away_team"]
+    drivers: list[dict] = main.game_drivers(date, home, away, 5)
+    contrib: np.ndarray = main.cached_attributions((date, home, away))[:-1]
+    largest: np.ndarray = np.sort(np.abs(contrib))[::-1][:5]
+    assert [d["impact"] for d in drivers] == [round(float(v), 3) for v in largest]
+    for driver in drivers:
+        side: str = "home" if driver["team"] == home else "away"
+        value: float = contrib[
+            list(main.model.feature_names_in_).index(f"{side}_{driver['stat']}")
+        ]
+        assert driver["favours"] == (away if value > 0 else home)
@@ -0,0 +1,97 @@
+# Importing libraries
+import numpy as np
+import pandas as pd
+from types import ModuleType
+
+# Scored dates, and a date whose results are not known yet
+start: str = "2025-02-01"
+end: str = "2025-02-05"
+unplayed: str = "2026-11-01"
+
+
+# Predictions of the games of the scored dates, with probabilities in all buckets
+def served_predictions(main: ModuleType) -> pd.DataFrame:
+    results: pd.DataFrame = main.results_store.frame(main.season_key(start))
+    games: pd.DataFrame = results[results["date"].between(start, end)].copy()
+    games["home_prob"] = np.random.default_rng(0).integers(0, 101, len(games))
+    return games[["date", "home_team", "away_team", "home_prob"]]
+
+
+# Record the predictions of each date in a history
+def record(history, predictions: pd.DataFrame) -> None:
+    for date, games in predictions.groupby("date"):
+        history.record(date, games.to_dict("records"))
+
+
+# The aggregates are those of the predictions joined with the results
+def test_summary_matches_join(main: ModuleType, tmp_path) -> None:
+    history = main.PredictionHistory(str(tmp_path / "history.sqlite"))
+    predictions: pd.DataFrame = served_predictions(main)
+    record(history, predictions)
+    history.record(
+        unplayed,
+        [{"home_team": main.teams[0], "away_team": main.teams[1], "home_prob": 60}],
+    )
+
+    # Only the first served prediction of a game is kept
+    changed: pd.DataFrame = predictions.assign(home_prob=100 - predictions["home_prob"])
+    record(history, changed)
+    assert history.sync_outcomes() == len(predictions)
+    summary: dict[str, pd.DataFrame] = history.summary(main.model_version, start, end)
+
+    # Direct join of the predictions with the results
+    results: pd.DataFrame = main.results_store.frame(main.season_key(start))
+    scored: pd.DataFrame = predictions.merge(
+        results, on=["date", "home_team", "away_team"]
+    )
+    scored["p"] = scored["home_prob"] / 100
+    scored["home_win"] = 1 - scored["winning_team"]
+    scored["hit"] = ((scored["p"] >= 0.5) == scored["home_win"]).astype(int)
+    scored["error"] = (scored["p"] - scored["home_win"]) ** 2
+    scored["bucket"] = np.minimum((scored["p"] * 10).astype(int), 9)
+
+    # Daily scores
+    daily: pd.DataFrame = scored.groupby("date", as_index=False).agg(
+        games=("hit", "size"), hits=("hit", "sum"), brier=("error", "sum")
+    )
+    pd.testing.assert_frame_equal(
+        summary["daily"][daily.columns], daily, check_dtype=False
+    )
+
+    # Calibration per probability bucket
+    calibration: pd.DataFrame = scored.groupby("bucket", as_index=False).agg(
+        games=("p", "size"), predicted=("p", "mean"), observed=("home_win", "mean")
+    )
+    pd.testing.assert_frame_equal(
+        summary["calibration"], calibration, check_dtype=False
+    )
+
+    # Hit rate of the games of each team
+    teams: pd.DataFrame = (
+        pd.concat(
+            [
+                scored[["home_team", "hit"]].rename(columns={"home_team": "team"}),
+                scored[["away_team", "hit"]].rename(columns={"away_team": "team"}),
+            ]
+        )
+        .groupby("team", as_index=False)
+        .agg(games=("hit", "size"), hit_rate=("hit", "mean"))
+        .sort_values(["hit_rate", "team"], ascending=[False, True], ignore_index=True)
+    )
+    pd.testing.assert_frame_equal(summary["teams"], teams, check_dtype=False)
+
+
+# Recording and syncing again doesn't count the scored games twice
+def test_sync_is_idempotent(main: ModuleType, tmp_path) -> None:
+    history = main.PredictionHistory(str(tmp_path / "history.sqlite"))
+    predictions: pd.DataFrame = served_predictions(main)
+    record(history, predictions)
+    assert history.sync_outcomes() == len(predictions)
+    summary: dict[str, pd.DataFrame] = history.summary(main.model_version, start, end)
+    record(history, predictions)
+    assert history.sync_outcomes() == 0
+    repeated: dict[str, pd.DataFrame] = history.summary(main.model_version, start, end)
+    for name, frame in summary.items():
+        pd.testing.assert_frame_equal(repeated[name], frame)
+    assert summary["daily"]["games"].sum() == len(predictions)
+    assert history.models() == [main.model_version]
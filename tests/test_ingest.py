@@ -0,0 +1,174 @@
+# Importing libraries
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+import pandas as pd
+import pytest
+
+# Repository root, recorded slate and its dates
+root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+slate_directory: str = os.path.join(root, "data", "fixtures", "feed")
+slate_dates: list[str] = sorted(
+    name.removesuffix(".json")
+    for name in os.listdir(os.path.join(slate_directory, "schedule"))
+)
+
+
+# Find a free local port
+def free_port() -> int:
+    """
+    Return a port nothing listens on.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+# Copy the app into a working directory holding the data before the slate
+@pytest.fixture
+def workspace(tmp_path) -> str:
+    """
+    Copy the app, the model, the static files and the slate, with the schedule
+    and results before the slate and empty game logs and stats.
+    """
+    shutil.copy(os.path.join(root, "main.py"), tmp_path)
+    for directory in ("model", "static", os.path.join("data", "fixtures")):
+        shutil.copytree(
+            os.path.join(root, directory),
+            tmp_path / directory,
+            ignore=shutil.ignore_patterns("build"),
+        )
+
+    csv_directory: str = str(tmp_path / "data" / "csv")
+    os.makedirs(csv_directory)
+    for name in ("schedule.csv", "results.csv"):
+        table: pd.DataFrame = pd.read_csv(os.path.join(root, "data", "csv", name))
+        table[table["date"] < slate_dates[0]].to_csv(
+            os.path.join(csv_directory, name), index=False
+        )
+
+    # Game logs columns from the box scores, stats columns as in the pipeline
+    with open(
+        os.path.join(slate_directory, "schedule", f"{slate_dates[0]}.json")
+    ) as file:
+        game_id: str = json.load(file)["games"][0]["game_id"]
+    with open(os.path.join(slate_directory, "boxscore", f"{game_id}.json")) as file:
+        logs: list[str] = list(next(iter(json.load(file)["teams"].values())))
+    pd.DataFrame(columns=["date", "team"] + logs).to_csv(
+        os.path.join(csv_directory, "gamelogs.csv"), index=False
+    )
+    pd.DataFrame(
+        columns=["date", "team"] + logs + ["ast_tov", "ast_ratio", "elo"]
+    ).to_csv(os.path.join(csv_directory, "averages.csv"), index=False)
+    return str(tmp_path)
+
+
+# Replay the slate through the mock feed and check the stored rows
+def test_ingest_replays_slate(workspace: str) -> None:
+    port: int = free_port()
+    mock: subprocess.Popen = subprocess.Popen(
+        [sys.executable, "main.py", "mock-feed", "--port", str(port)],
+        cwd=workspace,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline: float = time.monotonic() + 120
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                assert mock.poll() is None and time.monotonic() < deadline
+                time.sleep(0.5)
+
+        # One date at a time: the slate has no fixtures for the dates in between
+        for date in slate_dates:
+            ingestion: subprocess.CompletedProcess = subprocess.run(
+                [
+                    sys.executable,
+                    "main.py",
+                    "ingest",
+                    "--start",
+                    date,
+                    "--end",
+                    date,
+                    "--url",
+                    f"http://127.0.0.1:{port}",
+                ],
+                cwd=workspace,
+                capture_output=True,
+                text=True,
+                timeout=300,
+            )
+            assert ingestion.returncode == 0, ingestion.stderr
+            assert "Error" not in ingestion.stdout
+    finally:
+        mock.terminate()
+        mock.wait()
+
+    # Expected rows, from the slate
+    games: list[dict] = list()
+    for date in slate_dates:
+        with open(os.path.join(slate_directory, "schedule", f"{date}.json")) as file:
+            for game in json.load(file)["games"]:
+                with open(
+                    os.path.join(slate_directory, "boxscore", f"{game['game_id']}.json")
+                ) as box:
+                    games.append(json.load(box))
+
+    def stored(name: str) -> pd.DataFrame:
+        table: pd.DataFrame = pd.read_csv(os.path.join(workspace, "data", "csv", name))
+        return table[table["date"] >= slate_dates[0]]
+
+    schedule: pd.DataFrame = stored("schedule.csv")
+    assert list(
+        zip(schedule["date"], schedule["home_team"], schedule["away_team"])
+    ) == [(game["date"], game["home_team"], game["away_team"]) for game in games]
+
+    results: pd.DataFrame = stored("results.csv")
+    expected: set[tuple] = {
+        (
+            game["date"],
+            game["home_team"],
+            game["away_team"],
+            int(
+                game["teams"][game["home_team"]]["pts"]
+                < game["teams"][game["away_team"]]["pts"]
+            ),
+        )
+        for game in games
+    }
+    assert set(results.itertuples(index=False, name=None)) == expected
+
+    gamelogs: pd.DataFrame = stored("gamelogs.csv").set_index(["date", "team"])
+    averages: pd.DataFrame = stored("averages.csv").set_index(["date", "team"])
+    teams: list[tuple[str, str]] = [
+        (game["date"], team) for game in games for team in game["teams"]
+    ]
+    assert sorted(gamelogs.index) == sorted(teams)
+    assert sorted(averages.index) == sorted(teams)
+    for game in games:
+        for team, stats in game["teams"].items():
+            assert gamelogs.loc[(game["date"], team), "pts"] == stats["pts"]
+
+    # First games are rated 1500, later games follow their previous result
+    first: pd.Series = averages.loc[slate_dates[0], "elo"]
+    assert (first == 1500).all()
+    for date, team in teams:
+        if date != slate_dates[0] and (slate_dates[0], team) in averages.index:
+            previous: dict = next(
+                game
+                for game in games
+                if game["date"] == slate_dates[0] and team in game["teams"]
+            )
+            opponent: str = next(t for t in previous["teams"] if t != team)
+            won: bool = (
+                previous["teams"][team]["pts"] > previous["teams"][opponent]["pts"]
+            )
+            assert (averages.loc[(date, team), "elo"] > 1500) == won
+            assert averages.loc[(date, team), "pts"] == previous["teams"][team]["pts"]
@@ -0,0 +1,48 @@
+# Importing libraries
+import numpy as np
+import pytest
+from types import ModuleType
+
+# Dates with scheduled games, in the middle and at the start of seasons
+dates: list[str] = ["2024-11-15", "2025-03-02", "2025-10-23"]
+
+
+# The matrix holds the predictions of the scheduled games
+@pytest.mark.parametrize("date", dates)
+def test_matrix_matches_predictions(main: ModuleType, date: str) -> None:
+    games: list[dict] = main.predict_games(date)
+    assert games
+    probs: np.ndarray = main.matchup_matrix(date)
+    assert probs.shape == (len(main.teams), len(main.teams))
+    assert np.isnan(np.diag(probs)).all()
+    for game in games:
+        home: int = main.teams.index(game["home_team"])
+        away: int = main.teams.index(game["away_team"])
+        assert round(float(probs[home, away]) * 100) == game["home_prob"]
+
+
+# A scheduled pairing opened from the matrix is the scheduled game
+@pytest.mark.parametrize("date", dates)
+def test_hypothetical_game_matches_predictions(main: ModuleType, date: str) -> None:
+    for game in main.predict_games(date):
+        assert main.hypothetical_game(game["home_team"], game["away_team"], date) == (
+            game
+        )
+
+
+# Unknown teams and a team against itself are rejected
+def test_hypothetical_game_rejects_invalid_matchups(main: ModuleType) -> None:
+    team: str = main.teams[0]
+    with pytest.raises(ValueError):
+        main.hypothetical_game(team, team, dates[0])
+    with pytest.raises(ValueError):
+        main.hypothetical_game(team, "Seattle SuperSonics", dates[0])
+
+
+# Only real calendar dates in `YYYY-MM-DD` format are accepted
+@pytest.mark.parametrize(
+    "date, valid",
+    [("2025-02-01", True), ("2025-13-01", False), ("2025-2-1", False), ("foo", False)],
+)
+def test_is_valid_date(main: ModuleType, date: str, valid: bool) -> None:
+    assert main.is_valid_date(date) is valid
@@ -0,0 +1,53 @@
+# Importing libraries
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from types import ModuleType
+
+# Dates early in a season (with games of the previous one) and in its middle
+dates: list[str] = ["2024-11-01", "2025-03-02"]
+stat: str = "ortg"
+
+
+# Values of a stat for a team before a date, oldest first, and their dates
+def team_history(main: ModuleType, team: str, date: str) -> pd.DataFrame:
+    stats: pd.DataFrame = pd.read_csv(main.stats_store.source)
+    return stats[(stats["team"] == team) & (stats["date"] < date)][["date", stat]]
+
+
+# Rolling and exponential averages match the pandas ones over the whole history
+@pytest.mark.parametrize("date", dates)
+@pytest.mark.parametrize("window", [3, 5, 10])
+def test_smoothing_kernels(main: ModuleType, date: str, window: int) -> None:
+    team: str = main.teams[0]
+    overlays: dict = main.h2h_overlays(team, stat, window, date)
+    series: pd.Series = team_history(main, team, date)[stat]
+    rolling: np.ndarray = series.rolling(window, min_periods=1).mean().to_numpy()
+    ewm: np.ndarray = series.ewm(span=window, ignore_na=True).mean().to_numpy()
+
+    # Most recent first, for the games shown on the plot (the exponential
+    # average only starts 4 spans before them)
+    shown: int = min(len(series), main.h2h_max_window)
+    assert len(overlays["rolling"]) == len(overlays["ewm"]) == shown
+    np.testing.assert_allclose(overlays["rolling"], rolling[::-1][:shown], atol=1e-3)
+    np.testing.assert_allclose(overlays["ewm"], ewm[::-1][:shown], atol=5e-3)
+
+
+# League overlays summarize the stats of every team at the end of each game date
+@pytest.mark.parametrize("date", dates)
+def test_league_summary(main: ModuleType, date: str) -> None:
+    team: str = main.teams[0]
+    overlays: dict = main.h2h_overlays(team, stat, 5, date)
+    games: list[str] = team_history(main, team, date)["date"].tolist()[::-1]
+    assert len(overlays["mean"]) == min(len(games), main.h2h_max_window)
+    for game, mean, band in zip(games, overlays["mean"], overlays["band"]):
+        day_after: str = (
+            datetime.date.fromisoformat(game) + datetime.timedelta(days=1)
+        ).isoformat()
+        stat_labels, matrix = main.team_stats_matrix(main.teams, day_after)
+        values: np.ndarray = matrix[:, stat_labels.index(stat)]
+        assert mean == pytest.approx(np.nanmean(values), abs=1e-3)
+        assert band == pytest.approx(
+            np.nanpercentile(values, main.h2h_band_percentiles).tolist(), abs=1e-3
+        )
@@ -0,0 +1,110 @@
+# Importing libraries
+import os
+import shutil
+import pandas as pd
+import pytest
+from types import ModuleType
+
+
+# Store of a copy of the workspace results, partitioned in a temporary directory
+@pytest.fixture
+def store(main: ModuleType, tmp_path, monkeypatch) -> object:
+    monkeypatch.setattr(main, "partitions_directory", str(tmp_path / "partitions"))
+    source: str = str(tmp_path / "results.csv")
+    shutil.copy(os.path.join("data", "csv", "results.csv"), source)
+    return main.SeasonStore(source, "results")
+
+
+# The seasons put back together are the monolithic CSV
+def test_round_trip(main: ModuleType, store) -> None:
+    table: pd.DataFrame = pd.read_csv(store.source)
+    seasons: list[int] = store.seasons()
+    assert seasons == sorted(set(main.season_keys(table["date"]).tolist()))
+    stored: pd.DataFrame = pd.concat(
+        [store.frame(season) for season in seasons], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(stored, table)
+
+    # The manifest describes every season
+    manifest: dict = store.manifest()
+    assert manifest["header"] == list(table.columns)
+    for season in seasons:
+        rows: pd.DataFrame = table[main.season_keys(table["date"]) == season]
+        entry: dict = manifest["seasons"][str(season)]
+        assert entry["rows"] == len(rows)
+        assert (entry["first"], entry["last"]) == (
+            rows["date"].min(),
+            rows["date"].max(),
+        )
+
+
+# Loaded partitions are evicted, least recently used first, over the budget
+def test_budget_eviction(main: ModuleType) -> None:
+    partitions: list = [
+        main.SeasonPartition(
+            pd.DataFrame({"date": ["2024-11-01"] * 100, "team": ["A"] * 100, "x": i})
+        )
+        for i in range(3)
+    ]
+    cache = main.PartitionCache(budget=int(partitions[0].nbytes * 2.5))
+    for i in (0, 1, 0, 2):
+        assert cache.get(i, lambda: partitions[i]) is partitions[i]
+    assert list(cache.entries) == [0, 2]
+    assert cache.size == partitions[0].nbytes + partitions[2].nbytes <= cache.budget
+    assert dict(cache.stats) == {"loads": 3, "hits": 1, "evictions": 1}
+
+    # The partition in use is kept even when it alone exceeds the budget
+    cache.budget = 1
+    assert cache.get(3, lambda: partitions[1]) is partitions[1]
+    assert list(cache.entries) == [3]
+
+
+# Appended rows update the source, their seasons and the manifest in place
+def test_append_frame(main: ModuleType, store) -> None:
+    manifest: dict = store.manifest()
+    before: dict = {
+        season: dict(entry) for season, entry in manifest["seasons"].items()
+    }
+    last: int = store.seasons()[-1]
+    loaded: int = len(store.frame(last))
+
+    # One row in the last season, two in a new one
+    rows: pd.DataFrame = pd.DataFrame(
+        [
+            [f"{last + 1}-01-10", "Boston Celtics", "New York Knicks", 0],
+            [f"{last + 1}-11-02", "Boston Celtics", "Miami Heat", 1],
+            [f"{last + 2}-01-05", "Miami Heat", "New York Knicks", 0],
+        ],
+        columns=manifest["header"],
+    )
+    store.append_frame(rows)
+
+    # Only the touched seasons change, and the source is not split again
+    after: dict = store.manifest()
+    assert after["built"] == manifest["built"]
+    assert after["source"] == main.file_signature(store.source)
+    assert after["seasons"][str(last)] == dict(
+        before[str(last)],
+        rows=before[str(last)]["rows"] + 1,
+        version=before[str(last)].get("version", 0) + 1,
+    )
+    assert after["seasons"][str(last + 1)] == {
+        "rows": 2,
+        "first": f"{last + 1}-11-02",
+        "last": f"{last + 2}-01-05",
+        "version": 1,
+    }
+    for season, entry in before.items():
+        if int(season) < last:
+            assert after["seasons"][season] == entry
+
+    # The source and the reloaded seasons hold the new rows
+    table: pd.DataFrame = pd.read_csv(store.source)
+    pd.testing.assert_frame_equal(table.tail(3).reset_index(drop=True), rows)
+    assert len(store.frame(last)) == loaded + 1
+    pd.testing.assert_frame_equal(
+        store.frame(last).tail(1).reset_index(drop=True), rows.head(1)
+    )
+    pd.testing.assert_frame_equal(
+        store.frame(last + 1), rows.tail(2).reset_index(drop=True)
+    )
@@ -0,0 +1,49 @@
+# Importing libraries
+import numpy as np
+import pandas as pd
+import pytest
+from types import ModuleType
+
+# Dates at the start, in the middle (with and without games) and after a season
+dates: list[str] = [
+    "2024-10-22",
+    "2024-12-24",
+    "2025-01-15",
+    "2025-03-02",
+    "2025-06-01",
+]
+
+
+# Slices of the season matrix are the as-of stats of every team
+@pytest.mark.parametrize("date", dates)
+def test_slice_matches_stats(main: ModuleType, date: str) -> None:
+    matrix: dict[str, np.ndarray] = main.season_matrix(
+        main.season_key(date), main.ranking_stats
+    )
+    stat_labels, stats = main.team_stats_matrix(main.teams, date)
+    positions: list[int] = [stat_labels.index(stat) for stat in main.ranking_stats]
+    np.testing.assert_array_equal(
+        matrix["values"][np.searchsorted(matrix["dates"], date)], stats[:, positions]
+    )
+
+
+# Teams are ranked by the metric, best first, with their change over a week
+@pytest.mark.parametrize("metric", ["elo", "net"])
+def test_power_rankings(main: ModuleType, metric: str) -> None:
+    date: str = dates[3]
+    rankings: pd.DataFrame = main.power_rankings(date, metric)
+    assert len(rankings) == len(main.teams)
+    assert rankings[metric].is_monotonic_decreasing
+    assert rankings["rank"].tolist() == list(range(1, len(main.teams) + 1))
+    assert np.allclose(rankings["net"], rankings["ortg"] - rankings["drtg"], atol=0.01)
+
+    # Change of rank since the stats of a week before
+    stat_labels, stats = main.team_stats_matrix(main.teams, "2025-02-23")
+    week: pd.DataFrame = pd.DataFrame(stats, columns=stat_labels).assign(
+        team=main.teams, net=lambda frame: frame["ortg"] - frame["drtg"]
+    )
+    previous: pd.Series = week.set_index("team")[metric].rank(
+        ascending=False, method="min"
+    )
+    change: pd.Series = previous[rankings["team"]].to_numpy() - rankings["rank"]
+    assert (rankings["change"] == change.astype("Int64")).all()
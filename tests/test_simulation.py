@@ -0,0 +1,157 @@
+# Importing libraries
+import numpy as np
+import pandas as pd
+import pytest
+from types import ModuleType
+
+# Number of simulated seasons of the chunk tests
+n_sims: int = 200
+
+
+# Indices of the members of each conference, as built by `simulate_season`
+def conference_indices(main: ModuleType) -> dict[str, np.ndarray]:
+    return {
+        conference: np.array(
+            [
+                i
+                for i, team in enumerate(main.teams)
+                if main.team_conferences[team] == conference
+            ]
+        )
+        for conference in ("East", "West")
+    }
+
+
+# Two certain games per team: a home win, then a win on the road
+def certain_games(n_teams: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    teams: np.ndarray = np.arange(n_teams)
+    home_idx: np.ndarray = np.concatenate([teams, teams])
+    away_idx: np.ndarray = np.concatenate(
+        [(teams + 1) % n_teams, (teams + 2) % n_teams]
+    )
+    home_prob: np.ndarray = np.concatenate([np.ones(n_teams), np.zeros(n_teams)])
+    return home_prob.astype(np.float32), home_idx, away_idx
+
+
+# Final win totals add the simulated games to the recorded wins
+def test_win_totals(main: ModuleType) -> None:
+    n_teams: int = len(main.teams)
+    base_wins: np.ndarray = np.arange(n_teams, dtype=np.float32)
+    chunk: dict[str, np.ndarray] = main.simulate_chunk(
+        *certain_games(n_teams),
+        base_wins,
+        np.full((n_teams, n_teams), 0.5),
+        conference_indices(main),
+        n_sims,
+        0,
+    )
+    expected: np.ndarray = np.zeros((n_teams, 83), dtype=np.int64)
+    expected[np.arange(n_teams), base_wins.astype(int) + 2] = n_sims
+    assert np.array_equal(chunk["wins_hist"], expected)
+
+
+# Conference seeds follow the win totals
+def test_seeding(main: ModuleType) -> None:
+    n_teams: int = len(main.teams)
+    base_wins: np.ndarray = (
+        np.random.default_rng(1).permutation(n_teams).astype(np.float32)
+    )
+    conferences: dict[str, np.ndarray] = conference_indices(main)
+    chunk: dict[str, np.ndarray] = main.simulate_chunk(
+        *certain_games(n_teams),
+        base_wins,
+        np.full((n_teams, n_teams), 0.5),
+        conferences,
+        n_sims,
+        0,
+    )
+    for members in conferences.values():
+        ranked: np.ndarray = members[np.argsort(-base_wins[members])]
+        for seed, team in enumerate(ranked, 1):
+            assert chunk["seed_hist"][team, seed] == n_sims
+            if seed <= 6:
+                assert chunk["playoffs"][team] == n_sims
+            elif seed > 10:
+                assert chunk["playoffs"][team] == 0
+
+
+# Play-in: 7 vs 8 for the 7th seed, then its loser vs the 9 vs 10 winner
+@pytest.mark.parametrize(
+    "home_wins, qualified", [(1.0, {7, 8}), (0.0, {8, 10})], ids=["home", "away"]
+)
+def test_play_in(main: ModuleType, home_wins: float, qualified: set[int]) -> None:
+    n_teams: int = len(main.teams)
+    base_wins: np.ndarray = np.arange(n_teams, dtype=np.float32)
+    conferences: dict[str, np.ndarray] = conference_indices(main)
+    chunk: dict[str, np.ndarray] = main.simulate_chunk(
+        np.empty(0, dtype=np.float32),
+        np.empty(0, dtype=np.int64),
+        np.empty(0, dtype=np.int64),
+        base_wins,
+        np.full((n_teams, n_teams), home_wins),
+        conferences,
+        n_sims,
+        0,
+    )
+    for members in conferences.values():
+        ranked: np.ndarray = members[np.argsort(-base_wins[members])]
+        for seed, team in enumerate(ranked, 1):
+            made: bool = seed <= 6 or seed in qualified
+            assert chunk["playoffs"][team] == (n_sims if made else 0)
+
+
+# Random seasons keep the totals of every histogram consistent
+def test_histogram_totals(main: ModuleType) -> None:
+    n_teams: int = len(main.teams)
+    rng: np.random.Generator = np.random.default_rng(2)
+    home_idx: np.ndarray = rng.integers(0, n_teams, 600)
+    away_idx: np.ndarray = (home_idx + rng.integers(1, n_teams, 600)) % n_teams
+    home_prob: np.ndarray = rng.random(600).astype(np.float32)
+    conferences: dict[str, np.ndarray] = conference_indices(main)
+    chunk: dict[str, np.ndarray] = main.simulate_chunk(
+        home_prob,
+        home_idx,
+        away_idx,
+        np.zeros(n_teams, dtype=np.float32),
+        rng.random((n_teams, n_teams)),
+        conferences,
+        n_sims,
+        0,
+    )
+    assert (chunk["wins_hist"].sum(axis=1) == n_sims).all()
+    assert (chunk["seed_hist"].sum(axis=1) == n_sims).all()
+    assert chunk["wins_hist"].sum() == n_sims * n_teams
+    wins: np.ndarray = (chunk["wins_hist"] * np.arange(83)).sum() / n_sims
+    assert wins == len(home_prob)
+    for members in conferences.values():
+        assert chunk["playoffs"][members].sum() == 8 * n_sims
+
+    # Expected win totals, within a generous sampling margin
+    expected: np.ndarray = np.bincount(
+        home_idx, weights=home_prob, minlength=n_teams
+    ) + np.bincount(away_idx, weights=1 - home_prob, minlength=n_teams)
+    mean: np.ndarray = (chunk["wins_hist"] * np.arange(83)).sum(axis=1) / n_sims
+    assert np.abs(mean - expected).max() < 1.5
+
+
+# The season projection starts from the recorded results
+def test_simulate_season_records(main: ModuleType) -> None:
+    date: str = "2025-01-15"
+    projection: pd.DataFrame = main.simulate_season(date, 2000, 1).set_index("team")
+    results: pd.DataFrame = main.results_store.frame(main.season_key(date))
+    results = results[results["date"] < date]
+    winners: pd.Series = results["home_team"].where(
+        results["winning_team"] == 0, results["away_team"]
+    )
+    for team in main.teams:
+        wins: int = int((winners == team).sum())
+        played: int = int(
+            ((results["home_team"] == team) | (results["away_team"] == team)).sum()
+        )
+        assert projection.loc[team, "record"] == f"{wins}-{played - wins}"
+        assert (
+            wins <= projection.loc[team, "wins_p10"] <= projection.loc[team, "wins_p90"]
+        )
+    for _, conference in projection.groupby("conference"):
+        assert conference["playoffs"].sum() == pytest.approx(800, abs=1)
+        assert conference["first_seed"].sum() == pytest.approx(100, abs=1)
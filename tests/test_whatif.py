@@ -0,0 +1,47 @@
+# Importing libraries
+import numpy as np
+import pandas as pd
+import pytest
+from types import ModuleType
+
+# Date of the analysed game
+date: str = "2025-02-05"
+
+
+# Game whose prediction is analysed
+def first_game(main: ModuleType) -> tuple[str, str]:
+    game: dict = main.extract_games(date)[0]
+    return game["home_team"], game["away_team"]
+
+
+# Unshifted stats give back the base prediction
+def test_zero_shift_is_base_prediction(main: ModuleType) -> None:
+    home, away = first_game(main)
+    curves: dict = main.sensitivity_curves(date, home, away)
+    zero: int = curves["shifts"].index(0)
+    base: float = (
+        float(main.matchup_matrix(date)[main.teams.index(home), main.teams.index(away)])
+        * 100
+    )
+    assert list(curves["curves"]) == main.stats_tags
+    for stat in main.stats_tags:
+        for side in ("home", "away"):
+            curve: list[float] = curves["curves"][stat][side]
+            assert len(curve) == len(curves["shifts"])
+            assert curve[zero] == pytest.approx(base, abs=0.01)
+
+
+# Each point scales a single feature of the game
+def test_shifted_point_matches_model(main: ModuleType) -> None:
+    home, away = first_game(main)
+    curves: dict = main.sensitivity_curves(date, home, away)
+    stat_labels, matrix = main.team_stats_matrix([home, away], date)
+    features: pd.DataFrame = main.matchup_features(
+        stat_labels, matrix, np.array([0]), np.array([1])
+    )
+    stat: str = main.stats_tags[0]
+    for side in ("home", "away"):
+        shifted: pd.DataFrame = features.copy()
+        shifted[f"{side}_{stat}"] *= 1 + curves["shifts"][-1] / 100
+        prob: float = float(main.model.predict_proba(shifted)[0, 0]) * 100
+        assert curves["curves"][stat][side][-1] == pytest.approx(prob, abs=0.01)